@@ -1,7 +1,10 @@
 """Mirascope package."""
 
+import importlib
 import importlib.metadata
 from contextlib import suppress
+from types import ModuleType
+from typing import TYPE_CHECKING
 
 with suppress(ImportError):
     from . import core as core
@@ -27,11 +30,29 @@ from .core import (
     prompt_template,
 )
 
-with suppress(ImportError):
-    from . import integrations as integrations
+if TYPE_CHECKING:
+    from . import integrations, retries
+
+# These pull in optional third-party SDKs, so they are only loaded on first access
+_LAZY_MODULES = frozenset({"integrations", "retries"})
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name in _LAZY_MODULES:
+        try:
+            module = importlib.import_module(f".{name}", __name__)
+        except ImportError as e:
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from e
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_MODULES})
 
-with suppress(ImportError):
-    from . import retries as retries
 
 __version__ = importlib.metadata.version("mirascope")
 
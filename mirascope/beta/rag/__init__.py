@@ -8,7 +8,13 @@ from .base import (
     BaseQueryResults,
     BaseVectorStore,
     BaseVectorStoreParams,
+    CachedEmbedder,
+    CachedEmbeddingResponse,
     Document,
+    EmbeddingCache,
+    IndexManifest,
+    TextChunker,
+    TokenChunker,
 )
 
 __all__ = [
@@ -19,6 +25,11 @@ __all__ = [
     "BaseQueryResults",
     "BaseVectorStore",
     "BaseVectorStoreParams",
+    "CachedEmbedder",
+    "CachedEmbeddingResponse",
     "Document",
+    "EmbeddingCache",
+    "IndexManifest",
     "TextChunker",
+    "TokenChunker",
 ]
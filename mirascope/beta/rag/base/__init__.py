@@ -1,10 +1,12 @@
 """A module for interacting with Mirascope RAG."""
 
-from .chunkers import BaseChunker, TextChunker
+from .chunkers import BaseChunker, TextChunker, TokenChunker
 from .document import Document
-from .embedders import BaseEmbedder
+from .embedders import BaseEmbedder, CachedEmbedder
+from .embedding_cache import EmbeddingCache
 from .embedding_params import BaseEmbeddingParams
-from .embedding_response import BaseEmbeddingResponse
+from .embedding_response import BaseEmbeddingResponse, CachedEmbeddingResponse
+from .index_manifest import IndexManifest
 from .query_results import BaseQueryResults
 from .vectorstore_params import BaseVectorStoreParams
 from .vectorstores import BaseVectorStore
@@ -17,6 +19,11 @@ __all__ = [
     "BaseQueryResults",
     "BaseVectorStore",
     "BaseVectorStoreParams",
+    "CachedEmbedder",
+    "CachedEmbeddingResponse",
     "Document",
+    "EmbeddingCache",
+    "IndexManifest",
     "TextChunker",
+    "TokenChunker",
 ]
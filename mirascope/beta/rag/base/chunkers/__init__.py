@@ -1,2 +1,3 @@
 from .base_chunker import BaseChunker
 from .text_chunker import TextChunker
+from .token_chunker import TokenChunker
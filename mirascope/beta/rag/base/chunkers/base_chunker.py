@@ -1,11 +1,26 @@
 """Chunkers for the RAG module."""
 
+import codecs
+import mmap
+import os
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from typing import IO
 
 from pydantic import BaseModel
 
 from ..document import Document
 
+_READ_SIZE = 1 << 20
+
+
+def _read_blocks(file: IO[str] | IO[bytes] | mmap.mmap) -> Iterator[str]:
+    """Reads `file` in blocks, decoding binary files (and `mmap`s) as UTF-8."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    while block := file.read(_READ_SIZE):
+        yield block if isinstance(block, str) else decoder.decode(block)
+    yield decoder.decode(b"", final=True)
+
 
 class BaseChunker(BaseModel, ABC):
     """Base class for chunkers.
@@ -35,3 +50,27 @@ class BaseChunker(BaseModel, ABC):
     def chunk(self, text: str) -> list[Document]:
         """Returns a Document that contains an id, text, and optionally metadata."""
         ...
+
+    def chunk_stream(self, texts: Iterable[str]) -> Iterator[Document]:
+        """Lazily chunks a text that arrives in pieces (e.g. blocks read from a file).
+
+        The default implementation chunks each piece independently. Chunkers that can
+        carry state across piece boundaries should override this.
+        """
+        for text in texts:
+            yield from self.chunk(text)
+
+    def chunk_file(
+        self, file: str | os.PathLike[str] | IO[str] | IO[bytes] | mmap.mmap
+    ) -> Iterator[Document]:
+        """Lazily chunks a UTF-8 text file without loading it whole.
+
+        Args:
+            file: The path of the file, or an open text or binary file or `mmap` that
+                is read from its current position.
+        """
+        if isinstance(file, str | os.PathLike):
+            with open(file, encoding="utf-8") as opened:
+                yield from self.chunk_stream(_read_blocks(opened))
+        else:
+            yield from self.chunk_stream(_read_blocks(file))
@@ -1,6 +1,7 @@
 """Text chunker for the RAG module"""
 
 import uuid
+from collections.abc import Iterable, Iterator
 
 from ..document import Document
 from .base_chunker import BaseChunker
@@ -31,3 +32,21 @@ class TextChunker(BaseChunker):
             chunks.append(Document(text=text[start:end], id=str(uuid.uuid4())))
             start += self.chunk_size - self.chunk_overlap
         return chunks
+
+    def chunk_stream(self, texts: Iterable[str]) -> Iterator[Document]:
+        """Lazily chunks a text that arrives in pieces.
+
+        Produces the same chunks as `chunk("".join(texts))` while only holding the
+        current piece and the unfinished chunk in memory.
+        """
+        buffer, start = "", 0
+        for text in texts:
+            buffer += text
+            while start + self.chunk_size <= len(buffer):
+                yield Document(
+                    text=buffer[start : start + self.chunk_size], id=str(uuid.uuid4())
+                )
+                start += self.chunk_size - self.chunk_overlap
+            consumed = min(start, len(buffer))
+            buffer, start = buffer[consumed:], start - consumed
+        yield from self.chunk(buffer[start:])
@@ -0,0 +1,246 @@
+"""Token-aware chunker for the RAG module"""
+
+import hashlib
+import mmap
+import os
+import re
+from collections.abc import Callable, Iterable, Iterator
+from typing import IO
+
+from ..document import Document
+from ..index_manifest import chunk_id
+from .base_chunker import BaseChunker, _read_blocks
+
+_HEADING = re.compile(r"#{1,6}[ \t]")
+_SENTENCE_END = re.compile(r"[.!?]+[\"')\]]*\s+")
+_WORD = re.compile(r"\S+\s*")
+_PARAGRAPH_BREAK = re.compile(r"\n[ \t]*\n")
+# Long runs of word characters (e.g. identifiers or base64) span several tokens
+_MAX_TOKEN_CHARS = 8
+_TOKEN = re.compile(rf"\w{{1,{_MAX_TOKEN_CHARS}}}|[^\w\s]")
+# A streamed text is held back until a paragraph break unless it grows beyond this
+_MAX_PENDING_CHARS = 1 << 16
+
+
+def count_tokens(text: str) -> int:
+    """Estimates the number of tokens of `text` as its number of words and symbols.
+
+    Words longer than 8 characters count as one token per 8 characters.
+    """
+    return len(_TOKEN.findall(text))
+
+
+def _sentences(paragraph: str) -> Iterator[tuple[str, bool]]:
+    start = 0
+    for match in _SENTENCE_END.finditer(paragraph):
+        yield paragraph[start : match.end()], False
+        start = match.end()
+    if start < len(paragraph):
+        yield paragraph[start:], False
+
+
+def _units(text: str) -> Iterator[tuple[str, bool]]:
+    """Yields the sentences and heading lines of `text` and whether each is a heading.
+
+    The units keep their trailing whitespace, so they concatenate back into `text`.
+    """
+    paragraph: list[str] = []
+    for line in text.splitlines(keepends=True):
+        if _HEADING.match(line):
+            yield from _sentences("".join(paragraph))
+            paragraph = []
+            yield line, True
+            continue
+        paragraph.append(line)
+        if not line.strip():
+            yield from _sentences("".join(paragraph))
+            paragraph = []
+    yield from _sentences("".join(paragraph))
+
+
+def _split_pending(buffer: str) -> int:
+    """Returns how much of a streamed `buffer` can be chunked without more text."""
+    if (match := _last_match(_PARAGRAPH_BREAK, buffer)) is not None:
+        return match.end()
+    if len(buffer) < _MAX_PENDING_CHARS:
+        return 0
+    if (match := _last_match(_SENTENCE_END, buffer)) is not None:
+        return match.end()
+    return max(buffer.rfind(" "), buffer.rfind("\n")) + 1 or len(buffer)
+
+
+def _last_match(pattern: re.Pattern[str], text: str) -> re.Match[str] | None:
+    matches = list(pattern.finditer(text))
+    return matches[-1] if matches else None
+
+
+class TokenChunker(BaseChunker):
+    """A chunker that packs sentences into chunks of at most `max_tokens` tokens.
+
+    Chunks end at sentence boundaries and each markdown heading starts a new chunk.
+    Sentences longer than `max_tokens` are split between words, and words longer than
+    `max_tokens` (e.g. URLs or base64 blobs) between characters. The id of each chunk
+    is derived from its `source` and the hash of its text (see `chunk_id`), so
+    chunking the same text again produces the same ids and adding it to a vectorstore
+    again replaces instead of duplicating, while identical chunks of different sources
+    (e.g. a license header) get different ids. Files are chunked with their path as the
+    `source` and texts without a `source` with the hash of the whole text.
+
+    Tokens are counted with `tokenizer`, which by default estimates them as words and
+    symbols. Pass a local tokenizer for exact budgets, e.g. with `tiktoken`:
+
+    ```python
+    import tiktoken
+
+    from mirascope.beta.rag import TokenChunker
+
+    encoding = tiktoken.get_encoding("cl100k_base")
+    chunker = TokenChunker(
+        max_tokens=512,
+        overlap_tokens=64,
+        tokenizer=lambda text: len(encoding.encode(text)),
+    )
+    with open("book.md", "rb") as file:
+        for document in chunker.chunk_file(file):
+            print(document.id, document.text)
+    ```
+    """
+
+    max_tokens: int = 512
+    overlap_tokens: int = 0
+    tokenizer: Callable[[str], int] = count_tokens
+
+    def chunk(self, text: str, source: str | None = None) -> list[Document]:
+        """Chunks `text`, deriving the chunk ids from `source`.
+
+        Args:
+            text: The text to chunk.
+            source: The source of the text, e.g. its path. Defaults to the hash of
+                `text`.
+        """
+        if source is None:
+            source = hashlib.sha256(text.encode()).hexdigest()
+        return list(self._pack(_units(text), source))
+
+    def chunk_stream(
+        self, texts: Iterable[str], source: str | None = None
+    ) -> Iterator[Document]:
+        """Lazily chunks a text that arrives in pieces.
+
+        Produces the same chunks as `chunk("".join(texts), source)` (as long as
+        paragraphs are shorter than 64K characters) while only holding the current
+        paragraph and the unfinished chunk in memory. Since the whole text isn't known
+        upfront, chunks without a `source` only derive their ids from their own text,
+        so pass a `source` to keep identical chunks of different texts apart.
+        """
+        return self._pack(self._stream_units(texts), source or "")
+
+    def chunk_file(
+        self,
+        file: str | os.PathLike[str] | IO[str] | IO[bytes] | mmap.mmap,
+        source: str | None = None,
+    ) -> Iterator[Document]:
+        """Lazily chunks a UTF-8 text file without loading it whole.
+
+        Args:
+            file: The path of the file, or an open text or binary file or `mmap` that
+                is read from its current position.
+            source: The source of the file. Defaults to its path, if known.
+        """
+        if isinstance(file, str | os.PathLike):
+            with open(file, encoding="utf-8") as opened:
+                yield from self.chunk_stream(
+                    _read_blocks(opened), source or os.fspath(file)
+                )
+            return
+        if source is None and isinstance(name := getattr(file, "name", None), str):
+            source = name
+        yield from self.chunk_stream(_read_blocks(file), source)
+
+    ############################## PRIVATE METHODS ###################################
+
+    @staticmethod
+    def _stream_units(texts: Iterable[str]) -> Iterator[tuple[str, bool]]:
+        buffer = ""
+        for text in texts:
+            buffer += text
+            if split := _split_pending(buffer):
+                yield from _units(buffer[:split])
+                buffer = buffer[split:]
+        yield from _units(buffer)
+
+    def _pack(
+        self, units: Iterable[tuple[str, bool]], source: str
+    ) -> Iterator[Document]:
+        chunk: list[tuple[str, int]] = []
+        tokens = 0
+        for unit, is_heading in units:
+            if not unit.strip():
+                if chunk:
+                    chunk.append((unit, 0))
+                continue
+            unit_tokens = self.tokenizer(unit)
+            if chunk and (is_heading or tokens + unit_tokens > self.max_tokens):
+                yield self._document(chunk, source)
+                chunk = [] if is_heading else self._overlap(chunk, unit_tokens)
+                tokens = sum(count for _, count in chunk)
+            if unit_tokens <= self.max_tokens:
+                chunk.append((unit, unit_tokens))
+                tokens += unit_tokens
+                continue
+            # Split sentences that don't fit into any chunk between words
+            for word in _WORD.findall(unit):
+                for piece, piece_tokens in self._split_word(word):
+                    if chunk and tokens + piece_tokens > self.max_tokens:
+                        yield self._document(chunk, source)
+                        chunk = self._overlap(chunk, piece_tokens)
+                        tokens = sum(count for _, count in chunk)
+                    chunk.append((piece, piece_tokens))
+                    tokens += piece_tokens
+        if chunk:
+            yield self._document(chunk, source)
+
+    def _split_word(self, word: str) -> Iterator[tuple[str, int]]:
+        """Yields the pieces of `word` that fit into `max_tokens` and their tokens.
+
+        Words that don't fit are split between characters, halving each piece until
+        it fits.
+        """
+        word_tokens = self.tokenizer(word)
+        if word_tokens <= self.max_tokens:
+            yield word, word_tokens
+            return
+        size = max(1, len(word) * self.max_tokens // word_tokens)
+        start = 0
+        while start < len(word):
+            end = start + size
+            while (tokens := self.tokenizer(word[start:end])) > self.max_tokens and (
+                end - start > 1
+            ):
+                end = start + (end - start) // 2
+            yield word[start:end], tokens
+            start = end
+
+    def _overlap(
+        self, chunk: list[tuple[str, int]], next_tokens: int
+    ) -> list[tuple[str, int]]:
+        """Returns the trailing units of `chunk` to repeat at the start of the next.
+
+        The overlap is at most `overlap_tokens` and leaves room for the `next_tokens`
+        of the unit that starts the next chunk.
+        """
+        budget = min(self.overlap_tokens, self.max_tokens - next_tokens)
+        overlap: list[tuple[str, int]] = []
+        tokens = 0
+        for unit, unit_tokens in reversed(chunk):
+            if tokens + unit_tokens > budget:
+                break
+            overlap.append((unit, unit_tokens))
+            tokens += unit_tokens
+        overlap.reverse()
+        return overlap if tokens else []
+
+    @staticmethod
+    def _document(chunk: list[tuple[str, int]], source: str) -> Document:
+        text = "".join(unit for unit, _ in chunk).strip()
+        return Document(text=text, id=chunk_id(source, text))
@@ -1,19 +1,33 @@
 """Embedders for the RAG module."""
 
+import asyncio
+import datetime
+import hashlib
 from abc import ABC, abstractmethod
-from typing import ClassVar, Generic, TypeVar
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, TypeVar, cast
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 
 from .config import BaseConfig
+from .embedding_cache import Embedding, EmbeddingCache
 from .embedding_params import BaseEmbeddingParams
-from .embedding_response import BaseEmbeddingResponse
+from .embedding_response import BaseEmbeddingResponse, CachedEmbeddingResponse
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
 
 BaseEmbeddingT = TypeVar("BaseEmbeddingT", bound=BaseEmbeddingResponse)
 
 
 class BaseEmbedder(BaseModel, Generic[BaseEmbeddingT], ABC):
-    """The base class abstract interface for interacting with LLM embeddings."""
+    """The base class abstract interface for interacting with LLM embeddings.
+
+    Set `use_numpy=True` (requires `numpy`) to carry embeddings as `float32` NumPy
+    arrays instead of lists of Python floats when calling the embedder directly and
+    when upserting into vectorstores.
+    """
 
     api_key: ClassVar[str | None] = None
     base_url: ClassVar[str | None] = None
@@ -21,6 +35,7 @@ class BaseEmbedder(BaseModel, Generic[BaseEmbeddingT], ABC):
         model="text-embedding-ada-002"
     )
     dimensions: int | None = None
+    use_numpy: bool = False
     configuration: ClassVar[BaseConfig] = BaseConfig(llm_ops=[], client_wrappers=[])
     _provider: ClassVar[str] = "base"
 
@@ -33,3 +48,149 @@ class BaseEmbedder(BaseModel, Generic[BaseEmbeddingT], ABC):
     async def embed_async(self, input: list[str]) -> BaseEmbeddingT:
         """Asynchronously call the embedder with a single input"""
         ...
+
+
+class CachedEmbedder(BaseEmbedder[CachedEmbeddingResponse]):
+    """An embedder that caches the embeddings of another embedder.
+
+    Embeddings are cached by the wrapped embedder's provider, embedding params (e.g.
+    the model), dimensions, and the hash of the embedded text. Only the inputs that
+    aren't cached (deduplicated) are sent to the wrapped embedder, so re-embedding
+    unchanged text is free. The `dimensions` and `use_numpy` settings mirror those of
+    the wrapped embedder.
+
+    Example:
+
+    ```python
+    from mirascope.beta.rag import CachedEmbedder, EmbeddingCache
+    from mirascope.beta.rag.openai import OpenAIEmbedder
+
+    embedder = CachedEmbedder(
+        embedder=OpenAIEmbedder(), cache=EmbeddingCache("embeddings.sqlite")
+    )
+    response = embedder.embed(["your text to embed"])
+    print(response.hits)
+    ```
+    """
+
+    embedder: BaseEmbedder
+    cache: EmbeddingCache = Field(default_factory=EmbeddingCache)
+    _provider: ClassVar[str] = "cached"
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    def model_post_init(self, __context: Any) -> None:  # noqa: ANN401
+        self.dimensions = self.embedder.dimensions
+        self.use_numpy = self.embedder.use_numpy
+
+    def embed(self, inputs: list[str]) -> CachedEmbeddingResponse:
+        """Call the embedder with multiple inputs, embedding only uncached inputs"""
+        start_time = datetime.datetime.now().timestamp() * 1000
+        text_hashes = [self._hash(text) for text in inputs]
+        embeddings = self.cache.get_many(self._namespace, text_hashes, self.use_numpy)
+        misses = self._get_misses(inputs, text_hashes, embeddings)
+        response = self.embedder.embed(list(misses.values())) if misses else None
+        return self._construct_response(
+            response, misses, text_hashes, embeddings, start_time
+        )
+
+    async def embed_async(self, inputs: list[str]) -> CachedEmbeddingResponse:
+        """Asynchronously call the embedder with multiple inputs, embedding only
+        uncached inputs"""
+        start_time = datetime.datetime.now().timestamp() * 1000
+        text_hashes = [self._hash(text) for text in inputs]
+        embeddings = await asyncio.to_thread(
+            self.cache.get_many, self._namespace, text_hashes, self.use_numpy
+        )
+        misses = self._get_misses(inputs, text_hashes, embeddings)
+        response = (
+            await self.embedder.embed_async(list(misses.values())) if misses else None
+        )
+        return await asyncio.to_thread(
+            self._construct_response,
+            response,
+            misses,
+            text_hashes,
+            embeddings,
+            start_time,
+        )
+
+    def __call__(
+        self, input: list[str]
+    ) -> list[list[float]] | list[list[int]] | list["NDArray[np.float32]"]:
+        """Call the embedder with a input
+
+        Chroma expects parameter to be `input`.
+        """
+        response = self.embed(input)
+        if self.use_numpy:
+            return cast(list["NDArray[np.float32]"], response.cached_embeddings)
+        return response.embeddings
+
+    ############################## PRIVATE METHODS ###################################
+
+    @cached_property
+    def _namespace(self) -> str:
+        """The cache namespace of the wrapped embedder and its settings."""
+        embedding_params = self.embedder.embedding_params
+        params_hash = hashlib.sha256(
+            embedding_params.model_dump_json(exclude={"model"}).encode()
+        ).hexdigest()[:16]
+        return (
+            f"{self.embedder._provider}:{embedding_params.model}:"
+            f"{self.embedder.dimensions}:{params_hash}"
+        )
+
+    @staticmethod
+    def _hash(text: str) -> bytes:
+        return hashlib.sha256(text.encode()).digest()
+
+    @staticmethod
+    def _get_misses(
+        inputs: list[str],
+        text_hashes: list[bytes],
+        embeddings: list[Embedding | None],
+    ) -> dict[bytes, str]:
+        """Returns the uncached inputs by their hash, without duplicates."""
+        return {
+            text_hash: text
+            for text, text_hash, embedding in zip(
+                inputs, text_hashes, embeddings, strict=True
+            )
+            if embedding is None
+        }
+
+    def _construct_response(
+        self,
+        response: BaseEmbeddingResponse | None,
+        misses: dict[bytes, str],
+        text_hashes: list[bytes],
+        embeddings: list[Embedding | None],
+        start_time: float,
+    ) -> CachedEmbeddingResponse:
+        """Caches the embeddings of the misses and constructs the response."""
+        hits = sum(embedding is not None for embedding in embeddings)
+        if response is not None:
+            miss_embeddings = (
+                response.embeddings_array if self.use_numpy else response.embeddings
+            )
+            if miss_embeddings is None:
+                raise ValueError("Embedding is None")
+            # Return the misses as cached so that later hits return the same values
+            cached = self.cache.set_many(
+                self._namespace,
+                list(zip(misses, miss_embeddings, strict=True)),
+                self.use_numpy,
+            )
+            computed: dict[bytes, Embedding] = dict(zip(misses, cached, strict=True))
+            embeddings = [
+                computed[text_hash] if embedding is None else embedding
+                for text_hash, embedding in zip(text_hashes, embeddings, strict=True)
+            ]
+        return CachedEmbeddingResponse(
+            response=response,
+            start_time=start_time,
+            end_time=datetime.datetime.now().timestamp() * 1000,
+            cached_embeddings=embeddings,
+            hits=hits,
+        )
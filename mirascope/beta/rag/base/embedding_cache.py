@@ -0,0 +1,193 @@
+"""A two-tier cache of embeddings for the RAG module."""
+
+import os
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, TypeAlias, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+Embedding: TypeAlias = Union[list[float], list[int], "NDArray[np.float32]"]
+
+# SQLite limits the number of parameters per statement (999 in older versions)
+_MAX_QUERY_PARAMS = 900
+
+
+def _encode(embedding: Embedding) -> tuple[str, bytes]:
+    """Packs an embedding into bytes, keeping integer embeddings as integers.
+
+    Embeddings are only integer embeddings if all of their values are integers, since
+    float embeddings may contain values that were decoded as integers (e.g. `0`).
+    NumPy embeddings are always packed as `float32`.
+    """
+    if not isinstance(embedding, list):
+        import numpy as np
+
+        return "f", np.asarray(embedding, dtype=np.float32).tobytes()
+    typecode = (
+        "q" if embedding and all(type(value) is int for value in embedding) else "f"
+    )
+    return typecode, array(typecode, embedding).tobytes()
+
+
+def _decode(typecode: str, data: bytes, as_array: bool) -> Embedding:
+    """Unpacks an embedding into a list or, if `as_array`, a `float32` NumPy array.
+
+    `float32` arrays are read-only views of `data`, so they share the cached bytes
+    instead of copying them.
+    """
+    if as_array:
+        import numpy as np
+
+        if typecode == "f":
+            return np.frombuffer(data, dtype=np.float32)
+        return np.frombuffer(data, dtype=np.int64).astype(np.float32)
+    values = array(typecode)
+    values.frombytes(data)
+    return values.tolist()
+
+
+class EmbeddingCache:
+    """A cache of embeddings with an in-memory LRU tier and an optional SQLite tier.
+
+    Embeddings are keyed by a namespace (identifying the embedder and its settings)
+    and the hash of the embedded text. Float embeddings are stored as `float32`, which
+    matches the precision that embedding APIs return. Both tiers hold the packed bytes
+    of each embedding, which are returned as lists or, with `as_array=True`, as
+    read-only `float32` NumPy views of the cached bytes. The cache is thread-safe, so
+    one cache can be shared by several embedders.
+
+    Example:
+
+    ```python
+    from mirascope.beta.rag import CachedEmbedder, EmbeddingCache
+    from mirascope.beta.rag.openai import OpenAIEmbedder
+
+    embedder = CachedEmbedder(
+        embedder=OpenAIEmbedder(), cache=EmbeddingCache("embeddings.sqlite")
+    )
+    ```
+
+    Args:
+        path: The path of the SQLite database of the on-disk tier. If `None`,
+            embeddings are only cached in memory.
+        max_size: The maximum number of embeddings in the in-memory tier.
+    """
+
+    def __init__(
+        self, path: str | os.PathLike[str] | None = None, max_size: int = 10_000
+    ) -> None:
+        self.path = path
+        self.max_size = max_size
+        self._memory: OrderedDict[tuple[str, bytes], tuple[str, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        if path is not None:
+            self._connection = sqlite3.connect(path, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "namespace TEXT NOT NULL, "
+                "text_hash BLOB NOT NULL, "
+                "typecode TEXT NOT NULL, "
+                "embedding BLOB NOT NULL, "
+                "PRIMARY KEY (namespace, text_hash))"
+            )
+            self._connection.commit()
+
+    def get_many(
+        self, namespace: str, text_hashes: Sequence[bytes], as_array: bool = False
+    ) -> list[Embedding | None]:
+        """Returns the cached embedding (or `None`) for each of the text hashes.
+
+        Embeddings found on disk are promoted to the in-memory tier. If `as_array`,
+        embeddings are returned as `float32` NumPy arrays (requires `numpy`).
+        """
+        embeddings: list[Embedding | None] = []
+        misses: dict[bytes, list[int]] = {}
+        with self._lock:
+            for i, text_hash in enumerate(text_hashes):
+                key = (namespace, text_hash)
+                embedding = None
+                if (packed := self._memory.get(key)) is not None:
+                    self._memory.move_to_end(key)
+                    embedding = _decode(*packed, as_array)
+                elif self._connection is not None:
+                    misses.setdefault(text_hash, []).append(i)
+                embeddings.append(embedding)
+            if not misses or self._connection is None:
+                return embeddings
+
+            hashes = list(misses)
+            for start in range(0, len(hashes), _MAX_QUERY_PARAMS):
+                batch = hashes[start : start + _MAX_QUERY_PARAMS]
+                rows = self._connection.execute(
+                    "SELECT text_hash, typecode, embedding FROM embeddings "
+                    f"WHERE namespace = ? AND text_hash IN ({','.join('?' * len(batch))})",
+                    [namespace, *batch],
+                )
+                for text_hash, typecode, data in rows:
+                    embedding = _decode(typecode, data, as_array)
+                    self._remember((namespace, text_hash), (typecode, data))
+                    for i in misses[text_hash]:
+                        embeddings[i] = embedding
+        return embeddings
+
+    def set_many(
+        self,
+        namespace: str,
+        items: Sequence[tuple[bytes, Embedding]],
+        as_array: bool = False,
+    ) -> list[Embedding]:
+        """Caches each `(text_hash, embedding)` pair in both tiers.
+
+        Both tiers store float embeddings as `float32` so that they return the same
+        values, and the embeddings are returned as cached (as NumPy arrays if
+        `as_array`).
+        """
+        encoded = [(text_hash, *_encode(embedding)) for text_hash, embedding in items]
+        with self._lock:
+            for text_hash, typecode, data in encoded:
+                self._remember((namespace, text_hash), (typecode, data))
+            if self._connection is not None and encoded:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?)",
+                    [(namespace, *row) for row in encoded],
+                )
+                self._connection.commit()
+        return [_decode(typecode, data, as_array) for _, typecode, data in encoded]
+
+    def clear(self, namespace: str | None = None) -> None:
+        """Removes the cached embeddings of `namespace`, or all of them if `None`."""
+        with self._lock:
+            if namespace is None:
+                self._memory.clear()
+            else:
+                for key in [key for key in self._memory if key[0] == namespace]:
+                    del self._memory[key]
+            if self._connection is not None:
+                if namespace is None:
+                    self._connection.execute("DELETE FROM embeddings")
+                else:
+                    self._connection.execute(
+                        "DELETE FROM embeddings WHERE namespace = ?", (namespace,)
+                    )
+                self._connection.commit()
+
+    def close(self) -> None:
+        """Closes the connection to the on-disk tier, if any."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _remember(self, key: tuple[str, bytes], packed: tuple[str, bytes]) -> None:
+        self._memory[key] = packed
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.max_size:
+            self._memory.popitem(last=False)
@@ -1,7 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Any, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, SkipValidation
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
 
 ResponseT = TypeVar("ResponseT", bound=Any)
 
@@ -28,3 +32,41 @@ class BaseEmbeddingResponse(BaseModel, Generic[ResponseT], ABC):
         choice and return it's embedding.
         """
         ...
+
+    @property
+    def embeddings_array(self) -> "NDArray[np.float32] | None":
+        """Returns the embeddings as a 2D `float32` NumPy array (requires `numpy`).
+
+        Each row is the embedding of one input, so per-document slices are views into
+        a single contiguous buffer rather than separate lists of Python floats.
+        """
+        import numpy as np
+
+        embeddings = self.embeddings
+        if embeddings is None:
+            return None
+        return np.asarray(embeddings, dtype=np.float32)
+
+
+class CachedEmbeddingResponse(BaseEmbeddingResponse[BaseEmbeddingResponse | None]):
+    """The response of a `CachedEmbedder`.
+
+    Attributes:
+        response: The wrapped embedder's response for the inputs that weren't cached,
+            or `None` if every input was cached.
+        cached_embeddings: The embedding of each input, in order. These are read-only
+            `float32` NumPy arrays (views of the cached bytes) if the embedder uses
+            NumPy, and lists otherwise.
+        hits: The number of inputs whose embedding was cached.
+    """
+
+    cached_embeddings: SkipValidation[list[Any]]
+    hits: int = 0
+
+    @property
+    def embeddings(self) -> list[list[float]] | list[list[int]]:
+        """Returns the embeddings."""
+        return [
+            embedding if isinstance(embedding, list) else embedding.tolist()
+            for embedding in self.cached_embeddings
+        ]
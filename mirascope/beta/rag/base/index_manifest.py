@@ -0,0 +1,97 @@
+"""A manifest of the chunks indexed per document for the RAG module."""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import uuid
+from collections.abc import Sequence
+
+
+def chunk_id(document_id: str, text: str) -> str:
+    """Returns the id of the chunk of `document_id` with `text`.
+
+    The id is derived from the document id and the hash of the text, so unchanged
+    chunks keep their ids and chunks of different documents never collide.
+    """
+    text_hash = hashlib.sha256(text.encode()).hexdigest()
+    return str(uuid.uuid5(uuid.NAMESPACE_OID, f"{document_id}:{text_hash}"))
+
+
+class IndexManifest:
+    """A record of which chunks of each document are indexed in each vectorstore.
+
+    Vectorstores use the manifest to re-index a changed document by only adding its new
+    chunks and deleting its vanished ones (see `BaseVectorStore.update_document`). The
+    manifest is thread-safe, so one manifest can be shared by several vectorstores.
+
+    Example:
+
+    ```python
+    from mirascope.beta.rag import IndexManifest
+    from mirascope.beta.rag.chroma import ChromaVectorStore
+
+
+    class MyStore(ChromaVectorStore):
+        index_name = "my-store-0001"
+        manifest = IndexManifest("manifest.sqlite")
+
+    my_store = MyStore()
+    my_store.update_document("README.md", readme)
+    ```
+
+    Args:
+        path: The path of the SQLite database of the manifest. If `None`, the manifest
+            only lives in memory, so documents are re-indexed in full after a restart.
+    """
+
+    def __init__(self, path: str | os.PathLike[str] | None = None) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            ":memory:" if path is None else path, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS chunks ("
+            "index_name TEXT NOT NULL, "
+            "document_id TEXT NOT NULL, "
+            "chunk_id TEXT NOT NULL, "
+            "PRIMARY KEY (index_name, document_id, chunk_id))"
+        )
+        self._connection.commit()
+
+    def get(self, index_name: str, document_id: str) -> set[str]:
+        """Returns the ids of the indexed chunks of `document_id`."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT chunk_id FROM chunks WHERE index_name = ? AND document_id = ?",
+                (index_name, document_id),
+            )
+            return {chunk_id for (chunk_id,) in rows}
+
+    def set(self, index_name: str, document_id: str, chunk_ids: Sequence[str]) -> None:
+        """Records `chunk_ids` as the indexed chunks of `document_id`."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM chunks WHERE index_name = ? AND document_id = ?",
+                (index_name, document_id),
+            )
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO chunks VALUES (?, ?, ?)",
+                [(index_name, document_id, chunk_id) for chunk_id in chunk_ids],
+            )
+
+    def document_ids(self, index_name: str) -> list[str]:
+        """Returns the ids of the documents indexed in `index_name`."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT DISTINCT document_id FROM chunks WHERE index_name = ?",
+                (index_name,),
+            )
+            return [document_id for (document_id,) in rows]
+
+    def close(self) -> None:
+        """Closes the connection to the manifest database."""
+        with self._lock:
+            self._connection.close()
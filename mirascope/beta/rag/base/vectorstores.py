@@ -1,7 +1,15 @@
 """Vectorstores for the RAG module."""
 
+import asyncio
+import io
+import mmap
+import os
 from abc import ABC, abstractmethod
-from typing import Any, ClassVar, Generic, TypeVar
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import IO, Any, ClassVar, Generic, TypeAlias, TypeVar
 
 from pydantic import BaseModel
 
@@ -9,11 +17,20 @@ from .chunkers import BaseChunker, TextChunker
 from .config import BaseConfig
 from .document import Document
 from .embedders import BaseEmbedder
+from .index_manifest import IndexManifest, chunk_id
 from .query_results import BaseQueryResults
 from .vectorstore_params import BaseVectorStoreParams
 
 BaseQueryResultsT = TypeVar("BaseQueryResultsT", bound=BaseQueryResults)
 
+FileSource: TypeAlias = os.PathLike[str] | IO[str] | IO[bytes] | mmap.mmap
+DocumentSource: TypeAlias = str | FileSource | Iterable[str | Document | FileSource]
+
+
+def _batched(documents: Iterator[Document], size: int) -> Iterator[list[Document]]:
+    while batch := list(islice(documents, size)):
+        yield batch
+
 
 class BaseVectorStore(BaseModel, Generic[BaseQueryResultsT], ABC):
     """The base class abstract interface for interacting with vectorstores."""
@@ -24,6 +41,7 @@ class BaseVectorStore(BaseModel, Generic[BaseQueryResultsT], ABC):
     embedder: ClassVar[BaseEmbedder]
     vectorstore_params: ClassVar[BaseVectorStoreParams] = BaseVectorStoreParams()
     configuration: ClassVar[BaseConfig] = BaseConfig()
+    manifest: ClassVar[IndexManifest | None] = None
     _provider: ClassVar[str] = "base"
 
     @abstractmethod
@@ -35,3 +53,153 @@ class BaseVectorStore(BaseModel, Generic[BaseQueryResultsT], ABC):
     def add(self, text: str | list[Document], **kwargs: Any) -> None:  # noqa: ANN401
         """Takes unstructured data and upserts into vectorstore"""
         ...
+
+    @abstractmethod
+    def delete(self, ids: list[str], **kwargs: Any) -> None:  # noqa: ANN401
+        """Deletes the documents with `ids` from the vectorstore"""
+        ...
+
+    def update_document(
+        self,
+        document_id: str,
+        text: str,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Incrementally (re-)indexes the document `document_id` with `text`.
+
+        The text is chunked and only the chunks that aren't indexed yet according to
+        `manifest` are embedded and added, while the chunks that vanished from the
+        document are deleted. Chunk ids are derived from `document_id` and the hash
+        of the chunk text, and each chunk's metadata records its `document_id`.
+        Unchanged chunks keep the metadata they were added with.
+
+        Args:
+            document_id: The id of the document, e.g. its path.
+            text: The current text of the document.
+            metadata: Metadata to add to each chunk of the document.
+            **kwargs: Additional keyword arguments passed to `add`.
+        """
+        manifest = self._manifest
+        documents: dict[str, Document] = {}
+        for document in self.chunker.chunk(text):
+            id = chunk_id(document_id, document.text)
+            documents[id] = Document(
+                id=id,
+                text=document.text,
+                metadata={
+                    **(document.metadata or {}),
+                    **(metadata or {}),
+                    "document_id": document_id,
+                },
+            )
+        indexed = manifest.get(self._manifest_key, document_id)
+        if added := [
+            document for id, document in documents.items() if id not in indexed
+        ]:
+            self.add(added, **kwargs)
+        if deleted := [id for id in indexed if id not in documents]:
+            self.delete(deleted)
+        manifest.set(self._manifest_key, document_id, list(documents))
+
+    def remove_document(self, document_id: str) -> None:
+        """Deletes all chunks of the document `document_id` indexed by `update_document`."""
+        manifest = self._manifest
+        if indexed := manifest.get(self._manifest_key, document_id):
+            self.delete(list(indexed))
+        manifest.set(self._manifest_key, document_id, [])
+
+    def add_stream(
+        self,
+        source: DocumentSource,
+        *,
+        batch_size: int = 100,
+        max_workers: int = 4,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Adds a large corpus to the vectorstore with bounded memory.
+
+        Documents are chunked lazily and added (i.e. embedded and upserted) in batches
+        of `batch_size` on up to `max_workers` threads while the next batches are being
+        chunked. At most `2 * max_workers` batches are in flight at any time, so the
+        corpus, its chunks, and its embeddings never need to be resident all at once.
+
+        Args:
+            source: A text, a UTF-8 text file (a path, an open text or binary file, or
+                an `mmap`), or an iterable of texts, documents, and files. Texts and
+                files are split with `chunker`.
+            batch_size: The number of documents to add per call to `add`.
+            max_workers: The number of batches to add concurrently.
+            **kwargs: Additional keyword arguments passed to each call to `add`.
+        """
+        pending: deque[Future[None]] = deque()
+        with ThreadPoolExecutor(max_workers) as executor:
+            for batch in _batched(self._iter_documents(source), batch_size):
+                if len(pending) >= 2 * max_workers:
+                    pending.popleft().result()
+                pending.append(executor.submit(self.add, batch, **kwargs))
+            for future in pending:
+                future.result()
+
+    async def add_stream_async(
+        self,
+        source: DocumentSource,
+        *,
+        batch_size: int = 100,
+        max_concurrency: int = 4,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Asynchronously adds a large corpus to the vectorstore with bounded memory.
+
+        Like `add_stream`, but batches are chunked and added in worker threads without
+        blocking the event loop, with at most `max_concurrency` batches in flight at
+        any time.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        tasks: set[asyncio.Task[None]] = set()
+
+        async def add_batch(batch: list[Document]) -> None:
+            try:
+                await asyncio.to_thread(self.add, batch, **kwargs)
+            finally:
+                semaphore.release()
+
+        batches = _batched(self._iter_documents(source), batch_size)
+        try:
+            # Chunking (and reading files) blocks, so each batch is produced in a thread
+            while batch := await asyncio.to_thread(next, batches, None):
+                await semaphore.acquire()
+                for task in [task for task in tasks if task.done()]:
+                    tasks.discard(task)
+                    task.result()
+                tasks.add(asyncio.create_task(add_batch(batch)))
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @property
+    def _manifest(self) -> IndexManifest:
+        if self.manifest is None:
+            raise ValueError(
+                f"{type(self).__name__} needs a `manifest` to index documents "
+                "incrementally"
+            )
+        return self.manifest
+
+    @property
+    def _manifest_key(self) -> str:
+        return f"{self._provider}:{self.index_name}"
+
+    def _iter_documents(self, source: DocumentSource) -> Iterator[Document]:
+        """Lazily yields the chunked documents of `source`."""
+        if isinstance(source, str):
+            yield from self.chunker.chunk(source)
+        elif isinstance(source, os.PathLike | io.IOBase | mmap.mmap):
+            yield from self.chunker.chunk_file(source)
+        else:
+            for item in source:
+                if isinstance(item, Document):
+                    yield item
+                else:
+                    yield from self._iter_documents(item)
@@ -72,6 +72,10 @@ class ChromaVectorStore(BaseVectorStore):
             **kwargs,
         )
 
+    def delete(self, ids: list[str], **kwargs: Any) -> None:  # noqa: ANN401
+        """Deletes the documents with `ids` from the vectorstore"""
+        self._index.delete(ids=ids, **kwargs)
+
     ############################# PRIVATE PROPERTIES #################################
 
     @cached_property
@@ -1,7 +1,7 @@
 """A module for calling OpenAI's Embeddings models."""
 
 import datetime
-from typing import ClassVar
+from typing import TYPE_CHECKING, ClassVar
 
 from cohere import AsyncClient, Client
 
@@ -9,6 +9,10 @@ from ..base.embedders import BaseEmbedder
 from .embedding_params import CohereEmbeddingParams
 from .embedding_response import CohereEmbeddingResponse
 
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
 
 class CohereEmbedder(BaseEmbedder[CohereEmbeddingResponse]):
     """Cohere Embedder
@@ -77,11 +81,16 @@ class CohereEmbedder(BaseEmbedder[CohereEmbeddingResponse]):
             embedding_type=embedding_type,
         )
 
-    def __call__(self, input: list[str]) -> list[list[float]] | list[list[int]] | None:
+    def __call__(
+        self, input: list[str]
+    ) -> list[list[float]] | list[list[int]] | list["NDArray[np.float32]"] | None:
         """Call the embedder with a input
 
         Chroma expects parameter to be `input`.
         """
         response = self.embed(input)
+        if self.use_numpy:
+            embeddings_array = response.embeddings_array
+            return None if embeddings_array is None else list(embeddings_array)
         embeddings = response.embeddings
         return embeddings
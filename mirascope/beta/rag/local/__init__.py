@@ -0,0 +1,11 @@
+"""A module for interacting with the in-process local vectorstore."""
+
+from .types import LocalParams, LocalQueryResult, LocalSettings
+from .vectorstores import LocalVectorStore
+
+__all__ = [
+    "LocalParams",
+    "LocalQueryResult",
+    "LocalSettings",
+    "LocalVectorStore",
+]
@@ -0,0 +1,51 @@
+"""Types for interacting with the local vectorstore using Mirascope."""
+
+from typing import Any, Literal
+
+from pydantic import BaseModel
+
+from ..base.query_results import BaseQueryResults
+from ..base.vectorstore_params import BaseVectorStoreParams
+
+
+class LocalParams(BaseVectorStoreParams):
+    """The parameters of a local vectorstore.
+
+    Attributes:
+        metric: How to score matches. `"cosine"` normalizes embeddings when they are
+            added (so that scoring is a plain matrix product) and `"dot"` scores them
+            with the raw dot product.
+        max_segments: The number of segments after which an add merges the smallest
+            segments of similar size.
+        quantization: How to quantize embeddings for search. `"int8"` scales each
+            embedding into 8-bit integers and `"binary"` keeps one sign bit per
+            dimension. If `None`, the `float32` embeddings are searched directly.
+        rescore_multiplier: With quantization, how many times `top_k` candidates the
+            codes select for rescoring with the `float32` embeddings.
+    """
+
+    metric: Literal["cosine", "dot"] = "cosine"
+    max_segments: int = 16
+    quantization: Literal["int8", "binary"] | None = None
+    rescore_multiplier: int = 4
+
+
+class LocalSettings(BaseModel):
+    """The settings of a local vectorstore.
+
+    Attributes:
+        path: The directory in which segments are stored and memory-mapped. If `None`,
+            the vectorstore only lives in memory. Stores with an `index_name` use a
+            subdirectory of `path` with that name.
+    """
+
+    path: str | None = None
+
+
+class LocalQueryResult(BaseQueryResults):
+    """The closest matches of a query, ordered from best to worst."""
+
+    ids: list[str]
+    scores: list[float]
+    documents: list[str]
+    metadatas: list[dict[str, Any] | None]
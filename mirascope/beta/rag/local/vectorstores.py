@@ -0,0 +1,676 @@
+"""A module for the in-process local vectorstore."""
+
+import contextlib
+import json
+import os
+import tempfile
+import threading
+import weakref
+from collections.abc import Callable
+from functools import cached_property
+from pathlib import Path
+from typing import Any, ClassVar, Literal, TypeAlias
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ..base.document import Document
+from ..base.vectorstores import BaseVectorStore
+from .types import LocalParams, LocalQueryResult, LocalSettings
+
+MetadataFilter: TypeAlias = dict[str, Any] | Callable[[dict[str, Any]], bool] | None
+
+_MANIFEST = "manifest.json"
+# Segments are scored in blocks of rows so that the score matrix stays small even for
+# large (memory-mapped) segments
+_SEARCH_BLOCK_SIZE = 65_536
+# Quantized codes are widened (int8) or expanded per byte (binary) while scoring, so
+# they are scored in smaller blocks
+_QUANTIZED_SEARCH_BLOCK_SIZE = 8_192
+# Segments are only merged with segments whose live rows are within this ratio of
+# theirs, so that each row is rewritten a logarithmic number of times as the store grows
+_MERGE_SIZE_RATIO = 4
+# The number of set bits of each byte, for Hamming distances between binary codes
+_POPCOUNT = np.array([bin(byte).count("1") for byte in range(256)], dtype=np.uint8)
+
+# The open indexes by their resolved directory, so that every store persisted in the
+# same directory shares one index instead of overwriting each other's segments
+_indexes: weakref.WeakValueDictionary[Path, "_LocalIndex"] = (
+    weakref.WeakValueDictionary()
+)
+_indexes_lock = threading.Lock()
+
+
+def _write_atomic(path: Path, write: Callable[[Any], None], mode: str = "w") -> None:
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with open(tmp_path, mode) as file:
+        write(file)
+    os.replace(tmp_path, path)
+
+
+def _temporary_memmap(shape: tuple[int, int]) -> NDArray[np.float32]:
+    """Returns a writable `float32` matrix memory-mapped from an anonymous file."""
+    with tempfile.TemporaryFile() as file:
+        # The memory map keeps its own handle of the file open
+        return np.memmap(file, np.float32, "w+", shape=shape)
+
+
+def _quantize(
+    embeddings: NDArray[np.float32], quantization: Literal["int8", "binary"]
+) -> tuple[NDArray[np.int8] | NDArray[np.uint8], NDArray[np.float32] | None]:
+    """Returns the codes of `embeddings` and, for int8 codes, the scale of each row.
+
+    int8 codes scale each row so that its largest absolute value maps to 127, and
+    binary codes keep the sign bit of each dimension packed into bytes.
+    """
+    if quantization == "binary":
+        return np.packbits(embeddings > 0, axis=1), None
+    scales = np.abs(embeddings).max(axis=1) / 127
+    scales = np.maximum(scales, np.finfo(np.float32).tiny).astype(np.float32)
+    codes = np.rint(embeddings / scales[:, None]).astype(np.int8)
+    return codes, scales
+
+
+class _Segment:
+    """An append-only block of documents and their embeddings.
+
+    Rows that are replaced by a later add are only marked as dead until compaction.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ids: list[str],
+        texts: list[str],
+        metadatas: list[dict[str, Any] | None],
+        embeddings: NDArray[np.float32],
+        codes: NDArray[np.int8] | NDArray[np.uint8] | None = None,
+        scales: NDArray[np.float32] | None = None,
+    ) -> None:
+        self.name = name
+        self.ids = ids
+        self.texts = texts
+        self.metadatas = metadatas
+        self.embeddings = embeddings
+        self.codes = codes
+        self.scales = scales
+        self.live = np.ones(len(ids), dtype=bool)
+
+    def save(self, directory: Path) -> None:
+        """Writes the documents, embeddings, and codes of the segment to `directory`."""
+        self.save_documents(directory)
+        self.save_codes(directory)
+        _write_atomic(
+            directory / f"{self.name}.npy",
+            lambda file: np.save(file, self.embeddings),
+            "wb",
+        )
+
+    def save_codes(self, directory: Path) -> None:
+        """Writes the quantized codes (if any) of the segment to `directory`."""
+        for suffix, array in ((".codes.npy", self.codes), (".scales.npy", self.scales)):
+            if array is not None:
+                _write_atomic(
+                    directory / f"{self.name}{suffix}",
+                    lambda file, array=array: np.save(file, array),
+                    "wb",
+                )
+
+    def save_documents(self, directory: Path) -> None:
+        """Writes the documents of the segment to `directory`."""
+        documents = zip(self.ids, self.texts, self.metadatas, strict=True)
+        _write_atomic(
+            directory / f"{self.name}.jsonl",
+            lambda file: file.writelines(
+                json.dumps({"id": id, "text": text, "metadata": metadata}) + "\n"
+                for id, text, metadata in documents
+            ),
+        )
+
+    @classmethod
+    def load(
+        cls,
+        directory: Path,
+        name: str,
+        quantization: Literal["int8", "binary"] | None,
+    ) -> "_Segment":
+        """Loads a segment with its embeddings memory-mapped from `directory`.
+
+        Quantized codes are loaded into memory since every search scans them.
+        """
+        ids, texts, metadatas = [], [], []
+        with open(directory / f"{name}.jsonl") as file:
+            for line in file:
+                document = json.loads(line)
+                ids.append(document["id"])
+                texts.append(document["text"])
+                metadatas.append(document["metadata"])
+        embeddings = np.load(directory / f"{name}.npy", mmap_mode="r")
+        codes = scales = None
+        if quantization is not None:
+            codes = np.load(directory / f"{name}.codes.npy")
+        if quantization == "int8":
+            scales = np.load(directory / f"{name}.scales.npy")
+        return cls(name, ids, texts, metadatas, embeddings, codes, scales)
+
+    def delete(self, directory: Path) -> None:
+        for suffix in (".jsonl", ".npy", ".codes.npy", ".scales.npy"):
+            with contextlib.suppress(OSError):
+                (directory / f"{self.name}{suffix}").unlink()
+
+    def filter_mask(
+        self, live: NDArray[np.bool_], metadata_filter: MetadataFilter
+    ) -> NDArray[np.bool_]:
+        """Returns which of the `live` rows match `metadata_filter`."""
+        if metadata_filter is None:
+            return live
+        if callable(metadata_filter):
+            matches = (metadata_filter(metadata or {}) for metadata in self.metadatas)
+        else:
+            items = metadata_filter.items()
+            matches = (
+                all((metadata or {}).get(key) == value for key, value in items)
+                for metadata in self.metadatas
+            )
+        return live & np.fromiter(matches, dtype=bool, count=len(self.metadatas))
+
+
+class _LocalIndex:
+    """The segments of a local vectorstore, optionally persisted in a directory."""
+
+    def __init__(
+        self,
+        directory: Path | None,
+        metric: Literal["cosine", "dot"],
+        max_segments: int,
+        quantization: Literal["int8", "binary"] | None = None,
+        rescore_multiplier: int = 4,
+    ) -> None:
+        self.directory = directory
+        self.metric = metric
+        self.max_segments = max_segments
+        self.quantization = quantization
+        self.rescore_multiplier = rescore_multiplier
+        self.dimensions: int | None = None
+        self.segments: list[_Segment] = []
+        self.locations: dict[str, tuple[_Segment, int]] = {}
+        # The ids deleted since the last compaction, whose rows are still on disk
+        self.deleted: set[str] = set()
+        self.next_segment = 0
+        self.lock = threading.Lock()
+        if directory is not None:
+            directory.mkdir(parents=True, exist_ok=True)
+            if (directory / _MANIFEST).exists():
+                self._load()
+
+    def add(self, documents: list[Document], embeddings: NDArray[np.float32]) -> None:
+        """Appends the documents as a new segment, replacing documents by id."""
+        if self.metric == "cosine":
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings = embeddings / np.maximum(norms, np.finfo(np.float32).tiny)
+        with self.lock:
+            if self.dimensions is None:
+                self.dimensions = embeddings.shape[1]
+            elif embeddings.shape[1] != self.dimensions:
+                raise ValueError(
+                    f"Expected embeddings with {self.dimensions} dimensions but got "
+                    f"{embeddings.shape[1]}"
+                )
+            segment = _Segment(
+                f"segment-{self.next_segment:08d}",
+                [document.id for document in documents],
+                [document.text for document in documents],
+                [document.metadata for document in documents],
+                embeddings,
+            )
+            if self.quantization is not None:
+                segment.codes, segment.scales = _quantize(embeddings, self.quantization)
+            self.next_segment += 1
+            if self.directory is not None:
+                segment.save(self.directory)
+                segment.embeddings = np.load(
+                    self.directory / f"{segment.name}.npy", mmap_mode="r"
+                )
+            elif self.quantization is not None:
+                # Only the codes are scanned, so the embeddings kept for rescoring are
+                # spilled to disk instead of staying in memory next to them
+                segment.embeddings = _temporary_memmap(embeddings.shape)
+                segment.embeddings[:] = embeddings
+            self._append(segment)
+            self._save_manifest()
+            while len(self.segments) > self.max_segments and (
+                tier := self._smallest_tier()
+            ):
+                self._merge(tier)
+
+    def compact(self) -> None:
+        """Merges all segments into one, dropping the rows of replaced documents."""
+        with self.lock:
+            if len(self.segments) > 1 or not all(
+                segment.live.all() for segment in self.segments
+            ):
+                # No rows of deleted documents are left once every segment is merged
+                self.deleted = set()
+                self._merge(self.segments)
+
+    def delete(self, ids: list[str]) -> None:
+        """Marks the rows of the documents with `ids` as dead until compaction."""
+        with self.lock:
+            for id in ids:
+                self._delete(id)
+            self._save_manifest()
+
+    def search(
+        self,
+        queries: NDArray[np.float32],
+        top_k: int,
+        metadata_filter: MetadataFilter,
+    ) -> list[list[tuple[float, _Segment, int]]]:
+        """Returns the `top_k` best matches of each query, from best to worst.
+
+        With quantization, the codes select `top_k * rescore_multiplier` candidates
+        that are then rescored with the full-precision embeddings.
+        """
+        if self.metric == "cosine":
+            norms = np.linalg.norm(queries, axis=1, keepdims=True)
+            queries = queries / np.maximum(norms, np.finfo(np.float32).tiny)
+        with self.lock:
+            snapshot = [(segment, segment.live.copy()) for segment in self.segments]
+        segments = [
+            (segment, segment.filter_mask(live, metadata_filter))
+            for segment, live in snapshot
+        ]
+        if self.quantization is None:
+            return self._search(queries, segments, top_k)
+        candidates = self._search(queries, segments, top_k * self.rescore_multiplier)
+        return [
+            self._rescore(query, query_candidates, top_k)
+            for query, query_candidates in zip(queries, candidates, strict=True)
+        ]
+
+    def _search(
+        self,
+        queries: NDArray[np.float32],
+        segments: list[tuple[_Segment, NDArray[np.bool_]]],
+        top_k: int,
+    ) -> list[list[tuple[float, _Segment, int]]]:
+        block_size = (
+            _SEARCH_BLOCK_SIZE
+            if self.quantization is None
+            else _QUANTIZED_SEARCH_BLOCK_SIZE
+        )
+        candidate_scores: list[NDArray[np.float32]] = []
+        candidates: list[tuple[_Segment, NDArray[np.intp]]] = []
+        for segment, mask in segments:
+            for start in range(0, len(mask), block_size):
+                block_mask = mask[start : start + block_size]
+                if (k := min(top_k, int(block_mask.sum()))) == 0:
+                    continue
+                scores = self._score_block(
+                    queries, segment, start, start + len(block_mask)
+                )
+                scores[:, ~block_mask] = -np.inf
+                rows = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+                candidate_scores.append(np.take_along_axis(scores, rows, axis=1))
+                candidates.append((segment, rows + start))
+        if not candidates:
+            return [[] for _ in queries]
+
+        # Merge the top `k` of each block into the overall top `k` of each query
+        all_scores = np.concatenate(candidate_scores, axis=1)
+        owners = [
+            (segment, column)
+            for segment, rows in candidates
+            for column in range(rows.shape[1])
+        ]
+        all_rows = np.concatenate([rows for _, rows in candidates], axis=1)
+        best = np.argsort(-all_scores, axis=1, kind="stable")[:, :top_k]
+        return [
+            [
+                (
+                    float(all_scores[query, column]),
+                    owners[column][0],
+                    int(all_rows[query, column]),
+                )
+                for column in best[query]
+                if np.isfinite(all_scores[query, column])
+            ]
+            for query in range(len(queries))
+        ]
+
+    def _score_block(
+        self, queries: NDArray[np.float32], segment: _Segment, start: int, stop: int
+    ) -> NDArray[np.float32]:
+        """Scores the queries against the rows `start:stop` of `segment`.
+
+        int8 codes are scored with the dot product of the full-precision query and the
+        scaled codes, and binary codes with the negated Hamming distance between the
+        sign bits of the query and the codes.
+        """
+        if self.quantization is None:
+            return queries @ segment.embeddings[start:stop].T
+        assert segment.codes is not None
+        codes = segment.codes[start:stop]
+        if self.quantization == "int8":
+            assert segment.scales is not None
+            return (queries @ codes.T.astype(np.float32)) * segment.scales[start:stop]
+        query_codes = np.packbits(queries > 0, axis=1)
+        distances = np.stack(
+            [
+                _POPCOUNT[query_code ^ codes].sum(axis=1, dtype=np.int32)
+                for query_code in query_codes
+            ]
+        )
+        return -distances.astype(np.float32)
+
+    @staticmethod
+    def _rescore(
+        query: NDArray[np.float32],
+        candidates: list[tuple[float, _Segment, int]],
+        top_k: int,
+    ) -> list[tuple[float, _Segment, int]]:
+        """Returns the `top_k` candidates by their full-precision score."""
+        if not candidates:
+            return []
+        embeddings = np.stack(
+            [segment.embeddings[row] for _, segment, row in candidates]
+        )
+        scores = embeddings @ query
+        best = np.argsort(-scores, kind="stable")[:top_k]
+        return [(float(scores[i]), candidates[i][1], candidates[i][2]) for i in best]
+
+    def _append(self, segment: _Segment) -> None:
+        self.segments.append(segment)
+        for row, id in enumerate(segment.ids):
+            if (location := self.locations.get(id)) is not None:
+                location[0].live[location[1]] = False
+            self.locations[id] = (segment, row)
+            self.deleted.discard(id)
+
+    def _delete(self, id: str) -> None:
+        if (location := self.locations.pop(id, None)) is not None:
+            location[0].live[location[1]] = False
+            self.deleted.add(id)
+
+    def _smallest_tier(self) -> list[_Segment]:
+        """Returns the smallest segments of similar size, if there are at least two.
+
+        Segments are sorted by their live rows, and a tier is a run of segments that
+        are at most `_MERGE_SIZE_RATIO` times larger than its smallest segment.
+        """
+        segments = sorted(self.segments, key=lambda segment: segment.live.sum())
+        for start, smallest in enumerate(segments[:-1]):
+            limit = max(int(smallest.live.sum()), 1) * _MERGE_SIZE_RATIO
+            stop = start + 1
+            while stop < len(segments) and segments[stop].live.sum() <= limit:
+                stop += 1
+            if stop - start > 1:
+                return segments[start:stop]
+        return []
+
+    def _merge(self, segments: list[_Segment]) -> None:
+        """Replaces `segments` with one segment of their live rows after the others.
+
+        The merged segment only holds live rows, so it can come after every other
+        segment without a reload reviving rows that its documents replaced.
+        """
+        name = f"segment-{self.next_segment:08d}"
+        self.next_segment += 1
+        shape = (
+            sum(int(segment.live.sum()) for segment in segments),
+            self.dimensions or 0,
+        )
+        path = None if self.directory is None else self.directory / f"{name}.npy"
+        if path is not None and shape[0]:
+            # Copy the live rows segment by segment into the new memory-mapped file so
+            # that the whole corpus never has to be loaded at once
+            tmp_path = path.with_name(f"{path.name}.tmp")
+            embeddings = np.lib.format.open_memmap(tmp_path, "w+", np.float32, shape)
+        elif self.quantization is not None and shape[0]:
+            embeddings = _temporary_memmap(shape)
+        else:
+            embeddings = np.empty(shape, dtype=np.float32)
+        ids, texts, metadatas = [], [], []
+        codes, scales = [], []
+        offset = 0
+        for segment in segments:
+            rows = np.flatnonzero(segment.live)
+            embeddings[offset : offset + len(rows)] = segment.embeddings[rows]
+            offset += len(rows)
+            ids += [segment.ids[row] for row in rows]
+            texts += [segment.texts[row] for row in rows]
+            metadatas += [segment.metadatas[row] for row in rows]
+            # Codes only depend on their own row, so they are carried over as is
+            if segment.codes is not None:
+                codes.append(segment.codes[rows])
+            if segment.scales is not None:
+                scales.append(segment.scales[rows])
+        compacted = _Segment(name, ids, texts, metadatas, embeddings)
+        if codes:
+            compacted.codes = np.concatenate(codes)
+            compacted.scales = np.concatenate(scales) if scales else None
+
+        if path is not None:
+            assert self.directory is not None
+            if isinstance(embeddings, np.memmap):
+                embeddings.flush()
+                os.replace(path.with_name(f"{path.name}.tmp"), path)
+                compacted.save_documents(self.directory)
+                compacted.save_codes(self.directory)
+            else:
+                compacted.save(self.directory)
+            compacted.embeddings = np.load(path, mmap_mode="r")
+        self.segments = [
+            segment
+            for segment in self.segments
+            if not any(segment is merged for merged in segments)
+        ]
+        self._append(compacted)
+        self._save_manifest()
+        if self.directory is not None:
+            for segment in segments:
+                segment.delete(self.directory)
+
+    def _save_manifest(self) -> None:
+        if self.directory is None:
+            return
+        manifest = {
+            "metric": self.metric,
+            "quantization": self.quantization,
+            "dimensions": self.dimensions,
+            "segments": [segment.name for segment in self.segments],
+            "next_segment": self.next_segment,
+            "deleted": sorted(self.deleted),
+        }
+        _write_atomic(
+            self.directory / _MANIFEST, lambda file: json.dump(manifest, file)
+        )
+
+    def _load(self) -> None:
+        assert self.directory is not None
+        with open(self.directory / _MANIFEST) as file:
+            manifest = json.load(file)
+        if manifest["metric"] != self.metric:
+            raise ValueError(
+                f"The vectorstore in {self.directory} uses the {manifest['metric']} "
+                f"metric, not {self.metric}"
+            )
+        if (quantization := manifest.get("quantization")) != self.quantization:
+            raise ValueError(
+                f"The vectorstore in {self.directory} uses {quantization} "
+                f"quantization, not {self.quantization}"
+            )
+        self.dimensions = manifest["dimensions"]
+        self.next_segment = manifest["next_segment"]
+        for name in manifest["segments"]:
+            self._append(_Segment.load(self.directory, name, self.quantization))
+        for id in manifest.get("deleted", []):
+            self._delete(id)
+
+
+def _open_index(
+    directory: Path | None,
+    metric: Literal["cosine", "dot"],
+    max_segments: int,
+    quantization: Literal["int8", "binary"] | None,
+    rescore_multiplier: int,
+) -> _LocalIndex:
+    """Returns the index persisted in `directory`, sharing it if it's already open.
+
+    Raises:
+        ValueError: If the index is already open with different settings.
+    """
+    settings = (metric, max_segments, quantization, rescore_multiplier)
+    if directory is None:
+        return _LocalIndex(None, *settings)
+    directory = directory.resolve()
+    with _indexes_lock:
+        if (index := _indexes.get(directory)) is None:
+            index = _indexes[directory] = _LocalIndex(directory, *settings)
+        elif (
+            index.metric,
+            index.max_segments,
+            index.quantization,
+            index.rescore_multiplier,
+        ) != settings:
+            raise ValueError(
+                f"The vectorstore in {directory} is already open with different "
+                "vectorstore params"
+            )
+        return index
+
+
+class LocalVectorStore(BaseVectorStore):
+    """An in-process vectorstore built on `float32` NumPy matrices.
+
+    Each add appends a segment (in memory, or as files in `client_settings.path` that
+    are memory-mapped when searched). Documents added again with the same id replace
+    the previous ones and deleted documents are marked as dead. Once there are more
+    than `vectorstore_params.max_segments` segments, the smallest segments of similar
+    size are merged, so that each row is only rewritten a few times as the store grows,
+    and `compact` merges all segments into one. Queries are scored against each segment with a single matrix product.
+    Metadata must be JSON serializable to be persisted. Stores persisted in the same
+    directory share one index, but a directory must not be shared across processes.
+
+    With `vectorstore_params.quantization`, each row also gets an int8 or binary
+    (sign bit) code that is kept in memory and scanned instead of the `float32`
+    embeddings, and only the best candidates are rescored with the memory-mapped
+    embeddings (spilled to an anonymous temporary file for stores without a `path`).
+    For 1536 dimensions, that's 1.5KB (int8) or 192B (binary) of memory per row
+    instead of 6KB.
+
+    Example:
+
+    ```python
+    from mirascope.beta.rag import TextChunker
+    from mirascope.beta.rag.local import LocalSettings, LocalVectorStore
+    from mirascope.beta.rag.openai import OpenAIEmbedder
+
+
+    class MyStore(LocalVectorStore):
+        embedder = OpenAIEmbedder()
+        chunker = TextChunker(chunk_size=1000, chunk_overlap=200)
+        index_name = "my-store-0001"
+        client_settings = LocalSettings(path="./vectorstores")
+
+    my_store = MyStore()
+    with open(f"{PATH_TO_FILE}") as file:
+        data = file.read()
+        my_store.add(data)
+    documents = my_store.retrieve("my question", top_k=4).documents
+    print(documents)
+    ```
+    """
+
+    vectorstore_params: ClassVar[LocalParams] = LocalParams()
+    client_settings: ClassVar[LocalSettings] = LocalSettings()
+    _provider: ClassVar[str] = "local"
+
+    def retrieve(
+        self,
+        text: str,
+        *,
+        top_k: int = 8,
+        filter: MetadataFilter = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> LocalQueryResult:
+        """Queries the vectorstore for closest match
+
+        Args:
+            text: The text to query.
+            top_k: The maximum number of matches to return.
+            filter: Only match documents whose metadata contains these key-value pairs
+                or for whose metadata this function returns `True`.
+        """
+        return self.retrieve_many([text], top_k=top_k, filter=filter)[0]
+
+    def retrieve_many(
+        self,
+        texts: list[str],
+        *,
+        top_k: int = 8,
+        filter: MetadataFilter = None,
+    ) -> list[LocalQueryResult]:
+        """Queries the vectorstore for the closest matches of several texts at once.
+
+        The texts are embedded in a single call and scored in a single matrix product
+        per segment.
+        """
+        if not texts:
+            return []
+        matches = self._index.search(self._embed(texts), top_k, filter)
+        return [
+            LocalQueryResult(
+                ids=[segment.ids[row] for _, segment, row in query_matches],
+                scores=[score for score, _, _ in query_matches],
+                documents=[segment.texts[row] for _, segment, row in query_matches],
+                metadatas=[segment.metadatas[row] for _, segment, row in query_matches],
+            )
+            for query_matches in matches
+        ]
+
+    def add(self, text: str | list[Document], **kwargs: Any) -> None:  # noqa: ANN401
+        """Takes unstructured data and upserts into vectorstore"""
+        documents: list[Document]
+        if isinstance(text, str):
+            chunk = self.chunker.chunk
+            documents = chunk(text)
+        else:
+            documents = text
+        if not documents:
+            return
+        embeddings = self._embed([document.text for document in documents])
+        self._index.add(documents, embeddings)
+
+    def compact(self) -> None:
+        """Merges all segments into one, dropping the rows of replaced documents."""
+        self._index.compact()
+
+    def delete(self, ids: list[str], **kwargs: Any) -> None:  # noqa: ANN401
+        """Deletes the documents with `ids` from the vectorstore"""
+        self._index.delete(ids)
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _embed(self, texts: list[str]) -> NDArray[np.float32]:
+        embeddings = self.embedder.embed(texts).embeddings_array
+        if embeddings is None:
+            raise ValueError("Embedding is None")
+        return np.asarray(embeddings, dtype=np.float32).reshape(len(texts), -1)
+
+    ############################# PRIVATE PROPERTIES #################################
+
+    @cached_property
+    def _index(self) -> _LocalIndex:
+        directory = None
+        if (path := self.client_settings.path) is not None:
+            directory = Path(path)
+            if self.index_name:
+                directory /= self.index_name
+        return _open_index(
+            directory,
+            self.vectorstore_params.metric,
+            self.vectorstore_params.max_segments,
+            self.vectorstore_params.quantization,
+            self.vectorstore_params.rescore_multiplier,
+        )
@@ -2,17 +2,51 @@
 
 import asyncio
 import datetime
+import os
+import threading
+from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
-from typing import ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from openai import AsyncOpenAI, OpenAI
 from openai.types import Embedding
 from openai.types.create_embedding_response import CreateEmbeddingResponse, Usage
 
+from ....core.base.client_pool import (
+    create_async_http_client,
+    create_http_client,
+    get_default_client,
+)
 from ..base.embedders import BaseEmbedder
 from .embedding_params import OpenAIEmbeddingParams
 from .embedding_response import OpenAIEmbeddingResponse
 
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+_executors: dict[int | None, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def _get_executor(max_workers: int | None) -> ThreadPoolExecutor:
+    """Returns the shared executor with `max_workers` threads, creating it if needed."""
+    with _executors_lock:
+        if max_workers not in _executors:
+            _executors[max_workers] = ThreadPoolExecutor(
+                max_workers, thread_name_prefix="mirascope-embed"
+            )
+        return _executors[max_workers]
+
+
+def _max_tokens(text: str) -> int:
+    """Bounds the number of tokens in `text` by its number of UTF-8 bytes.
+
+    Every token of OpenAI's byte-level BPE encodings covers at least one byte, so this
+    never underestimates, even for CJK text or code (~1 token per character).
+    """
+    return len(text.encode())
+
 
 class OpenAIEmbedder(BaseEmbedder[OpenAIEmbeddingResponse]):
     """OpenAI Embedder
@@ -29,11 +63,26 @@ class OpenAIEmbedder(BaseEmbedder[OpenAIEmbeddingResponse]):
     response = openai_embedder.embed(["your text to embed"])
     print(response)
     ```
+
+    Inputs are embedded in batches of at most `embed_batch_size` inputs and
+    `max_batch_tokens` tokens, which stays below OpenAI's per-request token limit.
+    Tokens are bounded by the number of UTF-8 bytes of each input unless `tokenizer`
+    counts them exactly, e.g. with `tiktoken`:
+
+    ```python
+    import tiktoken
+
+    encoding = tiktoken.get_encoding("cl100k_base")
+    openai_embedder = OpenAIEmbedder(tokenizer=lambda text: len(encoding.encode(text)))
+    ```
     """
 
     dimensions: int | None = 1536
-    embed_batch_size: int | None = 20
+    embed_batch_size: int | None = 2048
+    max_batch_tokens: int | None = 250_000
+    tokenizer: Callable[[str], int] | None = None
     max_workers: int | None = 64
+    max_concurrency: int | None = 16
     embedding_params: ClassVar[OpenAIEmbeddingParams] = OpenAIEmbeddingParams(
         model="text-embedding-3-small"
     )
@@ -44,16 +93,11 @@ class OpenAIEmbedder(BaseEmbedder[OpenAIEmbeddingResponse]):
         if self.embed_batch_size is None:
             return self._embed(inputs)
 
-        input_batches = [
-            inputs[i : i + self.embed_batch_size]
-            for i in range(0, len(inputs), self.embed_batch_size)
-        ]
-
+        input_batches = self._batch_inputs(inputs)
+        if len(input_batches) == 1:
+            return self._embed(input_batches[0])
         embedding_responses: list[OpenAIEmbeddingResponse] = list(
-            ThreadPoolExecutor(self.max_workers).map(
-                lambda inputs: self._embed(inputs),
-                input_batches,
-            )
+            _get_executor(self.max_workers).map(self._embed, input_batches)
         )
         return self._merge_batch_embeddings(embedding_responses)
 
@@ -62,32 +106,112 @@ class OpenAIEmbedder(BaseEmbedder[OpenAIEmbeddingResponse]):
         if self.embed_batch_size is None:
             return await self._embed_async(inputs)
 
-        input_batches = [
-            inputs[i : i + self.embed_batch_size]
-            for i in range(0, len(inputs), self.embed_batch_size)
-        ]
-        embedding_responses: list[OpenAIEmbeddingResponse] = await asyncio.gather(
-            *[self._embed_async(inputs) for inputs in input_batches]
-        )
+        input_batches = self._batch_inputs(inputs)
+        if len(input_batches) == 1:
+            return await self._embed_async(input_batches[0])
+        if self.max_concurrency is None:
+            embedding_responses: list[OpenAIEmbeddingResponse] = await asyncio.gather(
+                *[self._embed_async(inputs) for inputs in input_batches]
+            )
+        else:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async def embed_batch(inputs: list[str]) -> OpenAIEmbeddingResponse:
+                async with semaphore:
+                    return await self._embed_async(inputs)
+
+            embedding_responses = await asyncio.gather(
+                *[embed_batch(inputs) for inputs in input_batches]
+            )
         return self._merge_batch_embeddings(embedding_responses)
 
-    def __call__(self, input: list[str]) -> list[list[float]]:
+    def __call__(
+        self, input: list[str]
+    ) -> list[list[float]] | list["NDArray[np.float32]"]:
         """Call the embedder with a input
 
         Chroma expects parameter to be `input`.
         """
         embedding_response = self.embed(input)
+        if self.use_numpy:
+            return list(embedding_response.embeddings_array)
 
         return embedding_response.embeddings
 
     ############################## PRIVATE METHODS ###################################
 
-    def _embed(self, inputs: list[str]) -> OpenAIEmbeddingResponse:
-        """Call the embedder with a single input"""
-        client = OpenAI(api_key=self.api_key, base_url=self.base_url)
+    def _batch_inputs(self, inputs: list[str]) -> list[list[str]]:
+        """Splits `inputs` into batches of at most `embed_batch_size` inputs and
+        `max_batch_tokens` tokens (as counted by `tokenizer`, or bounded by bytes).
+
+        An input that exceeds `max_batch_tokens` on its own gets a batch of its own.
+        """
+        batch_size = self.embed_batch_size or len(inputs) or 1
+        if self.max_batch_tokens is None:
+            return [
+                inputs[i : i + batch_size] for i in range(0, len(inputs), batch_size)
+            ]
+
+        input_batches: list[list[str]] = []
+        batch: list[str] = []
+        batch_tokens = 0
+        count_tokens = self.tokenizer or _max_tokens
+        for text in inputs:
+            tokens = count_tokens(text)
+            if batch and (
+                len(batch) >= batch_size
+                or batch_tokens + tokens > self.max_batch_tokens
+            ):
+                input_batches.append(batch)
+                batch, batch_tokens = [], 0
+            batch.append(text)
+            batch_tokens += tokens
+        if batch or not input_batches:
+            input_batches.append(batch)
+        return input_batches
+
+    def _get_client(self) -> OpenAI:
+        """Returns the pooled client for this embedder's API key and base URL."""
+        return get_default_client(
+            "openai",
+            False,
+            lambda: OpenAI(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                http_client=create_http_client(),
+            ),
+            base_url=self.base_url or os.environ.get("OPENAI_BASE_URL"),
+            api_key=self.api_key or os.environ.get("OPENAI_API_KEY"),
+        )
+
+    def _get_async_client(self) -> AsyncOpenAI:
+        """Returns the pooled async client for the running event loop."""
+        return get_default_client(
+            "openai",
+            True,
+            lambda: AsyncOpenAI(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                http_client=create_async_http_client(),
+            ),
+            base_url=self.base_url or os.environ.get("OPENAI_BASE_URL"),
+            api_key=self.api_key or os.environ.get("OPENAI_API_KEY"),
+        )
+
+    def _get_create_kwargs(self) -> dict[str, Any]:
+        """Returns the keyword arguments for creating embeddings."""
         kwargs = self.embedding_params.kwargs()
         if self.embedding_params.model != "text-embedding-ada-002":
             kwargs["dimensions"] = self.dimensions
+        if self.use_numpy and "encoding_format" not in kwargs:
+            # Raw little-endian float32 bytes decode straight into NumPy arrays
+            kwargs["encoding_format"] = "base64"
+        return kwargs
+
+    def _embed(self, inputs: list[str]) -> OpenAIEmbeddingResponse:
+        """Call the embedder with a single input"""
+        client = self._get_client()
+        kwargs = self._get_create_kwargs()
         start_time = datetime.datetime.now().timestamp() * 1000
         embeddings = client.embeddings.create(input=inputs, **kwargs)
         return OpenAIEmbeddingResponse(
@@ -98,10 +222,8 @@ class OpenAIEmbedder(BaseEmbedder[OpenAIEmbeddingResponse]):
 
     async def _embed_async(self, inputs: list[str]) -> OpenAIEmbeddingResponse:
         """Asynchronously call the embedder with a single input"""
-        client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
-        kwargs = self.embedding_params.kwargs()
-        if self.embedding_params.model != "text-embedding-ada-002":
-            kwargs["dimensions"] = self.dimensions
+        client = self._get_async_client()
+        kwargs = self._get_create_kwargs()
         start_time = datetime.datetime.now().timestamp() * 1000
         embeddings = await client.embeddings.create(input=inputs, **kwargs)
         return OpenAIEmbeddingResponse(
@@ -1,8 +1,16 @@
+import base64
+from functools import cached_property
+from typing import TYPE_CHECKING
+
 from openai.types import Embedding
 from openai.types.create_embedding_response import CreateEmbeddingResponse
 
 from ..base.embedding_response import BaseEmbeddingResponse
 
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
 
 class OpenAIEmbeddingResponse(BaseEmbeddingResponse[CreateEmbeddingResponse]):
     """A convenience wrapper around the OpenAI `CreateEmbeddingResponse` response."""
@@ -11,4 +19,26 @@ class OpenAIEmbeddingResponse(BaseEmbeddingResponse[CreateEmbeddingResponse]):
     def embeddings(self) -> list[list[float]]:
         """Returns the raw embeddings."""
         embeddings_model: list[Embedding] = list(self.response.data)
+        if embeddings_model and isinstance(embeddings_model[0].embedding, str):
+            return self.embeddings_array.tolist()
         return [embedding.embedding for embedding in embeddings_model]
+
+    @cached_property
+    def embeddings_array(self) -> "NDArray[np.float32]":
+        """Returns the embeddings as a 2D `float32` NumPy array (requires `numpy`).
+
+        Embeddings requested with `encoding_format="base64"` are decoded straight into
+        one contiguous buffer without ever materializing Python floats.
+        """
+        import numpy as np
+
+        data = self.response.data
+        if not data or not isinstance(data[0].embedding, str):
+            return np.asarray(
+                [embedding.embedding for embedding in data], dtype=np.float32
+            )
+        buffer = b"".join(
+            base64.b64decode(embedding.embedding)  # pyright: ignore [reportArgumentType]
+            for embedding in data
+        )
+        return np.frombuffer(buffer, dtype="<f4").reshape(len(data), -1)
@@ -4,7 +4,7 @@ from typing import Any, Literal
 
 from pinecone.config import Config
 from pinecone.core.client.api.manage_indexes_api import ManageIndexesApi
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, SkipValidation
 
 from ..vectorstore_params import BaseVectorStoreParams
 
@@ -140,4 +140,5 @@ class PineconeQueryResult(BaseModel):
     ids: list[str]
     documents: list[str] | None = None
     scores: list[float] | None = None
-    embeddings: list[list[float]] | None = None
+    # Lists of floats, or `float32` NumPy rows if the embedder uses NumPy
+    embeddings: SkipValidation[list[Any] | None] = None
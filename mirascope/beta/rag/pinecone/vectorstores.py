@@ -67,16 +67,21 @@ class PineconeVectorStore(BaseVectorStore):
         text_embedding: BaseEmbeddingResponse = embed([text])
         if "top_k" not in kwargs:
             kwargs["top_k"] = 8
-        if text_embedding.embeddings is None:
+        query_embeddings = (
+            text_embedding.embeddings_array
+            if self.embedder.use_numpy
+            else text_embedding.embeddings
+        )
+        if query_embeddings is None:
             raise ValueError("Embedding is None")
         query_result: QueryResponse = self._index.query(
-            vector=text_embedding.embeddings[0],
+            vector=query_embeddings[0],
             **{"include_metadata": True, "include_values": True, **kwargs},
         )
         ids: list[str] = []
         scores: list[float] = []
         documents: list[str] = []
-        embeddings: list[list[float]] = []
+        embeddings: list[Any] = []
         for match in query_result.matches:
             ids.append(match.id)
             scores.append(match.score)
@@ -86,6 +91,11 @@ class PineconeVectorStore(BaseVectorStore):
                 else match.metadata["text"]
             )
             embeddings.append(match.values)
+        if self.embedder.use_numpy and embeddings:
+            import numpy as np
+
+            # One contiguous `float32` buffer with a row view per match
+            embeddings = list(np.asarray(embeddings, dtype=np.float32))
 
         return PineconeQueryResult(
             ids=ids,
@@ -111,10 +121,16 @@ class PineconeVectorStore(BaseVectorStore):
         embedding_repsonse: BaseEmbeddingResponse = embed(inputs)
         if self.handle_add_text:
             self.handle_add_text(documents)
-        if embedding_repsonse.embeddings is None:
+        # Pinecone converts NumPy rows with `tolist()` itself when upserting
+        embeddings = (
+            embedding_repsonse.embeddings_array
+            if self.embedder.use_numpy
+            else embedding_repsonse.embeddings
+        )
+        if embeddings is None:
             raise ValueError("Embedding is None")
         vectors = []
-        for i, embedding in enumerate(embedding_repsonse.embeddings):
+        for i, embedding in enumerate(embeddings):
             if documents[i] is not None:
                 metadata = documents[i].metadata or {}
                 metadata_text = (
@@ -131,6 +147,10 @@ class PineconeVectorStore(BaseVectorStore):
                 )
         return self._index.upsert(vectors, **kwargs)
 
+    def delete(self, ids: list[str], **kwargs: Any) -> None:  # noqa: ANN401
+        """Deletes the documents with `ids` from the vectorstore"""
+        self._index.delete(ids=ids, **kwargs)
+
     ############################# PRIVATE PROPERTIES #################################
 
     @cached_property
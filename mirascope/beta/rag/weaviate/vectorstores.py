@@ -73,6 +73,12 @@ class WeaviateVectorStore(BaseVectorStore):
 
         return WeaviateQueryResult.from_response(result)
 
+    def delete(self, ids: list[str], **kwargs: Any) -> None:  # noqa: ANN401
+        """Deletes the documents with `ids` from the vectorstore"""
+        self._index.data.delete_many(
+            where=wvc.query.Filter.by_id().contains_any(ids), **kwargs
+        )
+
     def close_connection(self) -> None:
         self._client.close()
 
@@ -1,6 +1,8 @@
 """The Mirascope Core Functionality."""
 
-from contextlib import suppress
+import importlib
+from types import ModuleType
+from typing import TYPE_CHECKING
 
 from . import base, costs
 from .base import (
@@ -14,6 +16,7 @@ from .base import (
     BaseTool,
     BaseToolKit,
     CacheControlPart,
+    ClientPoolConfig,
     CostMetadata,
     DocumentPart,
     DocumentURLPart,
@@ -25,8 +28,12 @@ from .base import (
     Provider,
     ResponseModelConfigDict,
     TextPart,
+    Timings,
     ToolCallPart,
     ToolResultPart,
+    aclose_client_pool,
+    clear_client_pool,
+    configure_client_pool,
     merge_decorators,
     metadata,
     prompt_template,
@@ -34,35 +41,54 @@ from .base import (
 )
 from .costs import calculate_cost
 
-with suppress(ImportError):
-    from . import anthropic as anthropic
+if TYPE_CHECKING:
+    from . import (
+        anthropic,
+        azure,
+        cohere,
+        gemini,
+        google,
+        groq,
+        litellm,
+        mistral,
+        openai,
+        vertex,
+    )
 
-with suppress(ImportError):
-    from . import cohere as cohere
-
-with suppress(ImportError):
-    from . import google as google
-
-with suppress(ImportError):
-    from . import gemini as gemini
-
-with suppress(ImportError):
-    from . import groq as groq
+# Provider subpackages import their SDKs, so they are only loaded on first access
+_PROVIDER_MODULES = frozenset(
+    {
+        "anthropic",
+        "azure",
+        "cohere",
+        "gemini",
+        "google",
+        "groq",
+        "litellm",
+        "mistral",
+        "openai",
+        "vertex",
+    }
+)
 
-with suppress(ImportError):
-    from . import litellm as litellm
 
-with suppress(ImportError):
-    from . import mistral as mistral
+def __getattr__(name: str) -> ModuleType:
+    if name in _PROVIDER_MODULES:
+        try:
+            module = importlib.import_module(f".{name}", __name__)
+        except ImportError as e:
+            # Match the previous behavior where uninstalled providers are missing
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from e
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-with suppress(ImportError):
-    from . import openai as openai
 
-with suppress(ImportError):
-    from . import vertex as vertex
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_PROVIDER_MODULES})
 
-with suppress(ImportError):
-    from . import azure as azure
 
 __all__ = [
     "AudioPart",
@@ -76,6 +102,7 @@ __all__ = [
     "BaseTool",
     "BaseToolKit",
     "CacheControlPart",
+    "ClientPoolConfig",
     "CostMetadata",
     "DocumentPart",
     "DocumentURLPart",
@@ -87,13 +114,17 @@ __all__ = [
     "Provider",
     "ResponseModelConfigDict",
     "TextPart",
+    "Timings",
     "ToolCallPart",
     "ToolResultPart",
+    "aclose_client_pool",
     "anthropic",
     "azure",
     "base",
     "calculate_cost",
+    "clear_client_pool",
     "cohere",
+    "configure_client_pool",
     "costs",
     "gemini",
     "google",
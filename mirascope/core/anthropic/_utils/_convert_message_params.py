@@ -1,12 +1,12 @@
 """Utility for converting `BaseMessageParam` to `MessageParam`"""
 
-import base64
-
 from anthropic.types import MessageParam
 
 from ...base import BaseMessageParam
+from ...base._utils import cache_message_conversion, encode_base64
 
 
+@cache_message_conversion
 def convert_message_params(
     message_params: list[BaseMessageParam | MessageParam],
 ) -> list[MessageParam]:
@@ -39,7 +39,7 @@ def convert_message_params(
                         {
                             "type": "image",
                             "source": {
-                                "data": base64.b64encode(part.image).decode("utf-8"),
+                                "data": encode_base64(part.image),
                                 "media_type": part.media_type,
                                 "type": "base64",
                             },
@@ -62,7 +62,7 @@ def convert_message_params(
                         {
                             "type": "document",
                             "source": {
-                                "data": base64.b64encode(part.document).decode("utf-8"),
+                                "data": encode_base64(part.document),
                                 "media_type": part.media_type,
                                 "type": "base64",
                             },
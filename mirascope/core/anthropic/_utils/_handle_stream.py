@@ -5,73 +5,125 @@ from collections.abc import AsyncGenerator, Generator
 import jiter
 from anthropic.types import MessageStreamEvent, ToolUseBlock
 
+from ...base._utils._lazy_partial_tool import (
+    defer_tool_call,
+    lazy_partial_tool_type,
+)
+from ...base._utils._partial_json_parser import PartialJsonParser
 from ..call_response_chunk import AnthropicCallResponseChunk
 from ..tool import AnthropicTool
 
 
+class _ToolUseState:
+    """The accumulated state of a single streamed tool use block."""
+
+    def __init__(self, id: str, name: str, tool_type: type[AnthropicTool]) -> None:
+        self.id = id
+        self.name = name
+        self.tool_type = tool_type
+        self.input: list[str] = []
+        self.length = 0
+        # Parses the input incrementally so partial tools don't re-parse it
+        self.parser: PartialJsonParser | None = PartialJsonParser()
+        self.partial_tool: AnthropicTool | None = None
+
+    def feed(self, partial_json: str) -> bool:
+        """Adds the streamed `partial_json`, returning whether the parsed input changed."""
+        self.input.append(partial_json)
+        self.length += len(partial_json)
+        if self.parser is None:
+            return True
+        try:
+            return self.parser.feed(partial_json)
+        except ValueError:
+            # Fall back to `from_tool_call` so that errors surface as before
+            self.parser = None
+            return True
+
+    def tool(self) -> AnthropicTool:
+        if self.parser is not None and self.parser.done and self.parser.value:
+            tool_input = self.parser.value
+        else:
+            buffer = self._input()
+            tool_input = jiter.from_json(buffer.encode()) if buffer else {}
+        return self.tool_type.from_tool_call(
+            ToolUseBlock(id=self.id, input=tool_input, name=self.name, type="tool_use")
+        )
+
+    def partial_tool_for(self, delta: str, changed: bool) -> AnthropicTool:
+        """Returns the partial tool after `delta`.
+
+        The `tool_call` of partial tools carries the input accumulated so far as the
+        raw JSON string. It is only constructed once it's read so that streaming
+        doesn't join the input for every delta, and only the fields that changed are
+        validated again.
+        """
+        if self.parser is None:
+            partial_tool = self.tool_type.from_tool_call(self._tool_call(), True)
+        elif self.partial_tool is None:
+            partial_tool = lazy_partial_tool_type(self.tool_type).model_validate(
+                {"tool_call": self._tool_call()} | (self.parser.snapshot() or {})
+            )
+        else:
+            partial_tool = self.partial_tool.model_copy()
+            if changed and (snapshot := self.parser.snapshot()) is not None:
+                validator = partial_tool.__pydantic_validator__
+                for key in (
+                    self.parser.changed_keys & self.tool_type.model_fields.keys()
+                ):
+                    validator.validate_assignment(partial_tool, key, snapshot[key])
+            length = self.length
+            defer_tool_call(partial_tool, lambda: self._tool_call(length))
+        partial_tool.delta = delta
+        self.partial_tool = partial_tool
+        return partial_tool
+
+    def _tool_call(self, length: int | None = None) -> ToolUseBlock:
+        """Returns the tool use block with the first `length` characters of the input."""
+        return ToolUseBlock.model_construct(
+            id=self.id, input=self._input()[:length], name=self.name, type="tool_use"
+        )
+
+    def _input(self) -> str:
+        # Collapse the buffer so that joining again only joins the new input
+        self.input[:] = ["".join(self.input)]
+        return self.input[0]
+
+
 def _handle_chunk(
-    buffer: str,
+    state: _ToolUseState | None,
     chunk: MessageStreamEvent,
-    current_tool_call: ToolUseBlock,
-    current_tool_type: type[AnthropicTool] | None,
-    tool_types: list[type[AnthropicTool]] | None,
+    tool_types_by_name: dict[str, type[AnthropicTool]] | None,
     partial_tools: bool = False,
-) -> tuple[
-    str,
-    AnthropicTool | None,
-    ToolUseBlock,
-    type[AnthropicTool] | None,
-]:
+) -> tuple[_ToolUseState | None, AnthropicTool | None]:
     """Handles a chunk of the stream."""
-    if not tool_types:
-        return buffer, None, current_tool_call, current_tool_type
-
-    if chunk.type == "content_block_stop" and current_tool_type and buffer:
-        current_tool_call.input = jiter.from_json(buffer.encode())
-        return (
-            "",
-            current_tool_type.from_tool_call(current_tool_call),
-            ToolUseBlock(id="", input={}, name="", type="tool_use"),
-            None,
-        )
+    if not tool_types_by_name:
+        return state, None
+
+    if chunk.type == "content_block_stop" and state is not None:
+        return None, state.tool()
 
     if chunk.type == "content_block_start" and isinstance(
         chunk.content_block, ToolUseBlock
     ):
         content_block = chunk.content_block
-        current_tool_type = None
-        for tool_type in tool_types:
-            if tool_type._name() == content_block.name:
-                current_tool_type = tool_type
-                break
-        if current_tool_type is None:
+        if (tool_type := tool_types_by_name.get(content_block.name)) is None:
             raise RuntimeError(
                 f"Unknown tool type in stream: {content_block.name}."
             )  # pragma: no cover
-        return (
-            "",
-            None,
-            ToolUseBlock(
-                id=content_block.id, input={}, name=content_block.name, type="tool_use"
-            ),
-            current_tool_type,
-        )
+        return _ToolUseState(content_block.id, content_block.name, tool_type), None
 
-    if chunk.type == "content_block_delta" and chunk.delta.type == "input_json_delta":
-        buffer += chunk.delta.partial_json
+    if (
+        chunk.type == "content_block_delta"
+        and chunk.delta.type == "input_json_delta"
+        and state is not None
+    ):
+        changed = state.feed(chunk.delta.partial_json)
 
         # Return partial tool if enabled
-        if partial_tools and current_tool_type:
-            partial_tool_call = ToolUseBlock(
-                id=current_tool_call.id,
-                input=buffer,
-                name=current_tool_call.name,
-                type="tool_use",
-            )
-            partial_tool = current_tool_type.from_tool_call(partial_tool_call, True)
-            partial_tool.delta = chunk.delta.partial_json
-            return buffer, partial_tool, current_tool_call, current_tool_type
-    return buffer, None, current_tool_call, current_tool_type
+        if partial_tools:
+            return state, state.partial_tool_for(chunk.delta.partial_json, changed)
+    return state, None
 
 
 def handle_stream(
@@ -80,17 +132,12 @@ def handle_stream(
     partial_tools: bool = False,
 ) -> Generator[tuple[AnthropicCallResponseChunk, AnthropicTool | None], None, None]:
     """Iterator over the stream and constructs tools as they are streamed."""
-    current_tool_call = ToolUseBlock(id="", input={}, name="", type="tool_use")
-    current_tool_type, buffer = None, ""
+    tool_types_by_name = {
+        tool_type._name(): tool_type for tool_type in tool_types or []
+    }
+    state = None
     for chunk in stream:
-        buffer, tool, current_tool_call, current_tool_type = _handle_chunk(
-            buffer,
-            chunk,
-            current_tool_call,
-            current_tool_type,
-            tool_types,
-            partial_tools,
-        )
+        state, tool = _handle_chunk(state, chunk, tool_types_by_name, partial_tools)
         yield AnthropicCallResponseChunk(chunk=chunk), tool
 
 
@@ -99,15 +146,10 @@ async def handle_stream_async(
     tool_types: list[type[AnthropicTool]] | None,
     partial_tools: bool = False,
 ) -> AsyncGenerator[tuple[AnthropicCallResponseChunk, AnthropicTool | None], None]:
-    current_tool_call = ToolUseBlock(id="", input={}, name="", type="tool_use")
-    current_tool_type, buffer = None, ""
+    tool_types_by_name = {
+        tool_type._name(): tool_type for tool_type in tool_types or []
+    }
+    state = None
     async for chunk in stream:
-        buffer, tool, current_tool_call, current_tool_type = _handle_chunk(
-            buffer,
-            chunk,
-            current_tool_call,
-            current_tool_type,
-            tool_types,
-            partial_tools,
-        )
+        state, tool = _handle_chunk(state, chunk, tool_types_by_name, partial_tools)
         yield AnthropicCallResponseChunk(chunk=chunk), tool
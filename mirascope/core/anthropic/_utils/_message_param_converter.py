@@ -16,6 +16,9 @@ from mirascope.core.base import (
 from mirascope.core.base._utils._base_message_param_converter import (
     BaseMessageParamConverter,
 )
+from mirascope.core.base._utils._cache_message_conversion import (
+    cache_message_conversion,
+)
 
 
 class AnthropicMessageParamConverter(BaseMessageParamConverter):
@@ -31,6 +34,7 @@ class AnthropicMessageParamConverter(BaseMessageParamConverter):
         )
 
     @staticmethod
+    @cache_message_conversion
     def from_provider(message_params: list[MessageParam]) -> list[BaseMessageParam]:
         """
         Convert from Anthropic's `MessageParam` back to Mirascope `BaseMessageParam`.
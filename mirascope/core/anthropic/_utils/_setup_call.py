@@ -1,6 +1,7 @@
 """This module contains the setup_call function for the Anthropic API."""
 
 import inspect
+import os
 from collections.abc import Awaitable, Callable
 from typing import Any, cast, overload
 
@@ -17,6 +18,11 @@ from pydantic import BaseModel
 
 from ...base import BaseMessageParam, BaseTool, _utils
 from ...base._utils import AsyncCreateFn, CreateFn
+from ...base.client_pool import (
+    create_async_http_client,
+    create_http_client,
+    get_default_client,
+)
 from ...base.stream_config import StreamConfig
 from .._call_kwargs import AnthropicCallKwargs
 from .._thinking import HAS_THINKING_SUPPORT
@@ -141,6 +147,19 @@ def setup_call(
     }
 
     if client is None:
-        client = AsyncAnthropic() if inspect.iscoroutinefunction(fn) else Anthropic()
+        is_async = inspect.iscoroutinefunction(fn)
+
+        def create_client() -> Anthropic | AsyncAnthropic:
+            if is_async:
+                return AsyncAnthropic(http_client=create_async_http_client())
+            return Anthropic(http_client=create_http_client())
+
+        client = get_default_client(
+            "anthropic",
+            is_async,
+            create_client,
+            base_url=os.environ.get("ANTHROPIC_BASE_URL"),
+            api_key=os.environ.get("ANTHROPIC_API_KEY"),
+        )
     create = client.messages.create
     return create, prompt_template, messages, tool_types, call_kwargs
@@ -196,6 +196,7 @@ class AnthropicStream(
             user_message_param=self.user_message_param,
             start_time=self.start_time,
             end_time=self.end_time,
+            timings=self.timings,
         )
 
     @property
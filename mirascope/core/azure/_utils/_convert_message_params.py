@@ -1,6 +1,5 @@
 """Utility for converting `BaseMessageParam` to `ChatRequestMessage`."""
 
-import base64
 import json
 from typing import cast
 
@@ -14,8 +13,10 @@ from azure.ai.inference.models import (
 )
 
 from ...base import BaseMessageParam
+from ...base._utils import cache_message_conversion, encode_base64
 
 
+@cache_message_conversion
 def convert_message_params(
     message_params: list[BaseMessageParam | ChatRequestMessage],
 ) -> list[ChatRequestMessage]:
@@ -41,7 +42,7 @@ def convert_message_params(
                             f"Unsupported image media type: {part.media_type}. Azure"
                             " currently only supports JPEG, PNG, GIF, and WebP images."
                         )
-                    data = base64.b64encode(part.image).decode("utf-8")
+                    data = encode_base64(part.image)
                     converted_content.append(
                         {
                             "type": "image_url",
@@ -1,6 +1,5 @@
 """Handles the stream of completion chunks."""
 
-import copy
 from collections.abc import AsyncGenerator, Generator
 
 from azure.ai.inference.models import (
@@ -13,19 +12,42 @@ from ..call_response_chunk import AzureCallResponseChunk
 from ..tool import AzureTool
 
 
+def _construct_tool(
+    tool_type: type[AzureTool],
+    tool_call: ChatCompletionsToolCall,
+    arguments: list[str],
+) -> AzureTool:
+    """Constructs the tool from `tool_call` and the accumulated `arguments`."""
+    tool = tool_type.from_tool_call(
+        ChatCompletionsToolCall(
+            id=tool_call.id,
+            function=FunctionCall(
+                arguments="".join(arguments), name=tool_call.function.name
+            ),
+        )
+    )
+    arguments.clear()
+    return tool
+
+
 def _handle_chunk(
     chunk: StreamingChatCompletionsUpdate,
     current_tool_call: ChatCompletionsToolCall,
     current_tool_type: type[AzureTool] | None,
-    tool_types: list[type[AzureTool]] | None,
+    tool_types_by_name: dict[str, type[AzureTool]],
+    arguments: list[str],
 ) -> tuple[
     AzureTool | None,
     ChatCompletionsToolCall,
     type[AzureTool] | None,
 ]:
-    """Handles a chunk of the stream."""
+    """Handles a chunk of the stream.
+
+    The streamed arguments are accumulated in `arguments` and only joined once the
+    tool is constructed so that accumulating them stays linear.
+    """
     if (
-        not tool_types
+        not tool_types_by_name
         or not chunk.choices
         or not (tool_calls := chunk.choices[0].delta.tool_calls)
     ):
@@ -34,7 +56,7 @@ def _handle_chunk(
     tool_call = tool_calls[0]
     # Reset on new tool
     if tool_call.id and tool_call.function is not None:
-        previous_tool_call = copy.deepcopy(current_tool_call)
+        previous_tool_call = current_tool_call
         previous_tool_type = current_tool_type
         current_tool_call = ChatCompletionsToolCall(
             id=tool_call.id,
@@ -43,29 +65,22 @@ def _handle_chunk(
                 name=tool_call.function.name if tool_call.function.name else "",
             ),
         )
-        current_tool_type = None
-        for tool_type in tool_types:
-            if tool_type._name() == tool_call.function.name:
-                current_tool_type = tool_type
-                break
+        current_tool_type = tool_types_by_name.get(tool_call.function.name or "")
         if current_tool_type is None:
             raise RuntimeError(
                 f"Unknown tool type in stream: {tool_call.function.name}"
             )  # pragma: no cover
-        if (
-            previous_tool_call.id
-            and previous_tool_call.function.arguments
-            and previous_tool_type is not None
-        ):
+        if previous_tool_call.id and arguments and previous_tool_type is not None:
             return (
-                previous_tool_type.from_tool_call(previous_tool_call),
+                _construct_tool(previous_tool_type, previous_tool_call, arguments),
                 current_tool_call,
                 current_tool_type,
             )
+        arguments.clear()
 
     # Update arguments with each chunk
     if tool_call.function and tool_call.function.arguments:
-        current_tool_call.function.arguments += tool_call.function.arguments
+        arguments.append(tool_call.function.arguments)
 
     return None, current_tool_call, current_tool_type
 
@@ -76,16 +91,20 @@ def handle_stream(
     partial_tools: bool = False,
 ) -> Generator[tuple[AzureCallResponseChunk, AzureTool | None], None, None]:
     """Iterator over the stream and constructs tools as they are streamed."""
+    tool_types_by_name = {
+        tool_type._name(): tool_type for tool_type in tool_types or []
+    }
     current_tool_call = ChatCompletionsToolCall(
         id="", function=FunctionCall(arguments="", name="")
     )
     current_tool_type = None
+    arguments: list[str] = []
     for chunk in stream:
         if not tool_types or not chunk.choices or not chunk.choices[0].delta.tool_calls:
             if current_tool_type:
                 yield (
                     AzureCallResponseChunk(chunk=chunk),
-                    current_tool_type.from_tool_call(current_tool_call),
+                    _construct_tool(current_tool_type, current_tool_call, arguments),
                 )
                 current_tool_type = None
             else:
@@ -94,7 +113,8 @@ def handle_stream(
             chunk,
             current_tool_call,
             current_tool_type,
-            tool_types,
+            tool_types_by_name,
+            arguments,
         )
         if tool is not None:
             yield AzureCallResponseChunk(chunk=chunk), tool
@@ -106,16 +126,20 @@ async def handle_stream_async(
     partial_tools: bool = False,
 ) -> AsyncGenerator[tuple[AzureCallResponseChunk, AzureTool | None], None]:
     """Async iterator over the stream and constructs tools as they are streamed."""
+    tool_types_by_name = {
+        tool_type._name(): tool_type for tool_type in tool_types or []
+    }
     current_tool_call = ChatCompletionsToolCall(
         id="", function=FunctionCall(arguments="", name="")
     )
     current_tool_type = None
+    arguments: list[str] = []
     async for chunk in stream:
         if not tool_types or not chunk.choices[0].delta.tool_calls:
             if current_tool_type:
                 yield (
                     AzureCallResponseChunk(chunk=chunk),
-                    current_tool_type.from_tool_call(current_tool_call),
+                    _construct_tool(current_tool_type, current_tool_call, arguments),
                 )
                 current_tool_type = None
             else:
@@ -124,7 +148,8 @@ async def handle_stream_async(
             chunk,
             current_tool_call,
             current_tool_type,
-            tool_types,
+            tool_types_by_name,
+            arguments,
         )
         if tool is not None:
             yield AzureCallResponseChunk(chunk=chunk), tool
@@ -22,6 +22,9 @@ from mirascope.core.base import (
 from mirascope.core.base._utils._base_message_param_converter import (
     BaseMessageParamConverter,
 )
+from mirascope.core.base._utils._cache_message_conversion import (
+    cache_message_conversion,
+)
 
 
 def _parse_content(content: list[ContentItem]) -> list[TextPart | ImageURLPart]:
@@ -52,6 +55,7 @@ class AzureMessageParamConverter(BaseMessageParamConverter):
         )
 
     @staticmethod
+    @cache_message_conversion
     def from_provider(
         message_params: list[ChatRequestMessage],
     ) -> list[BaseMessageParam]:
@@ -26,6 +26,7 @@ from ...base._utils import (
     get_create_fn,
 )
 from ...base.call_params import CommonCallParams
+from ...base.client_pool import get_default_client
 from ...base.stream_config import StreamConfig
 from .._call_kwargs import AzureCallKwargs
 from ..call_params import AzureCallParams, ResponseFormatJSON
@@ -156,12 +157,22 @@ def setup_call(
 
     if client is None:
         endpoint = os.environ["AZURE_INFERENCE_ENDPOINT"]
-        credential = cast(AzureKeyCredential, get_credential())
+        is_async = inspect.iscoroutinefunction(fn)
 
-        client = (
-            AsyncChatCompletionsClient(endpoint=endpoint, credential=credential)
-            if inspect.iscoroutinefunction(fn)
-            else ChatCompletionsClient(endpoint=endpoint, credential=credential)
+        def create_client() -> ChatCompletionsClient | AsyncChatCompletionsClient:
+            credential = cast(AzureKeyCredential, get_credential())
+            return (
+                AsyncChatCompletionsClient(endpoint=endpoint, credential=credential)
+                if is_async
+                else ChatCompletionsClient(endpoint=endpoint, credential=credential)
+            )
+
+        client = get_default_client(
+            "azure",
+            is_async,
+            create_client,
+            base_url=endpoint,
+            api_key=os.environ.get("AZURE_INFERENCE_CREDENTIAL"),
         )
     create = (
         get_async_create_fn(
@@ -139,6 +139,7 @@ class AzureStream(
             user_message_param=self.user_message_param,
             start_time=self.start_time,
             end_time=self.end_time,
+            timings=self.timings,
         )
 
     @property
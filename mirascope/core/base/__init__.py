@@ -7,6 +7,12 @@ from .call_kwargs import BaseCallKwargs
 from .call_params import BaseCallParams, CommonCallParams
 from .call_response import BaseCallResponse, transform_tool_outputs
 from .call_response_chunk import BaseCallResponseChunk
+from .client_pool import (
+    ClientPoolConfig,
+    aclose_client_pool,
+    clear_client_pool,
+    configure_client_pool,
+)
 from .dynamic_config import BaseDynamicConfig
 from .from_call_args import FromCallArgs
 from .merge_decorators import merge_decorators
@@ -37,6 +43,7 @@ from .types import (
     JsonableType,
     LocalProvider,
     Provider,
+    Timings,
     Usage,
 )
 
@@ -57,6 +64,7 @@ __all__ = [
     "BaseToolKit",
     "BaseType",
     "CacheControlPart",
+    "ClientPoolConfig",
     "CommonCallParams",
     "CostMetadata",
     "DocumentPart",
@@ -71,13 +79,17 @@ __all__ = [
     "Metadata",
     "ResponseModelConfigDict",
     "TextPart",
+    "Timings",
     "ToolCallPart",
     "ToolConfig",
     "ToolResultPart",
     "Usage",
     "_partial",
     "_utils",
+    "aclose_client_pool",
     "call_factory",
+    "clear_client_pool",
+    "configure_client_pool",
     "merge_decorators",
     "metadata",
     "prompt_template",
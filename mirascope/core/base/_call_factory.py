@@ -238,6 +238,8 @@ def call_factory(  # noqa: ANN202
                 client=client,
                 call_params=call_params,
                 partial_tools=isinstance(stream, dict) and stream.get("partial_tools"),
+                lightweight=isinstance(stream, dict)
+                and stream.get("lightweight", False),
             )  # pyright: ignore [reportReturnType, reportCallIssue]
         return partial(
             create_factory(
@@ -16,6 +16,7 @@ from ._utils import (
     get_metadata,
     get_possible_user_message_param,
     is_prompt_template,
+    preload_media,
 )
 from .call_params import BaseCallParams
 from .call_response import BaseCallResponse
@@ -23,6 +24,7 @@ from .dynamic_config import BaseDynamicConfig
 from .messages import Messages
 from .prompt import prompt_template
 from .tool import BaseTool
+from .types import Timings
 
 _BaseCallResponseT = TypeVar("_BaseCallResponseT", bound=BaseCallResponse)
 _SameSyncAndAsyncClientT = TypeVar("_SameSyncAndAsyncClientT", contravariant=True)
@@ -172,21 +174,26 @@ def create_factory(  # noqa: ANN202
                 nonlocal client
                 if dynamic_config is not None:
                     client = dynamic_config.get("client", None) or client
-                create, prompt_template, messages, tool_types, call_kwargs = setup_call(  # pyright: ignore [reportCallIssue]
-                    model=model,
-                    client=client,  # pyright: ignore [reportArgumentType]
-                    fn=fn,
-                    fn_args=fn_args,
-                    dynamic_config=dynamic_config,
-                    tools=tools,
-                    json_mode=json_mode,
-                    call_params=call_params,
-                    response_model=response_model,
-                    stream=False,
-                )
+                async with preload_media(fn, fn_args, dynamic_config):
+                    create, prompt_template, messages, tool_types, call_kwargs = (
+                        setup_call(  # pyright: ignore [reportCallIssue]
+                            model=model,
+                            client=client,  # pyright: ignore [reportArgumentType]
+                            fn=fn,
+                            fn_args=fn_args,
+                            dynamic_config=dynamic_config,
+                            tools=tools,
+                            json_mode=json_mode,
+                            call_params=call_params,
+                            response_model=response_model,
+                            stream=False,
+                        )
+                    )
+                timings = Timings()
                 start_time = datetime.datetime.now().timestamp() * 1000
                 response = await create(stream=False, **call_kwargs)
                 end_time = datetime.datetime.now().timestamp() * 1000
+                timings.record_end()
                 output = TCallResponse(  # pyright: ignore [reportCallIssue]
                     metadata=get_metadata(fn, dynamic_config),
                     response=response,
@@ -200,6 +207,7 @@ def create_factory(  # noqa: ANN202
                     user_message_param=get_possible_user_message_param(messages),
                     start_time=start_time,
                     end_time=end_time,
+                    timings=timings,
                 )
                 output._model = model
                 return output if not output_parser else output_parser(output)
@@ -228,9 +236,11 @@ def create_factory(  # noqa: ANN202
                     response_model=response_model,
                     stream=False,
                 )
+                timings = Timings()
                 start_time = datetime.datetime.now().timestamp() * 1000
                 response = create(stream=False, **call_kwargs)
                 end_time = datetime.datetime.now().timestamp() * 1000
+                timings.record_end()
                 output = TCallResponse(  # pyright: ignore [reportCallIssue]
                     metadata=get_metadata(fn, dynamic_config),
                     response=response,
@@ -244,6 +254,7 @@ def create_factory(  # noqa: ANN202
                     user_message_param=get_possible_user_message_param(messages),
                     start_time=start_time,
                     end_time=end_time,
+                    timings=timings,
                 )
                 output._model = model
                 return output if not output_parser else output_parser(output)
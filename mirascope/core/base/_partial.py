@@ -61,9 +61,30 @@ def partial(
 
     user = User()  # All fields optional
     ```
+
+    Partial models are cached on `wrapped_class` per set of `preserve_fields`, so
+    repeated calls (e.g. for every chunk of a stream) return the same class.
     """
-    if preserve_fields is None:
-        preserve_fields = set()
+    fields_key = frozenset(preserve_fields or ())
+    # Check `__dict__` so that partial models of subclasses aren't shared with parents
+    partial_models = wrapped_class.__dict__.get("__mirascope_partial_models__")
+    if partial_models is None:
+        partial_models = {}
+        wrapped_class.__mirascope_partial_models__ = partial_models  # pyright: ignore [reportAttributeAccessIssue]
+    elif fields_key in partial_models:
+        return partial_models[fields_key]
+
+    partial_model = _create_partial(wrapped_class, fields_key)
+    if wrapped_class.__pydantic_complete__:
+        # Models with unresolved forward references may still be rebuilt
+        partial_models[fields_key] = partial_model
+    return partial_model
+
+
+def _create_partial(
+    wrapped_class: type[Model], preserve_fields: frozenset[str]
+) -> type[Model]:
+    """Creates the partial model of `wrapped_class`."""
 
     def _make_field_optional(
         field: FieldInfo,
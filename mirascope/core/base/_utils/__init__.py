@@ -2,10 +2,12 @@
 
 from ._base_message_param_converter import BaseMessageParamConverter
 from ._base_type import BaseType, is_base_type
+from ._cache_message_conversion import cache_message_conversion
 from ._convert_base_model_to_base_tool import convert_base_model_to_base_tool
 from ._convert_base_type_to_base_tool import convert_base_type_to_base_tool
 from ._convert_function_to_base_tool import convert_function_to_base_tool
 from ._default_tool_docstring import DEFAULT_TOOL_DOCSTRING
+from ._encode_base64 import encode_base64
 from ._extract_tool_return import extract_tool_return
 from ._fn_is_async import fn_is_async
 from ._format_template import format_template
@@ -15,7 +17,11 @@ from ._get_create_fn_or_async_create_fn import get_async_create_fn, get_create_f
 from ._get_document_type import get_document_type
 from ._get_dynamic_configuration import get_dynamic_configuration
 from ._get_fn_args import get_fn_args
-from ._get_image_dimensions import get_image_dimensions
+from ._get_image_dimensions import (
+    cache_image_dimensions,
+    get_image_dimensions,
+    sniff_image_dimensions,
+)
 from ._get_image_type import get_image_type
 from ._get_metadata import get_metadata
 from ._get_possible_user_message_param import get_possible_user_message_param
@@ -29,6 +35,7 @@ from ._messages_decorator import MessagesDecorator, messages_decorator
 from ._parse_content_template import parse_content_template
 from ._parse_prompt_messages import parse_prompt_messages
 from ._pil_image_to_bytes import pil_image_to_bytes
+from ._preload_media import preload_media
 from ._protocols import (
     AsyncCreateFn,
     CalculateCost,
@@ -59,9 +66,12 @@ __all__ = [
     "MessagesDecorator",
     "SameSyncAndAsyncClientSetupCall",
     "SetupCall",
+    "cache_image_dimensions",
+    "cache_message_conversion",
     "convert_base_model_to_base_tool",
     "convert_base_type_to_base_tool",
     "convert_function_to_base_tool",
+    "encode_base64",
     "extract_tool_return",
     "fn_is_async",
     "format_template",
@@ -87,6 +97,8 @@ __all__ = [
     "parse_content_template",
     "parse_prompt_messages",
     "pil_image_to_bytes",
+    "preload_media",
     "setup_call",
     "setup_extract_tool",
+    "sniff_image_dimensions",
 ]
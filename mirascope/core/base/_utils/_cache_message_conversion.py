@@ -0,0 +1,127 @@
+"""This module contains the `cache_message_conversion` decorator."""
+
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import wraps
+from typing import TypeVar
+
+from pydantic import BaseModel
+
+_MessageT = TypeVar("_MessageT")
+_ConvertedT = TypeVar("_ConvertedT")
+
+_CACHE_SIZE = 4096
+
+
+_IMMUTABLE = (str, bytes, int, float, type(None))
+
+
+class _MutableContentError(Exception):
+    """Raised for content that can change in place without being reassigned."""
+
+
+def _snapshot(value: object) -> object:
+    """Returns a snapshot of `value` that compares equal until `value` is edited.
+
+    Immutable leaves (e.g. text and media bytes) are kept as is, so comparing the
+    snapshots of an unchanged message only compares their identities.
+    """
+    if isinstance(value, _IMMUTABLE) or (
+        isinstance(value, memoryview) and value.readonly
+    ):
+        return value
+    if isinstance(value, BaseModel):
+        return type(value), _snapshot(value.__dict__)
+    if isinstance(value, dict):
+        return tuple((key, _snapshot(item)) for key, item in value.items())
+    if isinstance(value, list | tuple):
+        return tuple(map(_snapshot, value))
+    raise _MutableContentError
+
+
+def _fingerprint(message: object) -> object:
+    """Returns a snapshot used to detect in-place edits of a cached message.
+
+    Returns `None` for messages that can't be cached, i.e. that can't be weakly
+    referenced (e.g. provider-native dicts) or whose content could change in place
+    unnoticed (e.g. a writable `memoryview`).
+    """
+    if not type(message).__weakrefoffset__:
+        return None
+    try:
+        return _snapshot(message)
+    except _MutableContentError:
+        return None
+
+
+def cache_message_conversion(
+    convert: Callable[[list[_MessageT]], list[_ConvertedT]],
+) -> Callable[[list[_MessageT]], list[_ConvertedT]]:
+    """Memoizes a message conversion function per message.
+
+    Agents pass their growing history through the same conversion on every turn, so
+    without caching each turn re-converts (and e.g. re-encodes the media of) every
+    message seen so far. Each message's converted form is cached by identity, so only
+    the newly appended messages are converted. This relies on `convert` handling each
+    message independently, which holds for all providers' message conversions.
+
+    Messages are held weakly in a bounded LRU cache along with a snapshot of their
+    fields (down to the text and media of each part), and a message that was edited
+    in place is converted again. Messages that can't be weakly referenced (e.g.
+    provider-native dicts) are always converted. The final message is always
+    converted fresh and never cached since callers may modify the last converted
+    message in place (e.g. to add JSON mode instructions).
+    """
+    cache: OrderedDict[int, tuple[weakref.ref, object, list[_ConvertedT]]] = (
+        OrderedDict()
+    )
+    lock = threading.Lock()
+    # Weakref callbacks may run at any point (including while the lock is held), so
+    # they only record the dead entries, which are then evicted on the next call
+    dead: list[tuple[int, weakref.ref]] = []
+
+    def _reference(message: object, key: int) -> weakref.ref:
+        return weakref.ref(message, lambda ref: dead.append((key, ref)))
+
+    def _evict_dead() -> None:
+        while dead:
+            key, ref = dead.pop()
+            if (entry := cache.get(key)) is not None and entry[0] is ref:
+                del cache[key]
+
+    @wraps(convert)
+    def wrapper(message_params: list[_MessageT]) -> list[_ConvertedT]:
+        converted_message_params: list[_ConvertedT] = []
+        if dead:
+            with lock:
+                _evict_dead()
+        for message_param in message_params[:-1]:
+            key, fingerprint = id(message_param), _fingerprint(message_param)
+            if fingerprint is None:
+                converted_message_params += convert([message_param])
+                continue
+            with lock:
+                entry = cache.get(key)
+                if (
+                    entry is not None
+                    and entry[0]() is message_param
+                    and entry[1] == fingerprint
+                ):
+                    cache.move_to_end(key)
+                    converted_message_params += entry[2]
+                    continue
+            converted = convert([message_param])
+            with lock:
+                cache[key] = (_reference(message_param, key), fingerprint, converted)
+                cache.move_to_end(key)
+                if len(cache) > _CACHE_SIZE:
+                    cache.popitem(last=False)
+            converted_message_params += converted
+        if message_params:
+            converted_message_params += convert(message_params[-1:])
+        return converted_message_params
+
+    wrapper.cache_clear = cache.clear  # pyright: ignore [reportFunctionMemberAccess]
+    return wrapper
@@ -1,5 +1,6 @@
 """This module contains the `convert_base_type_to_base_tool` function."""
 
+from functools import lru_cache
 from typing import Annotated, TypeVar, get_args, get_origin
 
 from pydantic import BaseModel, create_model
@@ -10,10 +11,10 @@ from ._default_tool_docstring import DEFAULT_TOOL_DOCSTRING
 BaseToolT = TypeVar("BaseToolT", bound=BaseModel)
 
 
-def convert_base_type_to_base_tool(
+@lru_cache(maxsize=1024)
+def _convert_hashable_base_type(
     schema: type[BaseType], base: type[BaseToolT]
 ) -> type[BaseToolT]:
-    """Converts a `BaseType` to a `BaseToolT` type."""
     if get_origin(schema) == Annotated:
         schema.__name__ = get_args(schema)[0].__name__
     return create_model(
@@ -22,3 +23,18 @@ def convert_base_type_to_base_tool(
         __doc__=DEFAULT_TOOL_DOCSTRING,
         value=(schema, ...),
     )
+
+
+def convert_base_type_to_base_tool(
+    schema: type[BaseType], base: type[BaseToolT]
+) -> type[BaseToolT]:
+    """Converts a `BaseType` to a `BaseToolT` type.
+
+    Conversions are cached per `(schema, base)` pair, so the returned type is shared
+    and should not be mutated except by idempotent setup (e.g. `setup_extract_tool`).
+    """
+    try:
+        return _convert_hashable_base_type(schema, base)
+    except TypeError:
+        # Annotated metadata may be unhashable, in which case we can't cache
+        return _convert_hashable_base_type.__wrapped__(schema, base)
@@ -0,0 +1,51 @@
+"""This module contains the `encode_base64` function."""
+
+import base64
+import hashlib
+import threading
+from collections import OrderedDict
+
+_CACHE_MAX_BYTES = 128 * 1024 * 1024
+# Below this size hashing the payload costs about as much as encoding it
+_MIN_CACHED_SIZE = 4096
+
+_encoded_cache: OrderedDict[bytes, str] = OrderedDict()
+_encoded_cache_bytes = 0
+_lock = threading.Lock()
+
+
+def encode_base64(data: bytes | bytearray | memoryview) -> str:
+    """Returns the base64 encoding of `data`.
+
+    The same media (e.g. a system document shared by every user) is often sent with
+    many requests, so the encodings of larger payloads are cached by the payload's
+    SHA-256 digest, which is several times cheaper to compute than the encoding. The
+    cache is bounded by the total size of the cached encodings.
+
+    Args:
+        data: The raw bytes to encode.
+
+    Returns:
+        The base64 encoded string.
+    """
+    if len(data) < _MIN_CACHED_SIZE:
+        return base64.b64encode(data).decode("utf-8")
+
+    global _encoded_cache_bytes
+    key = hashlib.sha256(data).digest()
+    with _lock:
+        if (encoded := _encoded_cache.get(key)) is not None:
+            _encoded_cache.move_to_end(key)
+            return encoded
+
+    encoded = base64.b64encode(data).decode("utf-8")
+    if len(encoded) > _CACHE_MAX_BYTES:
+        return encoded
+    with _lock:
+        if key not in _encoded_cache:
+            _encoded_cache[key] = encoded
+            _encoded_cache_bytes += len(encoded)
+            while _encoded_cache_bytes > _CACHE_MAX_BYTES:
+                _, evicted = _encoded_cache.popitem(last=False)
+                _encoded_cache_bytes -= len(evicted)
+    return encoded
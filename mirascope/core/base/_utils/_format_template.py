@@ -1,5 +1,6 @@
 """This module contains the `format_template` function."""
 
+from functools import lru_cache
 from textwrap import dedent
 from typing import Any
 
@@ -7,6 +8,25 @@ from ._get_template_values import get_template_values
 from ._get_template_variables import get_template_variables
 
 
+@lru_cache(maxsize=1024)
+def _compile_template(
+    template: str, strip: bool
+) -> tuple[str, tuple[tuple[str, str | None], ...]]:
+    """Returns the format-ready template and its variables, cached per template.
+
+    Dedenting, stripping, and parsing the template only depend on the template string
+    itself, so we do this work once and only bind values on subsequent calls.
+    """
+    dedented_template = dedent(template)
+    if strip:
+        dedented_template = dedented_template.strip()
+    template_vars = tuple(get_template_variables(dedented_template, True))
+
+    # Remove any special format specs that are actually invalid normally
+    dedented_template = dedented_template.replace(":lists", "").replace(":list", "")
+    return dedented_template, template_vars
+
+
 def format_template(template: str, attrs: dict[str, Any], strip: bool = True) -> str:
     """Formats the given prompt `template`
 
@@ -19,14 +39,7 @@ def format_template(template: str, attrs: dict[str, Any], strip: bool = True) ->
         The formatted template.
 
     """
-    dedented_template = dedent(template)
-    if strip:
-        dedented_template = dedented_template.strip()
-    template_vars = get_template_variables(dedented_template, True)
-
-    values = get_template_values(template_vars, attrs)
-
-    # Remove any special format specs that are actually invalid normally
-    dedented_template = dedented_template.replace(":lists", "").replace(":list", "")
-    result = dedented_template.format(**values)
+    compiled_template, template_vars = _compile_template(template, strip)
+    values = get_template_values(list(template_vars), attrs)
+    result = compiled_template.format(**values)
     return result.strip() if strip else result
@@ -1,18 +1,19 @@
 """Utility for determining the type of an audio file from its bytes."""
 
 
-def get_audio_type(audio_data: bytes) -> str:
-    if audio_data.startswith(b"RIFF") and audio_data[8:12] == b"WAVE":
+def get_audio_type(audio_data: bytes | memoryview) -> str:
+    header = bytes(audio_data[:12])
+    if header.startswith(b"RIFF") and header[8:12] == b"WAVE":
         return "wav"
-    elif audio_data.startswith(b"ID3") or audio_data.startswith(b"\xff\xfb"):
+    elif header.startswith(b"ID3") or header.startswith(b"\xff\xfb"):
         return "mp3"
-    elif audio_data.startswith(b"FORM") and audio_data[8:12] == b"AIFF":
+    elif header.startswith(b"FORM") and header[8:12] == b"AIFF":
         return "aiff"
-    elif audio_data.startswith(b"\xff\xf1") or audio_data.startswith(b"\xff\xf9"):
+    elif header.startswith(b"\xff\xf1") or header.startswith(b"\xff\xf9"):
         return "aac"
-    elif audio_data.startswith(b"OggS"):
+    elif header.startswith(b"OggS"):
         return "ogg"
-    elif audio_data.startswith(b"fLaC"):
+    elif header.startswith(b"fLaC"):
         return "flac"
 
     raise ValueError("Unsupported audio type")
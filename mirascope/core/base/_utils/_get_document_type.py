@@ -1,7 +1,8 @@
 """Utility for determining the type of an document from its bytes."""
 
 
-def get_document_type(document_data: bytes) -> str:
-    if document_data.startswith(b"%PDF"):
+def get_document_type(document_data: bytes | memoryview) -> str:
+    header = bytes(document_data[:12])
+    if header.startswith(b"%PDF"):
         return "pdf"
     raise ValueError("Unsupported document type")
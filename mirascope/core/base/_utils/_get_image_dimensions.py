@@ -1,39 +1,188 @@
 import base64
+import binascii
+import hashlib
 import io
-import re
+import threading
+import time
+import urllib.request
+from collections import OrderedDict
 
 from ...base.types import Image, ImageMetadata, has_pil_module
-from ._parse_content_template import _load_media
+
+_CACHE_SIZE = 1024
+_SNIFF_SIZES = (4096, 65536)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+# Remote images may change, so their dimensions are only cached for this many seconds
+_HTTP_CACHE_TTL = 300.0
+
+# Keyed by the SHA-256 digest of the URL rather than the URL itself so that the cache
+# never holds on to large data URLs. Entries expire at the given `time.monotonic()`
+_image_dimensions_cache: OrderedDict[bytes, tuple[ImageMetadata, float]] = OrderedDict()
+_lock = threading.Lock()
+
+
+def _sniff_jpeg_dimensions(data: bytes) -> tuple[int, int] | None:
+    i, n = 2, len(data)
+    while i + 9 <= n:
+        if data[i] != 0xFF:
+            i += 1
+            continue
+        marker = data[i + 1]
+        if marker == 0xFF:
+            i += 1
+        elif marker in _JPEG_SOF_MARKERS:
+            height = int.from_bytes(data[i + 5 : i + 7], "big")
+            width = int.from_bytes(data[i + 7 : i + 9], "big")
+            return width, height
+        elif marker == 0x01 or 0xD0 <= marker <= 0xD8:
+            # Standalone markers have no length
+            i += 2
+        else:
+            i += 2 + int.from_bytes(data[i + 2 : i + 4], "big")
+    return None
+
+
+def _sniff_webp_dimensions(data: bytes) -> tuple[int, int] | None:
+    chunk = data[12:16]
+    if chunk == b"VP8 " and len(data) >= 30:
+        width = int.from_bytes(data[26:28], "little") & 0x3FFF
+        height = int.from_bytes(data[28:30], "little") & 0x3FFF
+        return width, height
+    if chunk == b"VP8L" and len(data) >= 25:
+        b0, b1, b2, b3 = data[21:25]
+        width = 1 + (((b1 & 0x3F) << 8) | b0)
+        height = 1 + (((b3 & 0x0F) << 10) | (b2 << 2) | ((b1 & 0xC0) >> 6))
+        return width, height
+    if chunk == b"VP8X" and len(data) >= 30:
+        width = 1 + int.from_bytes(data[24:27], "little")
+        height = 1 + int.from_bytes(data[27:30], "little")
+        return width, height
+    return None
+
+
+def _sniff_image_dimensions(data: bytes) -> tuple[int, int] | None:
+    """Returns the dimensions of a PNG, GIF, JPEG, or WebP image from its header."""
+    if data.startswith(b"\x89PNG\r\n\x1a\n") and len(data) >= 24:
+        return (
+            int.from_bytes(data[16:20], "big"),
+            int.from_bytes(data[20:24], "big"),
+        )
+    if data.startswith((b"GIF87a", b"GIF89a")) and len(data) >= 10:
+        return (
+            int.from_bytes(data[6:8], "little"),
+            int.from_bytes(data[8:10], "little"),
+        )
+    if data.startswith(b"\xff\xd8"):
+        return _sniff_jpeg_dimensions(data)
+    if data.startswith(b"RIFF") and data[8:12] == b"WEBP":
+        return _sniff_webp_dimensions(data)
+    return None
+
+
+def sniff_image_dimensions(
+    data: bytes | bytearray | memoryview,
+) -> ImageMetadata | None:
+    """Returns the dimensions of an image from its header, if its format is known."""
+    if dimensions := _sniff_image_dimensions(bytes(data[: _SNIFF_SIZES[-1]])):
+        return ImageMetadata(width=dimensions[0], height=dimensions[1])
+    return None
+
+
+def _cache_key(url: str) -> bytes:
+    return hashlib.sha256(url.encode()).digest()
+
+
+def cache_image_dimensions(url: str, dimensions: ImageMetadata) -> None:
+    """Records the known `dimensions` of the image at `url` (e.g. a data URL).
+
+    Message conversions call this with the dimensions captured when the image part was
+    constructed, so that `get_image_dimensions` doesn't have to decode the image.
+    """
+    key = _cache_key(url)
+    expires = (
+        time.monotonic() + _HTTP_CACHE_TTL if url.startswith("http") else float("inf")
+    )
+    with _lock:
+        # Store a copy since callers may set e.g. `detail` on the returned metadata
+        _image_dimensions_cache[key] = (dimensions.model_copy(), expires)
+        _image_dimensions_cache.move_to_end(key)
+        if len(_image_dimensions_cache) > _CACHE_SIZE:
+            _image_dimensions_cache.popitem(last=False)
+
+
+def _get_bytes_dimensions(data: bytes) -> ImageMetadata | None:
+    if dimensions := _sniff_image_dimensions(data):
+        return ImageMetadata(width=dimensions[0], height=dimensions[1])
+    try:
+        if not has_pil_module:  # pragma: no cover
+            raise ImportError("PIL module is not available")
+        with Image.open(io.BytesIO(data)) as image:
+            width, height = image.size
+        return ImageMetadata(width=width, height=height)
+    except Exception:
+        return None
+
+
+def _get_data_url_dimensions(data_url: str) -> ImageMetadata | None:
+    # Format is: data:[<media type>][;base64],<data>
+    _, separator, base64_data = data_url.partition(",")
+    if not separator:
+        base64_data = data_url
+    for size in _SNIFF_SIZES:
+        if size >= len(base64_data):
+            break
+        try:
+            prefix = base64.b64decode(base64_data[:size])
+        except binascii.Error:
+            break
+        if dimensions := _sniff_image_dimensions(prefix):
+            return ImageMetadata(width=dimensions[0], height=dimensions[1])
+    return _get_bytes_dimensions(base64.b64decode(base64_data))
+
+
+def _get_http_url_dimensions(url: str) -> ImageMetadata | None:
+    with urllib.request.urlopen(url) as response:
+        data = b""
+        for size in _SNIFF_SIZES:
+            data += response.read(size - len(data))
+            if dimensions := _sniff_image_dimensions(data):
+                return ImageMetadata(width=dimensions[0], height=dimensions[1])
+        data += response.read()
+    return _get_bytes_dimensions(data)
 
 
 def get_image_dimensions(data_url: str) -> ImageMetadata | None:
     """
     Extract width and height from a base64 encoded image.
 
+    Only the image header is decoded (or downloaded) when possible, and the result is
+    cached by the SHA-256 digest of the URL so that repeated lookups are free. The
+    dimensions of http URLs are cached for `_HTTP_CACHE_TTL` seconds.
+
     Args:
         data_url: The data URL containing base64 encoded image data or External URL
 
     Returns:
         Dictionary with width and height, or None if extraction failed
     """
+    key = _cache_key(data_url)
+    with _lock:
+        if (cached := _image_dimensions_cache.get(key)) is not None:
+            dimensions, expires = cached
+            if time.monotonic() < expires:
+                _image_dimensions_cache.move_to_end(key)
+                return dimensions.model_copy()
+            del _image_dimensions_cache[key]
+
     try:
         if data_url.startswith("http"):
-            binary_data = _load_media(data_url)
+            dimensions = _get_http_url_dimensions(data_url)
         else:
-            # Extract the base64 data part from the URL
-            # Format is: data:[<media type>][;base64],<data>
-            pattern = r"data:image/[^;]+;base64,"
-            base64_data = re.sub(pattern, "", data_url)
-
-            # Decode the base64 data
-            binary_data = base64.b64decode(base64_data)
-
-        # Use PIL to open the image and get dimensions
-        if not has_pil_module:  # pragma: no cover
-            raise ImportError("PIL module is not available")
-        with Image.open(io.BytesIO(binary_data)) as image:
-            width, height = image.size
-
-        return ImageMetadata(width=width, height=height)
+            dimensions = _get_data_url_dimensions(data_url)
     except Exception:
         return None
+    if dimensions is None:
+        return None
+    cache_image_dimensions(data_url, dimensions)
+    return dimensions
@@ -1,16 +1,17 @@
 """Utility for determining the type of an image from its bytes."""
 
 
-def get_image_type(image_data: bytes) -> str:
-    if image_data.startswith(b"\xff\xd8\xff"):
+def get_image_type(image_data: bytes | memoryview) -> str:
+    header = bytes(image_data[:12])
+    if header.startswith(b"\xff\xd8\xff"):
         return "jpeg"
-    elif image_data.startswith(b"\x89PNG\r\n\x1a\n"):
+    elif header.startswith(b"\x89PNG\r\n\x1a\n"):
         return "png"
-    elif image_data.startswith(b"GIF87a") or image_data.startswith(b"GIF89a"):
+    elif header.startswith(b"GIF87a") or header.startswith(b"GIF89a"):
         return "gif"
-    elif image_data.startswith(b"RIFF") and image_data[8:12] == b"WEBP":
+    elif header.startswith(b"RIFF") and header[8:12] == b"WEBP":
         return "webp"
-    elif image_data[4:12] in (
+    elif header[4:12] in (
         b"ftypmif1",
         b"ftypmsf1",
         b"ftypheic",
@@ -18,7 +19,7 @@ def get_image_type(image_data: bytes) -> str:
         b"ftyphevc",
         b"ftyphevx",
     ):
-        subtype = image_data[8:12]
+        subtype = header[8:12]
         if subtype in (b"heic", b"heix"):
             return "heic"
         elif subtype in (b"mif1", b"msf1", b"hevc", b"hevx"):
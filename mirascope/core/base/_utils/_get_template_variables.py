@@ -1,9 +1,20 @@
 """This module provides a function to get the variables in a template string."""
 
+from functools import lru_cache
 from string import Formatter
 from typing import Literal, overload
 
 
+@lru_cache(maxsize=1024)
+def _parse_template_variables(template: str) -> tuple[tuple[str, str | None], ...]:
+    """Returns the parsed `(variable, format_spec)` pairs, cached per template."""
+    return tuple(
+        (var, format_spec)
+        for _, var, format_spec, _ in Formatter().parse(template)
+        if var
+    )
+
+
 @overload
 def get_template_variables(
     template: str, include_format_spec: Literal[True]
@@ -28,11 +39,8 @@ def get_template_variables(
     Returns:
         The variables in the template string.
     """
+    template_variables = _parse_template_variables(template)
     if include_format_spec:
-        return [
-            (var, format_spec)
-            for _, var, format_spec, _ in Formatter().parse(template)
-            if var
-        ]
+        return list(template_variables)
     else:
-        return [var for _, var, _, _ in Formatter().parse(template) if var]
+        return [var for var, _ in template_variables]
@@ -0,0 +1,61 @@
+"""Partial tools whose `tool_call` is constructed only when it's read."""
+
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from pydantic import PrivateAttr, SerializerFunctionWrapHandler, model_serializer
+
+from .._partial import partial
+from ..tool import BaseTool
+
+_BaseToolT = TypeVar("_BaseToolT", bound=BaseTool)
+
+
+def lazy_partial_tool_type(tool_type: type[_BaseToolT]) -> type[_BaseToolT]:
+    """Returns the partial model of `tool_type` that supports `defer_tool_call`.
+
+    The model is cached on the partial model of `tool_type`, so repeated calls (e.g.
+    for every chunk of a stream) return the same class.
+    """
+    partial_type = partial(tool_type, {"tool_call", "delta"})
+    if (lazy_type := partial_type.__dict__.get("__mirascope_lazy_model__")) is None:
+        lazy_type = _create_lazy_partial_tool_type(partial_type)
+        partial_type.__mirascope_lazy_model__ = lazy_type  # pyright: ignore [reportAttributeAccessIssue]
+    return lazy_type
+
+
+def defer_tool_call(tool: BaseTool, tool_call: Callable[[], Any]) -> None:
+    """Replaces the `tool_call` of `tool` with one constructed by `tool_call` on read.
+
+    `tool` must be an instance of a model returned by `lazy_partial_tool_type`.
+    """
+    tool.__dict__.pop("tool_call", None)
+    tool._tool_call_factory = tool_call  # pyright: ignore [reportAttributeAccessIssue]
+
+
+def _create_lazy_partial_tool_type(
+    partial_type: type[_BaseToolT],
+) -> type[_BaseToolT]:
+    class LazyPartialTool(partial_type):  # pyright: ignore [reportGeneralTypeIssues, reportUntypedBaseClass]
+        _tool_call_factory: Callable[[], Any] | None = PrivateAttr(None)
+
+        def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+            if name == "tool_call" and (
+                factory := self.__pydantic_private__.get("_tool_call_factory")
+            ):
+                self.__dict__["tool_call"] = tool_call = factory()
+                self._tool_call_factory = None
+                return tool_call
+            return super().__getattr__(name)
+
+        @model_serializer(mode="wrap")
+        def _serialize_tool_call(
+            self, handler: SerializerFunctionWrapHandler
+        ) -> dict[str, Any]:
+            getattr(self, "tool_call", None)
+            return handler(self)
+
+    LazyPartialTool.__name__ = partial_type.__name__
+    LazyPartialTool.__qualname__ = partial_type.__qualname__
+    LazyPartialTool.__module__ = partial_type.__module__
+    return LazyPartialTool  # pyright: ignore [reportReturnType]
@@ -1,11 +1,22 @@
 """This module provides a function to parse content parts from a prompt template."""
 
+from __future__ import annotations
+
+import asyncio
+import mmap
 import re
+import threading
+import time
+import urllib.error
 import urllib.request
-from functools import reduce
-from typing import Any, Literal, cast
-
-from typing_extensions import TypedDict
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache, reduce
+from os import PathLike
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, cast, overload
 
 from ..message_param import (
     AudioPart,
@@ -24,6 +35,9 @@ from ._get_document_type import get_document_type
 from ._get_image_type import get_image_type
 from ._pil_image_to_bytes import pil_image_to_bytes
 
+if TYPE_CHECKING:
+    import httpx
+
 _PartType = Literal[
     "image",
     "images",
@@ -39,10 +53,10 @@ _PartType = Literal[
 ]
 
 
-class _Part(TypedDict):
+class _Part(NamedTuple):
     template: str
     type: _PartType
-    options: dict[str, str] | None
+    options: Mapping[str, str] | None
 
 
 def _cleanup_text_preserve_newlines(text: str) -> str:
@@ -78,7 +92,9 @@ def _cleanup_text_preserve_newlines(text: str) -> str:
     return reduce(lambda acc, x: acc + x, cleaned_lines, "")
 
 
-def _parse_parts(template: str) -> list[_Part]:
+@lru_cache(maxsize=1024)
+def _parse_parts(template: str) -> tuple[_Part, ...]:
+    """Returns the immutable parts of the content `template`."""
     # \{ and \} match the literal curly braces.
     #
     # ([^:{}]*) captures content before the colon that are not { or } or :.
@@ -105,27 +121,184 @@ def _parse_parts(template: str) -> list[_Part]:
             special_content = split[i + 1]
             special_type = cast(_PartType, split[i + 2])
             special_options = split[i + 3]
+            options: Mapping[str, str] | None = None
             if special_options is not None:
-                options: dict[str, str] = {}
+                parsed_options: dict[str, str] = {}
                 for option in special_options.split(","):
                     key, value = option.split("=")
-                    options[key] = value
-                special_options = options
+                    parsed_options[key] = value
+                options = MappingProxyType(parsed_options)
             parts.append(
-                _Part(
-                    template=special_content, type=special_type, options=special_options
-                )
+                _Part(template=special_content, type=special_type, options=options)
             )
-    return parts
+    return tuple(parts)
+
+
+def _map_file(path: PathLike) -> bytes | memoryview:
+    """Returns a zero-copy view of the memory-mapped file at `path`.
+
+    The file's contents are only paged into memory as they're read (e.g. when sniffing
+    the media type or encoding the payload), and the OS can reclaim them at any time.
+    """
+    with open(path, "rb") as f:
+        try:
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        except ValueError:  # Empty files can't be mapped
+            return f.read()
+
+
+_MEDIA_PART_TYPES = frozenset(
+    {"image", "images", "audio", "audios", "document", "documents"}
+)
+_MEDIA_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+
+class _CachedMedia(NamedTuple):
+    data: bytes
+    etag: str | None
+    last_modified: str | None
+    expires: float
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() < self.expires
+
+    def validators(self) -> dict[str, str]:
+        """Returns the headers for a conditional request revalidating the media."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+# Media downloaded over HTTP(S) keyed by URL and bounded by the total size of the data
+_media_cache: OrderedDict[str, _CachedMedia] = OrderedDict()
+_media_cache_size = 0
+_media_cache_lock = threading.Lock()
+
+# Media loaded ahead of parsing (see `load_media_async`) keyed by its source
+_preloaded_media: ContextVar[Mapping[str | PathLike, bytes | memoryview]] = ContextVar(
+    "_preloaded_media", default=MappingProxyType({})
+)
+
+
+def _clear_media_cache() -> None:
+    global _media_cache_size
+    with _media_cache_lock:
+        _media_cache.clear()
+        _media_cache_size = 0
+
+
+def _get_cached_media(url: str) -> _CachedMedia | None:
+    with _media_cache_lock:
+        if (cached := _media_cache.get(url)) is not None:
+            _media_cache.move_to_end(url)
+        return cached
+
+
+def _cache_media(
+    url: str,
+    data: bytes,
+    headers: Mapping[str, str],
+    previous: _CachedMedia | None = None,
+) -> None:
+    """Caches `data` if the response `headers` allow reusing or revalidating it."""
+    global _media_cache_size
+    cache_control = headers.get("Cache-Control") or ""
+    if "no-store" in cache_control or len(data) > _MEDIA_CACHE_MAX_BYTES:
+        return
+    max_age = _MAX_AGE_PATTERN.search(cache_control)
+    etag = headers.get("ETag") or (previous.etag if previous else None)
+    last_modified = headers.get("Last-Modified") or (
+        previous.last_modified if previous else None
+    )
+    if not (max_age or etag or last_modified):
+        return
+    expires = 0.0
+    if max_age and "no-cache" not in cache_control:
+        expires = time.monotonic() + int(max_age.group(1))
+    cached = _CachedMedia(bytes(data), etag, last_modified, expires)
+    with _media_cache_lock:
+        if (evicted := _media_cache.pop(url, None)) is not None:
+            _media_cache_size -= len(evicted.data)
+        _media_cache[url] = cached
+        _media_cache_size += len(cached.data)
+        while _media_cache_size > _MEDIA_CACHE_MAX_BYTES:
+            _, evicted = _media_cache.popitem(last=False)
+            _media_cache_size -= len(evicted.data)
+
+
+def _fetch_url(url: str) -> bytes:
+    """Returns the media at the HTTP(S) `url`, reusing or revalidating cached media."""
+    cached = _get_cached_media(url)
+    if cached is not None and cached.fresh:
+        return cached.data
+    request = urllib.request.Request(url, headers=cached.validators() if cached else {})
+    try:
+        with urllib.request.urlopen(request) as response:
+            data = response.read()
+            headers = response.headers
+    except urllib.error.HTTPError as e:
+        if e.code != 304 or cached is None:
+            raise
+        _cache_media(url, cached.data, e.headers, cached)
+        return cached.data
+    _cache_media(url, data, headers)
+    return data
+
+
+def _create_async_media_client() -> httpx.AsyncClient:
+    import httpx
 
+    return httpx.AsyncClient(follow_redirects=True)
 
-def _load_media(source: str | bytes) -> bytes:
+
+async def _fetch_url_async(url: str) -> bytes:
+    """Asynchronously returns the media at the HTTP(S) `url` (see `_fetch_url`)."""
+    cached = _get_cached_media(url)
+    if cached is not None and cached.fresh:
+        return cached.data
+    try:
+        import httpx  # noqa: F401
+    except ImportError:  # pragma: no cover
+        return await asyncio.to_thread(_fetch_url, url)
+
+    from ..client_pool import get_default_client
+
+    client = get_default_client("media", True, _create_async_media_client)
+    response = await client.get(url, headers=cached.validators() if cached else {})
+    if response.status_code == 304 and cached is not None:
+        _cache_media(url, cached.data, response.headers, cached)
+        return cached.data
+    response.raise_for_status()
+    _cache_media(url, response.content, response.headers)
+    return response.content
+
+
+@overload
+def _load_media(source: str | bytes) -> bytes: ...
+
+
+@overload
+def _load_media(source: str | bytes | PathLike) -> bytes | memoryview: ...
+
+
+def _load_media(source: str | bytes | PathLike) -> bytes | memoryview:
     try:
         # Some typing weirdness here where checking `isinstance(source, bytes)` results
         # in a type hint of `str | bytearray | memoryview` for source in the else.
         if isinstance(source, bytes | bytearray | memoryview):
             data = source
-        elif source.startswith(("http://", "https://", "data:", "file://")):
+        elif (preloaded := _preloaded_media.get().get(source)) is not None:
+            data = preloaded
+        elif isinstance(source, PathLike):
+            data = _map_file(source)
+        elif source.startswith(("http://", "https://")):
+            data = _fetch_url(source)
+        elif source.startswith(("data:", "file://")):
             with urllib.request.urlopen(source) as response:
                 data = response.read()
         else:
@@ -138,8 +311,18 @@ def _load_media(source: str | bytes) -> bytes:
         ) from e  # pragma: no cover
 
 
+async def _load_media_async(source: str | PathLike) -> bytes | memoryview:
+    if isinstance(source, str) and source.startswith(("http://", "https://")):
+        try:
+            return await _fetch_url_async(source)
+        except Exception as e:
+            raise ValueError(f"Failed to load or encode data from {source}") from e
+    # Local files and data URLs are loaded in a thread to avoid blocking the loop
+    return await asyncio.to_thread(_load_media, source)
+
+
 def _construct_image_part(
-    source: str | bytes | Image.Image, options: dict[str, str] | None
+    source: str | bytes | PathLike | Image.Image, options: Mapping[str, str] | None
 ) -> ImagePart | ImageURLPart:
     detail = None
     if options:
@@ -164,7 +347,9 @@ def _construct_image_part(
     )
 
 
-def _construct_audio_part(source: str | bytes) -> AudioPart | AudioURLPart:
+def _construct_audio_part(
+    source: str | bytes | PathLike,
+) -> AudioPart | AudioURLPart:
     # Note: audio does not currently support additional options, at least for now.
     if isinstance(source, str) and source.startswith(("http://", "https://", "gs://")):
         return AudioURLPart(type="audio_url", url=source)
@@ -174,7 +359,7 @@ def _construct_audio_part(source: str | bytes) -> AudioPart | AudioURLPart:
     )
 
 
-def _construct_document_part(source: str | bytes) -> DocumentPart:
+def _construct_document_part(source: str | bytes | PathLike) -> DocumentPart:
     document = _load_media(source)
     return DocumentPart(
         type="document",
@@ -194,53 +379,53 @@ def _construct_parts(
     | CacheControlPart
     | DocumentPart
 ]:
-    if part["type"] in "image":
-        source = attrs[part["template"]]
-        return [_construct_image_part(source, part["options"])] if source else []
-    elif part["type"] == "images":
-        sources = attrs[part["template"]]
+    if part.type in "image":
+        source = attrs[part.template]
+        return [_construct_image_part(source, part.options)] if source else []
+    elif part.type == "images":
+        sources = attrs[part.template]
         if not isinstance(sources, list):
             raise ValueError(
-                f"When using 'images' template, '{part['template']}' must be a list."
+                f"When using 'images' template, '{part.template}' must be a list."
             )
         return (
-            [_construct_image_part(source, part["options"]) for source in sources]
+            [_construct_image_part(source, part.options) for source in sources]
             if sources
             else []
         )
-    elif part["type"] == "audio":
-        source = attrs[part["template"]]
+    elif part.type == "audio":
+        source = attrs[part.template]
         return [_construct_audio_part(source)] if source else []
-    elif part["type"] == "audios":
-        sources = attrs[part["template"]]
+    elif part.type == "audios":
+        sources = attrs[part.template]
         if not isinstance(sources, list):
             raise ValueError(
-                f"When using 'audios' template, '{part['template']}' must be a list."
+                f"When using 'audios' template, '{part.template}' must be a list."
             )
         return [_construct_audio_part(source) for source in sources] if sources else []
-    elif part["type"] == "document":
-        source = attrs[part["template"]]
+    elif part.type == "document":
+        source = attrs[part.template]
         return [_construct_document_part(source)] if source else []
-    elif part["type"] == "documents":
-        sources = attrs[part["template"]]
+    elif part.type == "documents":
+        sources = attrs[part.template]
         if not isinstance(sources, list):
             raise ValueError(
-                f"When using 'documents' template, '{part['template']}' must be a list."
+                f"When using 'documents' template, '{part.template}' must be a list."
             )
         return (
             [_construct_document_part(source) for source in sources] if sources else []
         )
-    elif part["type"] == "cache_control":
+    elif part.type == "cache_control":
         return [
             CacheControlPart(
                 type="cache_control",
-                cache_type=part["options"].get("type", "ephemeral")
-                if part["options"]
+                cache_type=part.options.get("type", "ephemeral")
+                if part.options
                 else "ephemeral",
             )
         ]
-    elif part["type"] == "part":
-        source = attrs[part["template"]]
+    elif part.type == "part":
+        source = attrs[part.template]
         if not isinstance(
             source,
             TextPart
@@ -252,14 +437,14 @@ def _construct_parts(
             | DocumentPart,
         ):
             raise ValueError(
-                f"When using 'part' template, '{part['template']}' must be a valid content part."
+                f"When using 'part' template, '{part.template}' must be a valid content part."
             )
         return [source] if source else []
-    elif part["type"] == "parts":
-        sources = attrs[part["template"]]
+    elif part.type == "parts":
+        sources = attrs[part.template]
         if not isinstance(sources, list):
             raise ValueError(
-                f"When using 'parts' template, '{part['template']}' must be a list."
+                f"When using 'parts' template, '{part.template}' must be a list."
             )
 
         # validate each part is a valid content part
@@ -275,14 +460,14 @@ def _construct_parts(
                 | DocumentPart,
             ):
                 raise ValueError(
-                    f"When using 'parts' template, '{part['template']}' must be a list of valid content parts."
+                    f"When using 'parts' template, '{part.template}' must be a list of valid content parts."
                 )
         return sources if sources else []
-    elif part["type"] == "texts":
-        sources = attrs[part["template"]]
+    elif part.type == "texts":
+        sources = attrs[part.template]
         if not isinstance(sources, list):
             raise ValueError(
-                f"When using 'texts' template, '{part['template']}' must be a list."
+                f"When using 'texts' template, '{part.template}' must be a list."
             )
         return (
             [TextPart(type="text", text=source) for source in sources]
@@ -290,11 +475,11 @@ def _construct_parts(
             else []
         )
     else:  # text type
-        text = part["template"]
+        text = part.template
         if text in attrs:
             source = attrs[text]
             return [TextPart(type="text", text=source)]
-        formatted_template = format_template(part["template"], attrs, strip=False)
+        formatted_template = format_template(part.template, attrs, strip=False)
         if not formatted_template:
             return []
         return [TextPart(type="text", text=formatted_template)]
@@ -319,3 +504,52 @@ def parse_content_template(
     if len(parts) == 1 and parts[0].type == "text":
         return BaseMessageParam(role=role, content=parts[0].text)
     return BaseMessageParam(role=role, content=parts)
+
+
+def _media_sources(template: str, attrs: Mapping[str, Any]) -> Iterator[str | PathLike]:
+    """Yields the sources that parsing `template` would load with `_load_media`."""
+    for part in _parse_parts(template.strip()):
+        if part.type not in _MEDIA_PART_TYPES:
+            continue
+        sources = attrs.get(part.template)
+        if not part.type.endswith("s"):
+            sources = [sources]
+        if not isinstance(sources, list):
+            continue
+        for source in sources:
+            if not isinstance(source, str | PathLike):
+                continue
+            # Image and audio URLs are kept as URL parts rather than loaded
+            if (
+                isinstance(source, str)
+                and not part.type.startswith("document")
+                and source.startswith(("http://", "https://", "gs://"))
+            ):
+                continue
+            yield source
+
+
+async def load_media_async(
+    template: str, attrs: Mapping[str, Any]
+) -> dict[str | PathLike, bytes | memoryview]:
+    """Concurrently loads the media in the content `template` without blocking.
+
+    HTTP(S) media is downloaded with a pooled async client (when `httpx` is installed)
+    and local files are read in worker threads. Use the result with `preloaded_media`
+    so that `parse_content_template` uses it instead of loading the media again.
+    """
+    sources = list(dict.fromkeys(_media_sources(template, attrs)))
+    media = await asyncio.gather(*map(_load_media_async, sources))
+    return dict(zip(sources, media, strict=True))
+
+
+@contextmanager
+def preloaded_media(
+    media: Mapping[str | PathLike, bytes | memoryview],
+) -> Iterator[None]:
+    """Uses `media` (see `load_media_async`) when parsing content templates."""
+    token = _preloaded_media.set(media)
+    try:
+        yield
+    finally:
+        _preloaded_media.reset(token)
@@ -0,0 +1,266 @@
+"""This module contains the `PartialJsonParser` class for streamed JSON output."""
+
+import json
+import re
+from typing import Any
+
+_WHITESPACE = frozenset(" \t\n\r")
+_SCALAR_CHARS = frozenset("+-.0123456789Eaeflnrstu")
+_STRING_BODY = re.compile(r'[^"\\]+')
+# An incomplete unicode escape, or a high surrogate still waiting for its low surrogate
+_INCOMPLETE_UNICODE_ESCAPE = re.compile(
+    r"(\\+)u(?:[0-9a-fA-F]{0,3}|[dD][89abAB][0-9a-fA-F]{2})$"
+)
+
+
+_INCOMPLETE = object()
+
+
+def _decode_string(raw: str) -> str:
+    if "\\" not in raw:
+        return raw
+    return json.loads(f'"{raw}"', strict=False)
+
+
+class _Frame:
+    __slots__ = ("container", "expect", "key")
+
+    def __init__(self, container: dict[str, Any] | list[Any], expect: str) -> None:
+        self.container = container
+        self.expect = expect
+        self.key: str | None = None
+
+    def add(self, value: Any) -> None:  # noqa: ANN401
+        if isinstance(self.container, dict):
+            self.container[self.key] = value  # pyright: ignore [reportArgumentType]
+        else:
+            self.container.append(value)
+
+    def replace(self, value: Any) -> None:  # noqa: ANN401
+        if isinstance(self.container, dict):
+            self.container[self.key] = value  # pyright: ignore [reportArgumentType]
+        else:
+            self.container[-1] = value
+
+    def remove(self) -> None:
+        if isinstance(self.container, dict):
+            del self.container[self.key]  # pyright: ignore [reportArgumentType]
+        else:
+            self.container.pop()
+
+
+class PartialJsonParser:
+    """Incrementally parses the JSON object in a stream of text chunks.
+
+    Each call to `feed` only scans and decodes the newly received text, updating the
+    partially parsed object in place, so parsing a streamed object of length `n` costs
+    `O(n)` overall rather than re-parsing the accumulated output on every chunk (a
+    trailing incomplete string is extended by appending its newly decoded text). Any
+    text before the first `{` is skipped, as is any text after the object is closed.
+
+    The partial object follows `jiter`'s `trailing-strings` partial mode: incomplete
+    strings are included as-is, a trailing number or literal is included once it is
+    valid on its own (e.g. `12` or `true`, but not `1.` or `tr`), and incomplete keys
+    are not.
+
+    Raises `ValueError` from `feed` if the text is not valid JSON.
+    """
+
+    def __init__(self) -> None:
+        self.value: dict[str, Any] | None = None
+        self.done = False
+        # The top-level keys whose values changed during the last `feed`
+        self.changed_keys: set[str] = set()
+        self._stack: list[_Frame] = []
+        self._token: list[str] | None = None
+        self._token_kind = ""
+        self._escaped = False
+        # The decoded prefix of a trailing value string, the number of its raw pieces
+        # that are decoded, and any raw escape at its end that can't be decoded yet
+        self._decoded = ""
+        self._decoded_pieces = 0
+        self._undecoded = ""
+        # Whether the current scalar was added to the partial object while incomplete
+        self._scalar_added = False
+
+    def feed(self, text: str) -> bool:
+        """Parses the next chunk of text.
+
+        Args:
+            text: The newly received text.
+
+        Returns:
+            Whether the partially parsed object changed.
+        """
+        changed = False
+        self.changed_keys = set()
+        i, n = 0, len(text)
+        while i < n and not self.done:
+            token = self._token
+            if token is not None and self._token_kind != "scalar":
+                if self._escaped:
+                    token.append(text[i])
+                    self._escaped = False
+                    i += 1
+                    changed |= self._touch(self._token_kind == "value")
+                elif match := _STRING_BODY.match(text, i):
+                    token.append(match.group())
+                    i = match.end()
+                    changed |= self._touch(self._token_kind == "value")
+                elif text[i] == "\\":
+                    token.append("\\")
+                    self._escaped = True
+                    i += 1
+                else:
+                    i += 1
+                    self._end_string(token)
+                continue
+            char = text[i]
+            if token is not None:
+                if char in _SCALAR_CHARS:
+                    token.append(char)
+                    i += 1
+                    continue
+                changed |= self._touch(True)
+                self._end_scalar(token)
+            i += 1
+            if char in _WHITESPACE:
+                continue
+            if not self._stack:
+                if char == "{":
+                    self.value = {}
+                    self._stack.append(_Frame(self.value, "key"))
+                    changed = True
+                continue
+            changed |= self._touch(self._consume(char))
+
+        if self._token is not None and self._token_kind == "value":
+            self._stack[-1].replace(self._partial_string(self._token))
+        elif self._token is not None and self._token_kind == "scalar":
+            changed |= self._touch(self._partial_scalar(self._token))
+        return changed
+
+    def snapshot(self) -> dict[str, Any] | None:
+        """Returns a copy of the partial object that later chunks won't change.
+
+        Only the containers that are still open (the path from the object to the value
+        being parsed) can change, so only those are copied while the closed containers
+        are shared.
+        """
+        if self.value is None:
+            return None
+        copy: dict[str, Any] | list[Any] | None = None
+        for frame in reversed(self._stack):
+            container = frame.container.copy()
+            if copy is not None:
+                # An open container is always the last value added to its parent
+                if isinstance(container, dict):
+                    container[frame.key] = copy  # pyright: ignore [reportArgumentType]
+                else:
+                    container[-1] = copy
+            copy = container
+        return copy if copy is not None else dict(self.value)  # pyright: ignore [reportReturnType]
+
+    def _touch(self, changed: bool) -> bool:
+        """Records the current top-level key as changed if `changed`."""
+        if changed and self._stack and (key := self._stack[0].key) is not None:
+            self.changed_keys.add(key)
+        return changed
+
+    def _consume(self, char: str) -> bool:
+        frame = self._stack[-1]
+        expect = frame.expect
+        if expect == "key" and char == '"':
+            self._token, self._token_kind = [], "key"
+            return False
+        if expect == "colon" and char == ":":
+            frame.expect = "value"
+            return False
+        if (expect == "key" or expect == "comma") and char == "}":
+            return self._close(frame, dict)
+        if (expect == "value" or expect == "comma") and char == "]":
+            return self._close(frame, list)
+        if expect == "comma" and char == ",":
+            frame.expect = "key" if isinstance(frame.container, dict) else "value"
+            return False
+        if expect == "value":
+            frame.expect = "comma"
+            if char == "{":
+                container = {}
+                frame.add(container)
+                self._stack.append(_Frame(container, "key"))
+                return True
+            if char == "[":
+                container = []
+                frame.add(container)
+                self._stack.append(_Frame(container, "value"))
+                return True
+            if char == '"':
+                self._token, self._token_kind = [], "value"
+                self._decoded, self._decoded_pieces, self._undecoded = "", 0, ""
+                frame.add("")
+                return True
+            if char in _SCALAR_CHARS:
+                self._token, self._token_kind = [char], "scalar"
+                self._scalar_added = False
+                return False
+        raise ValueError(f"Unexpected character {char!r} in JSON output")
+
+    def _close(self, frame: _Frame, kind: type) -> bool:
+        if not isinstance(frame.container, kind):
+            raise ValueError("Mismatched closing bracket in JSON output")
+        self._stack.pop()
+        if not self._stack:
+            self.done = True
+        return False
+
+    def _end_string(self, token: list[str]) -> None:
+        frame = self._stack[-1]
+        value = _decode_string("".join(token))
+        if self._token_kind == "key":
+            frame.key = value
+            frame.expect = "colon"
+        else:
+            frame.replace(value)
+        self._token, self._token_kind = None, ""
+
+    def _end_scalar(self, token: list[str]) -> None:
+        value = json.loads("".join(token))
+        if self._scalar_added:
+            self._stack[-1].replace(value)
+        else:
+            self._stack[-1].add(value)
+        self._token, self._token_kind = None, ""
+
+    def _partial_scalar(self, token: list[str]) -> bool:
+        """Adds (or removes) the incomplete scalar, returning whether that changed."""
+        try:
+            value = json.loads("".join(token))
+        except ValueError:
+            value = _INCOMPLETE
+        frame = self._stack[-1]
+        if value is _INCOMPLETE:
+            if not self._scalar_added:
+                return False
+            frame.remove()
+            self._scalar_added = False
+        elif self._scalar_added:
+            frame.replace(value)
+        else:
+            frame.add(value)
+            self._scalar_added = True
+        return True
+
+    def _partial_string(self, token: list[str]) -> str:
+        """Returns the decoded trailing string, only decoding its new raw pieces."""
+        raw = self._undecoded + "".join(token[self._decoded_pieces :])
+        self._decoded_pieces = len(token)
+        # Hold back a trailing escape until it is complete
+        end = len(raw) - 1 if self._escaped else len(raw)
+        while (match := _INCOMPLETE_UNICODE_ESCAPE.search(raw, 0, end)) and len(
+            match.group(1)
+        ) % 2:
+            end = match.end(1) - 1
+        self._decoded += _decode_string(raw[:end])
+        self._undecoded = raw[end:]
+        return self._decoded
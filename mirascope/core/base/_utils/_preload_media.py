@@ -0,0 +1,58 @@
+"""This module provides a context manager for preloading a call's media."""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+from ..dynamic_config import BaseDynamicConfig
+from ._get_prompt_template import get_prompt_template
+from ._parse_content_template import load_media_async, preloaded_media
+from ._parse_prompt_messages import _split_role_templates
+
+_ROLES = ("system", "user", "assistant")
+
+
+@asynccontextmanager
+async def preload_media(
+    fn: Callable,
+    fn_args: dict[str, Any],
+    dynamic_config: BaseDynamicConfig,
+) -> AsyncIterator[None]:
+    """Concurrently loads the media of `fn`'s prompt template for `setup_call`.
+
+    Parsing the prompt template loads media (e.g. `{url:document}` or local images)
+    synchronously, which would block the event loop inside of async calls. Instead,
+    all of the template's media is loaded up front without blocking and reused when
+    the messages are parsed within the context.
+    """
+    if dynamic_config is not None and dynamic_config.get("messages", None):
+        yield
+        return
+    try:
+        template = get_prompt_template(fn)
+    except ValueError:
+        # `setup_call` raises the appropriate error
+        yield
+        return
+
+    attrs = fn_args
+    if dynamic_config is not None and (
+        computed_fields := dynamic_config.get("computed_fields", None)
+    ):
+        attrs = attrs | computed_fields
+    content_templates = [
+        content_template
+        for role, content_template in _split_role_templates(_ROLES, template)
+        if role != "messages"
+    ] or [template]
+    media = {}
+    for loaded in await asyncio.gather(
+        *(
+            load_media_async(content_template, attrs)
+            for content_template in content_templates
+        )
+    ):
+        media |= loaded
+    with preloaded_media(media):
+        yield
@@ -27,6 +27,44 @@ class ConvertCommonParamsFunc(Protocol[_BaseCallParamsT]):
     def __call__(self, common_params: CommonCallParams) -> _BaseCallParamsT: ...
 
 
+def _convert_tool(
+    tool: type[BaseTool] | Callable, tool_type: type[_BaseToolT]
+) -> type[_BaseToolT]:
+    """Returns `tool` converted into `tool_type`, cached on the source `tool`.
+
+    The cache lives on the source function or class itself (like `__mirascope_call__`)
+    so that it is released together with the source. Anything else (e.g. bound methods
+    or partials) is converted on every call.
+    """
+    if not (inspect.isclass(tool) or inspect.isfunction(tool)):
+        return convert_function_to_base_tool(tool, tool_type)
+
+    converted_tools = tool.__dict__.get("__mirascope_tool_types__")
+    if converted_tools is None:
+        converted_tools = {}
+        tool.__mirascope_tool_types__ = converted_tools  # pyright: ignore [reportFunctionMemberAccess, reportAttributeAccessIssue]
+    elif tool_type in converted_tools:
+        return converted_tools[tool_type]
+
+    converted_tool = (
+        convert_base_model_to_base_tool(tool, tool_type)
+        if inspect.isclass(tool)
+        else convert_function_to_base_tool(tool, tool_type)
+    )
+    converted_tools[tool_type] = converted_tool
+    return converted_tool
+
+
+def _get_tool_schema(tool_type: type[BaseTool]) -> Any:  # noqa: ANN401
+    """Returns the provider-specific schema of `tool_type`, memoized on the type.
+
+    The returned schema is shared across calls and must not be mutated.
+    """
+    if "__mirascope_tool_schema__" not in tool_type.__dict__:
+        tool_type.__mirascope_tool_schema__ = tool_type.tool_schema()  # pyright: ignore [reportAttributeAccessIssue]
+    return tool_type.__dict__["__mirascope_tool_schema__"]
+
+
 def setup_call(
     fn: Callable[..., _BaseDynamicConfigT | Awaitable[_BaseDynamicConfigT]]
     | Callable[..., Sequence[BaseMessageParam]]
@@ -68,12 +106,7 @@ def setup_call(
 
     tool_types = None
     if tools:
-        tool_types = [
-            convert_base_model_to_base_tool(tool, tool_type)
-            if inspect.isclass(tool)
-            else convert_function_to_base_tool(tool, tool_type)
-            for tool in tools
-        ]
-        call_kwargs["tools"] = [tool_type.tool_schema() for tool_type in tool_types]
+        tool_types = [_convert_tool(tool, tool_type) for tool in tools]
+        call_kwargs["tools"] = [_get_tool_schema(tool_type) for tool_type in tool_types]
 
     return prompt_template, messages, tool_types, call_kwargs
@@ -25,7 +25,14 @@ from .call_params import BaseCallParams
 from .dynamic_config import BaseDynamicConfig
 from .metadata import Metadata
 from .tool import BaseTool
-from .types import CostMetadata, FinishReason, JsonableType, Provider, Usage
+from .types import (
+    CostMetadata,
+    FinishReason,
+    JsonableType,
+    Provider,
+    Timings,
+    Usage,
+)
 
 if TYPE_CHECKING:
     from ...llm.tool import Tool
@@ -118,6 +125,8 @@ class BaseCallResponse(
             message. Otherwise `None`.
         start_time: The start time of the completion in ms.
         end_time: The end time of the completion in ms.
+        timings: The monotonic timings of the call (e.g. the time to first token of a
+            stream), if recorded.
     """
 
     metadata: Metadata
@@ -132,6 +141,7 @@ class BaseCallResponse(
     user_message_param: _UserMessageParamT | None = None
     start_time: float
     end_time: float
+    timings: Timings | None = None
 
     _message_converter: type[_BaseMessageParamConverterT]
     _provider: ClassVar[str] = "NO PROVIDER"
@@ -260,6 +270,13 @@ class BaseCallResponse(
             metadata=self.cost_metadata,
         )
 
+    @property
+    def output_tokens_per_second(self) -> float | None:
+        """Returns the output throughput of the call, if its timings were recorded."""
+        if self.timings is None:
+            return None
+        return self.timings.tokens_per_second(self.output_tokens)
+
     @property
     def provider(self) -> Provider:
         """Get the provider used for this API call."""
@@ -0,0 +1,280 @@
+"""The shared registry of default provider clients.
+
+When no `client` is provided to a call, each provider resolves its default client from
+this registry so that connection pools, TLS sessions, and keep-alive connections are
+reused across calls instead of being rebuilt on every invocation.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import inspect
+import os
+import threading
+import weakref
+from collections.abc import AsyncGenerator, Callable, Hashable
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from typing_extensions import TypedDict
+
+if TYPE_CHECKING:
+    import httpx
+
+_ClientT = TypeVar("_ClientT")
+
+
+class ClientPoolConfig(TypedDict, total=False):
+    """Configuration options for the HTTP connection pools of default clients.
+
+    Attributes:
+        max_connections (int | None): The maximum number of concurrent connections
+            (`max_pool_connections` for Bedrock's botocore clients).
+        max_keepalive_connections (int | None): The maximum number of idle connections
+            kept alive in the pool.
+        keepalive_expiry (float | None): The number of seconds an idle connection is
+            kept alive before being closed.
+        http2 (bool): Whether to enable HTTP/2 (requires `httpx[http2]`).
+        timeout (float | None): The default request timeout in seconds (the read
+            timeout for Bedrock's botocore clients).
+    """
+
+    max_connections: int | None
+    max_keepalive_connections: int | None
+    keepalive_expiry: float | None
+    http2: bool
+    timeout: float | None
+
+
+# The environment variables (besides the API key and base URL) that each provider's
+# SDK reads when creating a client, so that changing them creates a new client
+_PROVIDER_ENV_VARS: dict[str, tuple[str, ...]] = {
+    "anthropic": ("ANTHROPIC_AUTH_TOKEN",),
+    "cohere": ("COHERE_API_KEY",),
+    "google": (
+        "GOOGLE_GENAI_USE_VERTEXAI",
+        "GOOGLE_CLOUD_PROJECT",
+        "GOOGLE_CLOUD_LOCATION",
+    ),
+    "openai": ("OPENAI_ORG_ID", "OPENAI_PROJECT_ID"),
+}
+
+_pool_config: ClientPoolConfig | None = None
+_lock = threading.Lock()
+_pid = os.getpid()
+_sync_clients: dict[Hashable, Any] = {}
+_async_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[Hashable, Any]
+] = weakref.WeakKeyDictionary()
+# Keeps the shutdown hooks alive, since loops only track them through weak references
+_shutdown_hooks: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, AsyncGenerator[None, None]
+] = weakref.WeakKeyDictionary()
+
+
+def _reset_after_fork() -> None:
+    global _lock, _pid
+    _lock = threading.Lock()
+    _pid = os.getpid()
+    _sync_clients.clear()
+    _async_clients.clear()
+    _shutdown_hooks.clear()
+
+
+if hasattr(os, "register_at_fork"):  # pragma: no branch
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def configure_client_pool(config: ClientPoolConfig | None) -> None:
+    """Configures the HTTP connection pools used by default provider clients.
+
+    Providers whose SDKs accept a custom `httpx` client will build their default
+    clients on a pool with these settings. Any previously pooled clients are dropped so
+    that subsequent calls pick up the new configuration.
+
+    Example:
+
+    ```python
+    from mirascope.core import configure_client_pool
+
+    configure_client_pool({"max_connections": 200, "keepalive_expiry": 30.0})
+    ```
+
+    Args:
+        config: The pool configuration, or `None` to restore the SDK defaults.
+    """
+    global _pool_config
+    _pool_config = config
+    clear_client_pool()
+
+
+def clear_client_pool() -> None:
+    """Drops all pooled default clients so that the next call creates new ones."""
+    with _lock:
+        _sync_clients.clear()
+        _async_clients.clear()
+
+
+async def aclose_client_pool() -> None:
+    """Closes and drops all pooled default clients.
+
+    Call this on shutdown (e.g. in an ASGI lifespan handler) to release the clients'
+    connections. Async clients can only be closed from the event loop they belong to,
+    so those of other event loops are dropped without being closed.
+    """
+    with _lock:
+        clients = [
+            *_sync_clients.values(),
+            *_async_clients.get(asyncio.get_running_loop(), {}).values(),
+        ]
+        _sync_clients.clear()
+        _async_clients.clear()
+    await _aclose_clients(clients)
+
+
+async def _aclose_clients(clients: list[Any]) -> None:
+    for client in clients:
+        close = getattr(client, "aclose", None) or getattr(client, "close", None)
+        if callable(close) and inspect.isawaitable(result := close()):
+            await result
+
+
+def _close_clients_on_shutdown(loop: asyncio.AbstractEventLoop) -> None:
+    """Closes the async clients pooled for the running `loop` when it shuts down.
+
+    Async clients own connections bound to their loop, so they must be closed on it
+    before it goes away (e.g. at the end of every `asyncio.run`) or short-lived loops
+    leak their sessions. This starts an async generator on the loop, which the loop
+    closes in `shutdown_asyncgens` while it can still run the clients' `aclose`, so it
+    works for any loop implementation (e.g. `uvloop`). Loops closed without shutting
+    down their async generators need `aclose_client_pool` instead.
+    """
+
+    async def close_on_shutdown() -> AsyncGenerator[None, None]:
+        try:
+            yield
+        finally:
+            with _lock:
+                _shutdown_hooks.pop(loop, None)
+                clients = list(_async_clients.pop(loop, {}).values())
+            await _aclose_clients(clients)
+
+    with _lock:
+        if loop in _shutdown_hooks:
+            return
+        # The hooks of loops closed without shutting them down can't run anymore
+        for closed_loop in [loop for loop in _shutdown_hooks if loop.is_closed()]:
+            del _shutdown_hooks[closed_loop]
+        hook = _shutdown_hooks[loop] = close_on_shutdown()
+    # Run to the first `yield` so that the loop's `firstiter` hook tracks it
+    with contextlib.suppress(StopIteration):
+        hook.asend(None).send(None)
+
+
+def get_client_pool_config() -> ClientPoolConfig | None:
+    """Returns the current pool configuration set with `configure_client_pool`."""
+    return _pool_config
+
+
+def _get_httpx_client_kwargs(config: ClientPoolConfig) -> dict[str, Any]:
+    import httpx
+
+    return {
+        "limits": httpx.Limits(
+            max_connections=config.get("max_connections", 100),
+            max_keepalive_connections=config.get("max_keepalive_connections", 20),
+            keepalive_expiry=config.get("keepalive_expiry", 5.0),
+        ),
+        "http2": config.get("http2", False),
+        "timeout": config.get("timeout", 600.0),
+    }
+
+
+def create_http_client() -> httpx.Client | None:
+    """Returns an `httpx.Client` configured with the pool settings, if any.
+
+    Returns `None` if no pool configuration is set, in which case the provider SDK
+    should fall back to its own default HTTP client.
+    """
+    if _pool_config is None:
+        return None
+
+    import httpx
+
+    return httpx.Client(**_get_httpx_client_kwargs(_pool_config))
+
+
+def create_async_http_client() -> httpx.AsyncClient | None:
+    """Returns an `httpx.AsyncClient` configured with the pool settings, if any.
+
+    Returns `None` if no pool configuration is set, in which case the provider SDK
+    should fall back to its own default HTTP client.
+    """
+    if _pool_config is None:
+        return None
+
+    import httpx
+
+    return httpx.AsyncClient(**_get_httpx_client_kwargs(_pool_config))
+
+
+def get_default_client(
+    provider: str,
+    is_async: bool,
+    create_client: Callable[[], _ClientT],
+    *,
+    base_url: str | None = None,
+    api_key: str | None = None,
+) -> _ClientT:
+    """Returns the pooled default client for the given key, creating it if necessary.
+
+    Clients are keyed by `(provider, base_url, api_key, is_async)` along with the other
+    environment variables the provider's SDK reads on creation (e.g. `OPENAI_ORG_ID` or
+    `GOOGLE_GENAI_USE_VERTEXAI`). Async clients are additionally scoped to the running
+    event loop since their connection pools cannot be shared across loops, and are
+    closed when that loop shuts down its async generators (as `asyncio.run` does). The
+    registry is reset in forked child processes.
+
+    Args:
+        provider: The name of the provider the client is for.
+        is_async: Whether the client is an async client.
+        create_client: A function that creates a new client on a cache miss.
+        base_url: The base URL the client targets, if any.
+        api_key: The API key the client authenticates with, if any.
+
+    Returns:
+        The pooled client.
+    """
+    if os.getpid() != _pid:  # pragma: no cover
+        _reset_after_fork()
+
+    env = tuple(os.environ.get(name) for name in _PROVIDER_ENV_VARS.get(provider, ()))
+    key = (provider, base_url, api_key, is_async, env)
+    if is_async:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Without a running loop we can't safely scope the client, so don't pool it
+            return create_client()
+        _close_clients_on_shutdown(loop)
+        with _lock:
+            if (client := _async_clients.get(loop, {}).get(key)) is not None:
+                return client
+        # A loop's clients are only created from its own thread, so this can't race
+        client = create_client()
+        with _lock:
+            return _async_clients.setdefault(loop, {}).setdefault(key, client)
+
+    with _lock:
+        if (client := _sync_clients.get(key)) is not None:
+            return client
+    # Create the client outside the lock so that slow SDK setup doesn't serialize
+    # calls from other threads, closing it if another thread pooled one first
+    client = create_client()
+    with _lock:
+        pooled_client = _sync_clients.setdefault(key, client)
+    if pooled_client is not client and callable(
+        close := getattr(client, "close", None)
+    ):
+        close()
+    return pooled_client
@@ -1,9 +1,42 @@
 """This module contains the base class for message parameters."""
 
+import mmap
 from collections.abc import Sequence
-from typing import Literal
+from typing import Annotated, Any, Literal, TypeAlias
 
-from pydantic import BaseModel
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    SerializerFunctionWrapHandler,
+    ValidatorFunctionWrapHandler,
+    WrapSerializer,
+    WrapValidator,
+)
+
+
+def _validate_media_data(
+    value: Any,  # noqa: ANN401
+    handler: ValidatorFunctionWrapHandler,
+) -> bytes | memoryview:
+    if isinstance(value, mmap.mmap):
+        return memoryview(value)
+    return handler(value)
+
+
+def _serialize_media_data(
+    value: bytes | memoryview, handler: SerializerFunctionWrapHandler
+) -> Any:  # noqa: ANN401
+    return handler(bytes(value) if isinstance(value, memoryview) else value)
+
+
+# Raw media bytes, or a zero-copy `memoryview` of them (e.g. of an `mmap`'d file, which
+# is only paged into memory as it's read). Parts backed by a `memoryview` can't be
+# pickled or deep copied.
+MediaData: TypeAlias = Annotated[
+    bytes | memoryview,
+    WrapValidator(_validate_media_data),
+    WrapSerializer(_serialize_media_data),
+]
 
 
 class TextPart(BaseModel):
@@ -39,13 +72,15 @@ class ImagePart(BaseModel):
     Attributes:
         type: Always "image"
         media_type: The media type (e.g. image/jpeg)
-        image: The raw image bytes
+        image: The raw image bytes (or a `memoryview` of them)
         detail: (Optional) The detail to use for the image (supported by OpenAI)
     """
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     type: Literal["image"]
     media_type: str
-    image: bytes
+    image: MediaData
     detail: str | None
 
 
@@ -69,12 +104,15 @@ class AudioPart(BaseModel):
     Attributes:
         type: Always "audio"
         media_type: The media type (e.g. audio/wav)
-        audio: The raw audio bytes or base64 encoded audio data
+        audio: The raw audio bytes (or a `memoryview` of them) or base64 encoded audio
+            data
     """
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     type: Literal["audio"]
     media_type: str
-    audio: bytes | str
+    audio: MediaData | str
 
 
 class AudioURLPart(BaseModel):
@@ -95,12 +133,14 @@ class DocumentPart(BaseModel):
     Attributes:
         type: Always "document"
         media_type: The media type (e.g. application/pdf)
-        document: document data
+        document: document data (raw bytes or a `memoryview` of them)
     """
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     type: Literal["document"]
     media_type: str
-    document: bytes
+    document: MediaData
 
 
 class DocumentURLPart(BaseModel):
@@ -26,6 +26,7 @@ from ._utils import (
     get_metadata,
     get_possible_user_message_param,
     is_prompt_template,
+    preload_media,
 )
 from .call_kwargs import BaseCallKwargs
 from .call_params import BaseCallParams
@@ -36,7 +37,7 @@ from .messages import Messages
 from .metadata import Metadata
 from .prompt import prompt_template
 from .tool import BaseTool
-from .types import CostMetadata, Provider
+from .types import CostMetadata, Provider, Timings
 
 _BaseCallResponseT = TypeVar("_BaseCallResponseT", bound=BaseCallResponse)
 _BaseCallResponseChunkT = TypeVar(
@@ -80,7 +81,6 @@ class BaseStream(
             None,
         ]
     )
-    content: str
     metadata: Metadata
     tool_types: list[type[_BaseToolT]] | None
     call_response_type: type[_BaseCallResponseT]
@@ -100,6 +100,8 @@ class BaseStream(
     finish_reasons: list[_FinishReason] | None = None
     start_time: float = 0
     end_time: float = 0
+    timings: Timings | None = None
+    lightweight: bool = False
 
     _provider: ClassVar[str] = "NO PROVIDER"
 
@@ -146,14 +148,14 @@ class BaseStream(
         )
         self.content, tool_calls = "", []
         self.start_time = datetime.datetime.now().timestamp() * 1000
+        self.timings = Timings()
         for chunk, tool in self.stream:
             self._update_properties(chunk)
             if tool:
-                tool_call = getattr(tool, "tool_call", _DEFAULT)
-                if tool_call != _DEFAULT:
-                    tool_calls.append(tool_call)
+                self._record_tool(tool, tool_calls)
             yield chunk, tool
         self.end_time = datetime.datetime.now().timestamp() * 1000
+        self.timings.record_end()
         self.message_param = self._construct_message_param(
             tool_calls or None, self.content
         )
@@ -171,22 +173,70 @@ class BaseStream(
                 "Stream must be an async generator for __aiter__"
             )
             tool_calls = []
+            self.start_time = datetime.datetime.now().timestamp() * 1000
+            self.timings = timings = Timings()
             async for chunk, tool in self.stream:
                 self._update_properties(chunk)
                 if tool:
-                    tool_call = getattr(tool, "tool_call", _DEFAULT)
-                    if tool_call != _DEFAULT:
-                        tool_calls.append(tool_call)
+                    self._record_tool(tool, tool_calls)
                 yield chunk, tool
+            self.end_time = datetime.datetime.now().timestamp() * 1000
+            timings.record_end()
             self.message_param = self._construct_message_param(
                 tool_calls or None, self.content
             )
 
         return generator()
 
+    @property
+    def content(self) -> str:
+        """The content streamed so far."""
+        # Content is buffered as a list of chunks so that streaming is linear in the
+        # length of the content, and only joined (and compacted) when it's accessed
+        if len(self._content_chunks) > 1:
+            self._content_chunks[:] = ["".join(self._content_chunks)]
+        return self._content_chunks[0] if self._content_chunks else ""
+
+    @content.setter
+    def content(self, content: str) -> None:
+        self._content_chunks = [content] if content else []
+
+    def _record_tool(self, tool: _BaseToolT, tool_calls: list[Any]) -> None:
+        """Records a streamed tool, tracking when complete tool calls are done."""
+        tool_call = getattr(tool, "tool_call", _DEFAULT)
+        if tool_call != _DEFAULT:
+            tool_calls.append(tool_call)
+        if self.timings is not None and getattr(tool, "delta", None) is None:
+            self.timings.record_tool_call()
+
     def _update_properties(self, chunk: _BaseCallResponseChunkT) -> None:
-        """Updates the properties of the stream."""
-        self.content += chunk.content
+        """Updates the properties of the stream.
+
+        In `lightweight` mode, token counts are only read from chunks that report usage,
+        and the model and id are only read until the stream has an id.
+        """
+        if content := chunk.content:
+            self._content_chunks.append(content)
+        if self.timings is not None:
+            self.timings.record_chunk(bool(content))
+        if self.lightweight:
+            if chunk.usage is not None:
+                self._update_token_counts(chunk)
+            if self.id is None:
+                if (model := chunk.model) is not None:
+                    self.model = model
+                self.id = chunk.id
+        else:
+            self._update_token_counts(chunk)
+            if chunk.model is not None:
+                self.model = chunk.model
+            if chunk.id is not None:
+                self.id = chunk.id
+        if (finish_reasons := chunk.finish_reasons) is not None:
+            self.finish_reasons = finish_reasons
+
+    def _update_token_counts(self, chunk: _BaseCallResponseChunkT) -> None:
+        """Adds the token counts of the chunk to the stream's counts."""
         if chunk.input_tokens is not None:
             self.input_tokens = (
                 chunk.input_tokens
@@ -205,12 +255,6 @@ class BaseStream(
                 if not self.output_tokens
                 else self.output_tokens + chunk.output_tokens
             )
-        if chunk.model is not None:
-            self.model = chunk.model
-        if chunk.id is not None:
-            self.id = chunk.id
-        if chunk.finish_reasons is not None:
-            self.finish_reasons = chunk.finish_reasons
 
     @property
     def provider(self) -> Provider:
@@ -225,6 +269,13 @@ class BaseStream(
             cached_tokens=self.cached_tokens,
         )
 
+    @property
+    def output_tokens_per_second(self) -> float | None:
+        """Returns the output throughput of the stream, if available."""
+        if self.timings is None:
+            return None
+        return self.timings.tokens_per_second(self.output_tokens)
+
     @property
     def cost(self) -> float | None:
         """Calculate the cost of this streaming API call."""
@@ -313,6 +364,7 @@ def stream_factory(  # noqa: ANN201
         client: _SameSyncAndAsyncClientT | _SyncBaseClientT | None,
         call_params: _BaseCallParamsT,
         partial_tools: bool,
+        lightweight: bool,
     ) -> Callable[_P, BaseStream]: ...
 
     @overload
@@ -324,6 +376,7 @@ def stream_factory(  # noqa: ANN201
         client: _SameSyncAndAsyncClientT | _SyncBaseClientT | None,
         call_params: _BaseCallParamsT,
         partial_tools: bool,
+        lightweight: bool,
     ) -> Callable[_P, BaseStream]: ...
 
     @overload
@@ -339,6 +392,7 @@ def stream_factory(  # noqa: ANN201
         client: _SameSyncAndAsyncClientT | _AsyncBaseClientT | None,
         call_params: _BaseCallParamsT,
         partial_tools: bool,
+        lightweight: bool,
     ) -> Callable[_P, Awaitable[BaseStream]]: ...
 
     @overload
@@ -350,6 +404,7 @@ def stream_factory(  # noqa: ANN201
         client: _SameSyncAndAsyncClientT | _AsyncBaseClientT | None,
         call_params: _BaseCallParamsT,
         partial_tools: bool,
+        lightweight: bool,
     ) -> Callable[_P, Awaitable[BaseStream]]: ...
 
     def decorator(
@@ -367,6 +422,7 @@ def stream_factory(  # noqa: ANN201
         client: _SameSyncAndAsyncClientT | _SyncBaseClientT | _AsyncBaseClientT | None,
         call_params: _BaseCallParamsT,
         partial_tools: bool = False,
+        lightweight: bool = False,
     ) -> Callable[_P, BaseStream] | Callable[_P, Awaitable[BaseStream]]:
         if not is_prompt_template(fn):
             fn = cast(
@@ -389,18 +445,21 @@ def stream_factory(  # noqa: ANN201
                 nonlocal client
                 if dynamic_config is not None:
                     client = dynamic_config.get("client", None) or client
-                create, prompt_template, messages, tool_types, call_kwargs = setup_call(  # pyright: ignore [reportCallIssue]
-                    model=model,
-                    client=client,  # pyright: ignore [reportArgumentType]
-                    fn=fn,
-                    fn_args=fn_args,
-                    dynamic_config=dynamic_config,
-                    tools=tools,
-                    json_mode=json_mode,
-                    call_params=call_params,
-                    response_model=None,
-                    stream=True,
-                )
+                async with preload_media(fn, fn_args, dynamic_config):
+                    create, prompt_template, messages, tool_types, call_kwargs = (
+                        setup_call(  # pyright: ignore [reportCallIssue]
+                            model=model,
+                            client=client,  # pyright: ignore [reportArgumentType]
+                            fn=fn,
+                            fn_args=fn_args,
+                            dynamic_config=dynamic_config,
+                            tools=tools,
+                            json_mode=json_mode,
+                            call_params=call_params,
+                            response_model=None,
+                            stream=True,
+                        )
+                    )
 
                 async def generator() -> AsyncGenerator[
                     tuple[_BaseCallResponseChunkT, _BaseToolT | None], None
@@ -412,7 +471,7 @@ def stream_factory(  # noqa: ANN201
                     ):
                         yield chunk, tool
 
-                return TStream(
+                stream = TStream(
                     stream=generator(),
                     metadata=get_metadata(fn, dynamic_config),
                     tool_types=tool_types,  # pyright: ignore [reportArgumentType]
@@ -425,6 +484,8 @@ def stream_factory(  # noqa: ANN201
                     call_params=call_params,
                     call_kwargs=call_kwargs,
                 )
+                stream.lightweight = lightweight
+                return stream
 
             return inner_async
         else:
@@ -460,7 +521,7 @@ def stream_factory(  # noqa: ANN201
                         partial_tools=partial_tools,
                     )
 
-                return TStream(
+                stream = TStream(
                     stream=generator(),
                     metadata=get_metadata(fn, dynamic_config),
                     tool_types=tool_types,  # pyright: ignore [reportArgumentType]
@@ -473,6 +534,8 @@ def stream_factory(  # noqa: ANN201
                     call_params=call_params,
                     call_kwargs=call_kwargs,
                 )
+                stream.lightweight = lightweight
+                return stream
 
             return inner
 
@@ -1,11 +1,16 @@
 from typing_extensions import TypedDict
 
 
-class StreamConfig(TypedDict):
+class StreamConfig(TypedDict, total=False):
     """Configuration options for streaming.
 
     Attributes:
         partial_tools (bool): Whether to stream partial tool responses
+        lightweight (bool): Whether to reduce the per-chunk overhead of the stream by
+            only reading token counts from chunks that report usage and only reading
+            the model and id until the stream has an id. Useful when serving many
+            concurrent streams.
     """
 
     partial_tools: bool
+    lightweight: bool
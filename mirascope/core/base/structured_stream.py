@@ -1,5 +1,6 @@
 """This module defines the base class for structured streams."""
 
+import time
 from collections.abc import (
     AsyncGenerator,
     AsyncIterable,
@@ -19,6 +20,7 @@ from typing import (
 )
 
 from pydantic import BaseModel
+from typing_extensions import Self
 
 from ._utils import (
     BaseType,
@@ -32,6 +34,7 @@ from ._utils import (
 from ._utils._get_fields_from_call_args import (
     get_fields_from_call_args,
 )
+from ._utils._partial_json_parser import PartialJsonParser
 from .call_params import BaseCallParams
 from .call_response import BaseCallResponse
 from .call_response_chunk import BaseCallResponseChunk
@@ -49,6 +52,21 @@ _BaseDynamicConfigT = TypeVar("_BaseDynamicConfigT", bound=BaseDynamicConfig)
 _ResponseModelT = TypeVar("_ResponseModelT", bound=BaseModel | BaseType)
 
 
+class _PartialOutputState:
+    """The incremental parsing state of a single iteration over a structured stream."""
+
+    def __init__(self) -> None:
+        self.parser: PartialJsonParser | None = PartialJsonParser()
+        self.contents: list[str] = []
+        self.pending_chunks = 0
+        self.last_yield_time = time.perf_counter()
+
+    def json_output(self) -> str:
+        json_output = "".join(self.contents)
+        json_start = json_output.find("{")
+        return json_output[json_start:] if json_start >= 0 else ""
+
+
 class BaseStructuredStream(Generic[_ResponseModelT]):
     """A base class for streaming structured outputs from LLMs."""
 
@@ -67,59 +85,111 @@ class BaseStructuredStream(Generic[_ResponseModelT]):
         self.stream = stream
         self.response_model = response_model
         self.fields_from_call_args = fields_from_call_args
+        self.yield_every_n_chunks: int | None = None
+        self.yield_every_seconds: float | None = None
 
-    def __iter__(self) -> Generator[_ResponseModelT, None, None]:
-        """Iterates over the stream and extracts structured outputs."""
-        json_output = ""
-        for chunk, _ in self.stream:
-            json_output += chunk.content
-            if json_output and json_output[0] != "{":
-                try:
-                    json_start = json_output.index("{")
-                    json_output = json_output[json_start:]
-                except ValueError:
-                    json_output = ""
-            if chunk.model is not None:
-                self.stream.model = chunk.model
-            if json_output:
-                yield extract_tool_return(
-                    self.response_model, json_output, True, self.fields_from_call_args
+    def throttle(
+        self, *, every_n_chunks: int | None = None, every_seconds: float | None = None
+    ) -> Self:
+        """Limits how often partial outputs are yielded while streaming.
+
+        By default a partial output is yielded for every chunk that changes the parsed
+        output. With throttling, changes are batched until at least `every_n_chunks`
+        chunks have changed the output or `every_seconds` seconds have passed since the
+        last partial output. The final, fully validated output is always yielded.
+
+        Example:
+
+        ```python
+        for book in recommend_book("fantasy").throttle(every_seconds=0.1):
+            print(book)
+        ```
+
+        Args:
+            every_n_chunks: The minimum number of changing chunks between partial
+                outputs.
+            every_seconds: The minimum number of seconds between partial outputs.
+
+        Returns:
+            The structured stream, for chaining.
+        """
+        self.yield_every_n_chunks = every_n_chunks
+        self.yield_every_seconds = every_seconds
+        return self
+
+    def _handle_chunk(
+        self, state: _PartialOutputState, chunk: BaseCallResponseChunk
+    ) -> _ResponseModelT | None:
+        """Parses the chunk's content, returning the updated partial output, if any."""
+        if chunk.model is not None:
+            self.stream.model = chunk.model
+        content = chunk.content
+        state.contents.append(content)
+        try:
+            changed = state.parser is None or state.parser.feed(content)
+        except ValueError:
+            # Fall back to re-parsing the full output so errors surface as before
+            state.parser, changed = None, True
+        state.pending_chunks += changed
+        if not state.pending_chunks:
+            return None
+
+        if (
+            self.yield_every_n_chunks is not None
+            or self.yield_every_seconds is not None
+        ):
+            now = time.perf_counter()
+            if not (
+                (
+                    self.yield_every_n_chunks is not None
+                    and state.pending_chunks >= self.yield_every_n_chunks
+                )
+                or (
+                    self.yield_every_seconds is not None
+                    and now - state.last_yield_time >= self.yield_every_seconds
                 )
+            ):
+                return None
+            state.last_yield_time = now
+        state.pending_chunks = 0
+
+        # Changes only start at the opening brace, so the output is never empty here
+        json_output: str | dict[str, Any]
+        if state.parser is None:
+            json_output = state.json_output()
+        else:
+            # Copy the open containers so that later chunks don't change the output
+            json_output = cast(dict[str, Any], state.parser.snapshot())
+        return extract_tool_return(
+            self.response_model, json_output, True, self.fields_from_call_args
+        )
+
+    def _construct_response_model(self, state: _PartialOutputState) -> _ResponseModelT:
+        json_output = state.json_output()
         if json_output:
             json_output = json_output[: json_output.rfind("}") + 1]
         self.constructed_response_model = extract_tool_return(
             self.response_model, json_output, False, self.fields_from_call_args
         )
-        yield self.constructed_response_model
+        return self.constructed_response_model
+
+    def __iter__(self) -> Generator[_ResponseModelT, None, None]:
+        """Iterates over the stream and extracts structured outputs."""
+        state = _PartialOutputState()
+        for chunk, _ in self.stream:
+            if (output := self._handle_chunk(state, chunk)) is not None:
+                yield output
+        yield self._construct_response_model(state)
 
     def __aiter__(self) -> AsyncGenerator[_ResponseModelT, None]:
         """Iterates over the stream and extracts structured outputs."""
 
         async def generator() -> AsyncGenerator[_ResponseModelT, None]:
-            json_output = ""
+            state = _PartialOutputState()
             async for chunk, _ in self.stream:
-                json_output += chunk.content
-                if json_output and json_output[0] != "{":
-                    try:
-                        json_start = json_output.index("{")
-                        json_output = json_output[json_start:]
-                    except ValueError:
-                        json_output = ""
-                if chunk.model is not None:
-                    self.stream.model = chunk.model
-                if json_output:
-                    yield extract_tool_return(
-                        self.response_model,
-                        json_output,
-                        True,
-                        self.fields_from_call_args,
-                    )
-            if json_output:
-                json_output = json_output[: json_output.rfind("}") + 1]
-            self.constructed_response_model = extract_tool_return(
-                self.response_model, json_output, False, self.fields_from_call_args
-            )
-            yield self.constructed_response_model
+                if (output := self._handle_chunk(state, chunk)) is not None:
+                    yield output
+            yield self._construct_response_model(state)
 
         return generator()
 
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import time
+from bisect import bisect_left
 from typing import TYPE_CHECKING, Annotated, Literal, TypeAlias
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 if TYPE_CHECKING:
     from PIL import Image
@@ -324,6 +326,161 @@ class CostMetadata(BaseModel):
     ] = None
 
 
+INTER_CHUNK_LATENCY_BUCKETS: tuple[float, ...] = (
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+)
+"""The upper bounds (in ms) of the inter-chunk latency histogram buckets."""
+
+
+def _now() -> float:
+    return time.perf_counter() * 1000
+
+
+class Timings(BaseModel):
+    """Monotonic timings of an LLM call.
+
+    All timestamps are in ms on the `time.perf_counter` clock, so only the differences
+    between them are meaningful. The derived metrics (e.g. `time_to_first_token`) are
+    cheap to access since everything they need is recorded as the call progresses.
+
+    The inter-chunk latency histogram has one count per bucket in
+    `INTER_CHUNK_LATENCY_BUCKETS` plus a final count for latencies above the last bucket.
+    """
+
+    request_sent: float = Field(default_factory=lambda: _now())
+    """When the request was sent."""
+
+    first_byte: float | None = None
+    """When the first chunk of the response was received."""
+
+    first_token: float | None = None
+    """When the first chunk with content was received."""
+
+    last_token: float | None = None
+    """When the last chunk with content was received."""
+
+    tool_calls_completed: list[float] = []
+    """When each complete tool call was constructed."""
+
+    end: float | None = None
+    """When the response was fully received."""
+
+    chunk_count: int = 0
+    """The number of chunks received."""
+
+    inter_chunk_latency_counts: list[int] = Field(
+        default_factory=lambda: [0] * (len(INTER_CHUNK_LATENCY_BUCKETS) + 1)
+    )
+    """The histogram of the latencies between consecutive chunks."""
+
+    inter_chunk_latency_total: float = 0
+    """The sum of the latencies between consecutive chunks."""
+
+    max_inter_chunk_latency: float | None = None
+    """The largest latency between consecutive chunks."""
+
+    _last_chunk: float | None = PrivateAttr(default=None)
+
+    def record_chunk(self, has_content: bool) -> None:
+        """Records that a chunk was received."""
+        now = _now()
+        if self._last_chunk is None:
+            self.first_byte = now
+        else:
+            latency = now - self._last_chunk
+            self.inter_chunk_latency_counts[
+                bisect_left(INTER_CHUNK_LATENCY_BUCKETS, latency)
+            ] += 1
+            self.inter_chunk_latency_total += latency
+            if (
+                self.max_inter_chunk_latency is None
+                or latency > self.max_inter_chunk_latency
+            ):
+                self.max_inter_chunk_latency = latency
+        self._last_chunk = now
+        self.chunk_count += 1
+        if has_content:
+            if self.first_token is None:
+                self.first_token = now
+            self.last_token = now
+
+    def record_tool_call(self) -> None:
+        """Records that a complete tool call was constructed."""
+        self.tool_calls_completed.append(_now())
+
+    def record_end(self) -> None:
+        """Records that the response was fully received."""
+        self.end = _now()
+
+    @property
+    def time_to_first_byte(self) -> float | None:
+        """The time (in ms) from sending the request to receiving the first chunk."""
+        if self.first_byte is None:
+            return None
+        return self.first_byte - self.request_sent
+
+    @property
+    def time_to_first_token(self) -> float | None:
+        """The time (in ms) from sending the request to receiving the first content."""
+        if self.first_token is None:
+            return None
+        return self.first_token - self.request_sent
+
+    @property
+    def duration(self) -> float | None:
+        """The time (in ms) from sending the request to fully receiving the response."""
+        if self.end is None:
+            return None
+        return self.end - self.request_sent
+
+    @property
+    def mean_inter_chunk_latency(self) -> float | None:
+        """The mean latency (in ms) between consecutive chunks."""
+        if self.chunk_count < 2:
+            return None
+        return self.inter_chunk_latency_total / (self.chunk_count - 1)
+
+    def tokens_per_second(self, tokens: int | float | None) -> float | None:
+        """Returns the throughput of generating `tokens` tokens.
+
+        For streams this is measured from the first to the last content chunk so that
+        it isn't skewed by the time to first token, and otherwise over the whole call.
+        """
+        if not tokens:
+            return None
+        if (
+            self.first_token is not None
+            and self.last_token is not None
+            and self.last_token > self.first_token
+        ):
+            elapsed = self.last_token - self.first_token
+        elif (duration := self.duration) is not None and duration > 0:
+            elapsed = duration
+        else:
+            return None
+        return tokens / elapsed * 1000
+
+    @property
+    def metrics(self) -> dict[str, float]:
+        """The derived metrics that are available, keyed by name."""
+        metrics = {
+            "time_to_first_byte": self.time_to_first_byte,
+            "time_to_first_token": self.time_to_first_token,
+            "duration": self.duration,
+            "mean_inter_chunk_latency": self.mean_inter_chunk_latency,
+            "max_inter_chunk_latency": self.max_inter_chunk_latency,
+        }
+        return {name: value for name, value in metrics.items() if value is not None}
+
+
 Provider: TypeAlias = Literal[
     "anthropic",
     "azure",
@@ -3,11 +3,12 @@
 from typing import cast
 
 from ...base import BaseMessageParam
-from ...base._utils import get_image_type
+from ...base._utils import cache_message_conversion, get_image_type
 from ...base._utils._parse_content_template import _load_media
 from .._types import ConversationRoleType, InternalBedrockMessageParam
 
 
+@cache_message_conversion
 def convert_message_params(
     message_params: list[BaseMessageParam | InternalBedrockMessageParam],
 ) -> list[InternalBedrockMessageParam]:
@@ -42,7 +43,7 @@ def convert_message_params(
                         {
                             "image": {
                                 "format": part.media_type.split("/")[-1],
-                                "source": {"bytes": part.image},
+                                "source": {"bytes": bytes(part.image)},
                             }
                         }
                     )
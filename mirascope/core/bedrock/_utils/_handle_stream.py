@@ -19,7 +19,7 @@ from ..tool import BedrockTool
 
 class ToolUseChunk(TypedDict):
     tool_use_id: str
-    input_chunk: str
+    input_chunks: list[str]
     name: str
     stop: bool
 
@@ -27,21 +27,21 @@ class ToolUseChunk(TypedDict):
 def _handle_chunk(
     chunk: StreamOutputChunk | AsyncStreamOutputChunk,
     current_tool_use_chunk: ToolUseChunk | None,
-    tool_types: list[type[BedrockTool]] | None,
+    tool_types_by_name: dict[str, type[BedrockTool]],
 ) -> tuple[
     BedrockCallResponseChunk | None,
     BedrockTool | None,
     ToolUseChunk | None,
 ]:
     """Handles a chunk of the stream."""
-    if not tool_types:
+    if not tool_types_by_name:
         return BedrockCallResponseChunk(chunk=chunk), None, None
     elif (content_block_start := chunk.get("contentBlockStart")) and (
         tool_use := content_block_start["start"].get("toolUse")
     ):
         current_tool_use_chunk = ToolUseChunk(
             tool_use_id=tool_use["toolUseId"],
-            input_chunk="",
+            input_chunks=[],
             name=tool_use["name"],
             stop=False,
         )
@@ -51,26 +51,29 @@ def _handle_chunk(
         and current_tool_use_chunk
         and not current_tool_use_chunk["stop"]
     ):
-        current_tool_use_chunk["input_chunk"] += tool_use["input"]
+        # Joined once the tool use stops so that accumulating the input stays linear
+        current_tool_use_chunk["input_chunks"].append(tool_use["input"])
         return None, None, current_tool_use_chunk
     elif "contentBlockStop" in chunk and current_tool_use_chunk:
         current_tool_use_chunk["stop"] = True
         return None, None, current_tool_use_chunk
-    elif current_tool_use_chunk and current_tool_use_chunk["stop"]:
-        for tool_type in tool_types:
-            if current_tool_use_chunk["name"] == tool_type._name():
-                current_tool_use = ToolUseBlockContentTypeDef(
-                    toolUse=ToolUseBlockOutputTypeDef(
-                        toolUseId=current_tool_use_chunk["tool_use_id"],
-                        input=json.loads(current_tool_use_chunk["input_chunk"]),
-                        name=current_tool_use_chunk["name"],
-                    )
-                )
-                return (
-                    BedrockCallResponseChunk(chunk=chunk),
-                    tool_type.from_tool_call(current_tool_use),
-                    None,
-                )
+    elif (
+        current_tool_use_chunk
+        and current_tool_use_chunk["stop"]
+        and (tool_type := tool_types_by_name.get(current_tool_use_chunk["name"]))
+    ):
+        current_tool_use = ToolUseBlockContentTypeDef(
+            toolUse=ToolUseBlockOutputTypeDef(
+                toolUseId=current_tool_use_chunk["tool_use_id"],
+                input=json.loads("".join(current_tool_use_chunk["input_chunks"])),
+                name=current_tool_use_chunk["name"],
+            )
+        )
+        return (
+            BedrockCallResponseChunk(chunk=chunk),
+            tool_type.from_tool_call(current_tool_use),
+            None,
+        )
     return BedrockCallResponseChunk(chunk=chunk), None, current_tool_use_chunk
 
 
@@ -80,10 +83,13 @@ def handle_stream(
     partial_tools: bool = False,
 ) -> Generator[tuple[BedrockCallResponseChunk, BedrockTool | None], None, None]:
     """Iterator over the stream and constructs tools as they are streamed."""
+    tool_types_by_name = {
+        tool_type._name(): tool_type for tool_type in tool_types or []
+    }
     current_tool_use_chunk = None
     for chunk in stream:
         call_response, tool, current_tool_use_chunk = _handle_chunk(
-            chunk, current_tool_use_chunk, tool_types
+            chunk, current_tool_use_chunk, tool_types_by_name
         )
         if call_response:
             yield call_response, tool
@@ -95,10 +101,13 @@ async def handle_stream_async(
     partial_tools: bool = False,
 ) -> AsyncGenerator[tuple[BedrockCallResponseChunk, BedrockTool | None], None]:
     """Async iterator over the stream and constructs tools as they are streamed."""
+    tool_types_by_name = {
+        tool_type._name(): tool_type for tool_type in tool_types or []
+    }
     current_tool_use_chunk = None
     async for chunk in stream:
         call_response, tool, current_tool_use_chunk = _handle_chunk(
-            chunk, current_tool_use_chunk, tool_types
+            chunk, current_tool_use_chunk, tool_types_by_name
         )
         if call_response:
             yield call_response, tool
@@ -11,6 +11,9 @@ from mirascope.core.base import (
 from mirascope.core.base._utils._base_message_param_converter import (
     BaseMessageParamConverter,
 )
+from mirascope.core.base._utils._cache_message_conversion import (
+    cache_message_conversion,
+)
 
 from .._types import (
     InternalBedrockMessageParam,
@@ -40,6 +43,7 @@ class BedrockMessageParamConverter(BaseMessageParamConverter):
         )
 
     @staticmethod
+    @cache_message_conversion
     def from_provider(
         message_params: list[InternalBedrockMessageParam],
     ) -> list[BaseMessageParam]:
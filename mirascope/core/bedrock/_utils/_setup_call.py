@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 from collections.abc import AsyncGenerator, Awaitable, Callable, Coroutine, Generator
+from contextlib import AsyncExitStack
 from functools import wraps
 from typing import Any, ParamSpec, cast, overload
 
 import aiobotocore.client
 from aiobotocore.session import AioSession, get_session
 from boto3.session import Session
+from botocore.config import Config
 from mypy_boto3_bedrock_runtime import BedrockRuntimeClient
 from mypy_boto3_bedrock_runtime.type_defs import (
     ConverseResponseTypeDef,
@@ -45,6 +48,7 @@ from ...base._utils import (
     get_create_fn,
 )
 from ...base.call_params import CommonCallParams
+from ...base.client_pool import get_client_pool_config, get_default_client
 from ...base.stream_config import StreamConfig
 from .._call_kwargs import BedrockCallKwargs
 from .._types import (
@@ -95,27 +99,66 @@ def _extract_async_stream_fn(
 
 
 class _AsyncBedrockRuntimeWrappedClient:
-    def __init__(self, session: AioSession, model: str) -> None:
+    """Lazily creates and then reuses a single `bedrock-runtime` client.
+
+    Creating an aiobotocore client resolves the endpoint and credentials and builds a
+    new connection pool, so the client is entered once on first use and kept open
+    until `close` is called.
+    """
+
+    def __init__(self, session: AioSession, config: Config | None = None) -> None:
         self.session: AioSession = session
-        self.model: str = model
+        self.config: Config | None = config
+        self._client: AsyncBedrockRuntimeClient | None = None
+        self._exit_stack = AsyncExitStack()
+        self._lock: asyncio.Lock | None = None
+
+    async def _get_client(self) -> AsyncBedrockRuntimeClient:
+        if self._client is not None:
+            return self._client
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._client is None:
+                self._client = await self._exit_stack.enter_async_context(
+                    self.session.create_client("bedrock-runtime", config=self.config)
+                )
+        return self._client
 
     async def converse(
         self, **kwargs: Unpack[AsyncConverseRequestRequestTypeDef]
     ) -> AsyncConverseResponseTypeDef:
-        async with self.session.create_client("bedrock-runtime") as client:
-            return await client.converse(**kwargs)
+        client = await self._get_client()
+        return await client.converse(**kwargs)
 
     async def converse_stream(
         self, **kwargs: Unpack[AsyncConverseStreamRequestRequestTypeDef]
     ) -> AsyncGenerator[AsyncStreamOutputChunk, None]:
-        async with self.session.create_client("bedrock-runtime") as client:
-            response = await client.converse_stream(**kwargs)
-            async for chunk in response["stream"]:
-                yield AsyncStreamOutputChunk(
-                    responseMetadata=response["ResponseMetadata"],
-                    model=self.model,
-                    **chunk,
-                )
+        client = await self._get_client()
+        response = await client.converse_stream(**kwargs)
+        async for chunk in response["stream"]:
+            yield AsyncStreamOutputChunk(
+                responseMetadata=response["ResponseMetadata"],
+                model=kwargs["modelId"],
+                **chunk,
+            )
+
+    async def close(self) -> None:
+        """Closes the underlying client, which is recreated if used again."""
+        self._client = None
+        await self._exit_stack.aclose()
+
+
+def _get_config() -> Config | None:
+    """Returns the botocore client config for the client pool configuration."""
+    if (pool_config := get_client_pool_config()) is None:
+        return None
+    kwargs = {}
+    if max_connections := pool_config.get("max_connections"):
+        kwargs["max_pool_connections"] = max_connections
+    if (timeout := pool_config.get("timeout")) is not None:
+        kwargs["read_timeout"] = timeout
+    return Config(**kwargs)
 
 
 @overload
@@ -236,12 +279,24 @@ def setup_call(
     if profile_name := os.getenv("AWS_PROFILE"):
         env_vars["profile_name"] = profile_name
     if client is None:
-        if fn_is_async(fn):
-            session = get_session(env_vars=env_vars)
-            _client = _AsyncBedrockRuntimeWrappedClient(session, model)
-        else:
-            session = Session(**env_vars)
-            _client = session.client("bedrock-runtime")
+        is_async = fn_is_async(fn)
+
+        def create_client() -> BedrockRuntimeClient | _AsyncBedrockRuntimeWrappedClient:
+            if is_async:
+                return _AsyncBedrockRuntimeWrappedClient(
+                    get_session(env_vars=env_vars), _get_config()
+                )
+            return Session(**env_vars).client("bedrock-runtime", config=_get_config())
+
+        # Clients are pooled per credentials and region (the config is reset along
+        # with the pool), so the key includes every resolved environment variable
+        _client = get_default_client(
+            "bedrock",
+            is_async,
+            create_client,
+            base_url=env_vars.get("region_name"),
+            api_key="\n".join(f"{key}={value}" for key, value in env_vars.items()),
+        )
     else:
         _client = client
     if isinstance(_client, aiobotocore.client.AioBaseClient):
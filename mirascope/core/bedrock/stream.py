@@ -146,6 +146,7 @@ class BedrockStream(
             user_message_param=self.user_message_param,
             start_time=self.start_time,
             end_time=self.end_time,
+            timings=self.timings,
         )
 
     @property
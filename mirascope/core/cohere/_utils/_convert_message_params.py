@@ -3,8 +3,10 @@
 from cohere.types import ChatMessage
 
 from ...base import BaseMessageParam
+from ...base._utils import cache_message_conversion
 
 
+@cache_message_conversion
 def convert_message_params(
     message_params: list[BaseMessageParam | ChatMessage],
 ) -> list[ChatMessage]:
@@ -7,6 +7,9 @@ from mirascope.core.base import TextPart, ToolCallPart
 from mirascope.core.base._utils._base_message_param_converter import (
     BaseMessageParamConverter,
 )
+from mirascope.core.base._utils._cache_message_conversion import (
+    cache_message_conversion,
+)
 from mirascope.core.cohere._utils import convert_message_params
 
 
@@ -23,6 +26,7 @@ class CohereMessageParamConverter(BaseMessageParamConverter):
         )
 
     @staticmethod
+    @cache_message_conversion
     def from_provider(message_params: list[ChatMessage]) -> list[BaseMessageParam]:
         """
         Convert from Cohere's `ChatMessage` to Mirascope `BaseMessageParam`.
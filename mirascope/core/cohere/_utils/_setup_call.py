@@ -1,6 +1,7 @@
 """This module contains the setup_call function for Cohere tools."""
 
 import inspect
+import os
 from collections.abc import (
     Awaitable,
     Callable,
@@ -27,6 +28,11 @@ from ...base._utils import (
     get_create_fn,
 )
 from ...base.call_params import CommonCallParams
+from ...base.client_pool import (
+    create_async_http_client,
+    create_http_client,
+    get_default_client,
+)
 from ...base.stream_config import StreamConfig
 from .._call_kwargs import CohereCallKwargs
 from ..call_params import CohereCallParams
@@ -139,7 +145,20 @@ def setup_call(
     }
 
     if client is None:
-        client = AsyncClient() if inspect.iscoroutinefunction(fn) else Client()
+        is_async = inspect.iscoroutinefunction(fn)
+
+        def create_client() -> Client | AsyncClient:
+            if is_async:
+                return AsyncClient(httpx_client=create_async_http_client())
+            return Client(httpx_client=create_http_client())
+
+        client = get_default_client(
+            "cohere",
+            is_async,
+            create_client,
+            base_url=os.environ.get("CO_API_URL"),
+            api_key=os.environ.get("CO_API_KEY"),
+        )
 
     create_or_stream = (
         get_async_create_fn(client.chat, client.chat_stream)
@@ -7,10 +7,11 @@ from google.generativeai import protos
 from google.generativeai.types import ContentDict
 
 from ...base import BaseMessageParam
-from ...base._utils import get_audio_type
+from ...base._utils import cache_message_conversion, get_audio_type
 from ...base._utils._parse_content_template import _load_media
 
 
+@cache_message_conversion
 def convert_message_params(
     message_params: list[BaseMessageParam | ContentDict],
 ) -> list[ContentDict]:
@@ -91,7 +92,12 @@ def convert_message_params(
                             "and FLAC audio file types."
                         )
                     converted_content.append(
-                        {"mime_type": part.media_type, "data": part.audio}
+                        {
+                            "mime_type": part.media_type,
+                            "data": bytes(part.audio)
+                            if isinstance(part.audio, memoryview)
+                            else part.audio,
+                        }
                     )
                 elif part.type == "audio_url":
                     if part.url.startswith(("https://", "http://")):
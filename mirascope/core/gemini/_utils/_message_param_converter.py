@@ -19,6 +19,9 @@ from mirascope.core.base import (
 from mirascope.core.base._utils._base_message_param_converter import (
     BaseMessageParamConverter,
 )
+from mirascope.core.base._utils._cache_message_conversion import (
+    cache_message_conversion,
+)
 from mirascope.core.base.message_param import ToolCallPart, ToolResultPart
 from mirascope.core.gemini._utils import convert_message_params
 
@@ -80,6 +83,7 @@ class GeminiMessageParamConverter(BaseMessageParamConverter):
         )
 
     @staticmethod
+    @cache_message_conversion
     def from_provider(message_params: list[ContentDict]) -> list[BaseMessageParam]:
         """
         Convert from Gemini's `ContentDict` to Mirascope `BaseMessageParam`.
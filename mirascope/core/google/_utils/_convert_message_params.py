@@ -2,13 +2,19 @@
 
 import asyncio
 import base64
+import hashlib
 import io
+import threading
+import weakref
 from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import NamedTuple
 
 from google.genai import Client
 from google.genai.types import (
     BlobDict,
     ContentDict,
+    File,
     FileDataDict,
     FunctionCallDict,
     FunctionResponseDict,
@@ -33,10 +39,108 @@ def _over_file_size_limit(size: int) -> bool:
     return size > 10 * 1024 * 1024  # 10MB
 
 
-async def _convert_message_params_async(
+# Uploaded files expire after 48 hours, and we stop reusing them a bit before that so
+# that they don't expire while the request is in flight
+_FILE_TTL = timedelta(hours=48)
+_FILE_EXPIRATION_MARGIN = timedelta(minutes=10)
+
+
+class _UploadedFile(NamedTuple):
+    uri: str
+    mime_type: str | None
+    expiration_time: datetime
+
+
+class _PendingUpload(NamedTuple):
+    parts: list[PartDict]
+    index: int
+    blob_dict: BlobDict
+    key: tuple[str, str | None]
+
+
+# Files are only accessible to the account that uploaded them, so the registry is
+# scoped to the client that uploaded them (and keyed by the content hash and type)
+_uploaded_files: weakref.WeakKeyDictionary[
+    Client, dict[tuple[str, str | None], _UploadedFile]
+] = weakref.WeakKeyDictionary()
+_uploaded_files_lock = threading.Lock()
+
+
+def _upload_key(blob_dict: BlobDict) -> tuple[str, str | None]:
+    data = blob_dict.get("data") or b""
+    return hashlib.sha256(data).hexdigest(), blob_dict.get("mime_type", None)
+
+
+def _get_uploaded_file(
+    client: Client, key: tuple[str, str | None]
+) -> _UploadedFile | None:
+    with _uploaded_files_lock:
+        uploaded_files = _uploaded_files.get(client, {})
+        uploaded_file = uploaded_files.get(key)
+        if uploaded_file is None:
+            return None
+        if uploaded_file.expiration_time - _FILE_EXPIRATION_MARGIN <= datetime.now(
+            timezone.utc
+        ):
+            del uploaded_files[key]
+            return None
+        return uploaded_file
+
+
+def _register_uploaded_file(
+    client: Client, key: tuple[str, str | None], file: File
+) -> _UploadedFile:
+    expiration_time = file.expiration_time
+    if not isinstance(expiration_time, datetime):
+        expiration_time = datetime.now(timezone.utc) + _FILE_TTL
+    elif expiration_time.tzinfo is None:
+        expiration_time = expiration_time.replace(tzinfo=timezone.utc)
+    uploaded_file = _UploadedFile(
+        uri=str(file.uri), mime_type=file.mime_type, expiration_time=expiration_time
+    )
+    with _uploaded_files_lock:
+        _uploaded_files.setdefault(client, {})[key] = uploaded_file
+    return uploaded_file
+
+
+def _to_file_part(uploaded_file: _UploadedFile) -> PartDict:
+    return PartDict(
+        file_data=FileDataDict(
+            file_uri=uploaded_file.uri, mime_type=uploaded_file.mime_type
+        )
+    )
+
+
+async def _upload_files(pending_uploads: list[_PendingUpload], client: Client) -> None:
+    """Concurrently uploads each distinct pending file and swaps in its file part."""
+    uploads: dict[tuple[str, str | None], list[_PendingUpload]] = {}
+    for pending_upload in pending_uploads:
+        uploads.setdefault(pending_upload.key, []).append(pending_upload)
+    file_refs = await asyncio.gather(
+        *(
+            client.aio.files.upload(
+                file=io.BytesIO(pending[0].blob_dict["data"]),  # pyright: ignore [reportTypedDictNotRequiredAccess]
+                config={"mime_type": pending[0].blob_dict.get("mime_type", None)},
+            )
+            for pending in uploads.values()
+        )
+    )
+    for (key, pending), file_ref in zip(uploads.items(), file_refs, strict=True):
+        file_part = _to_file_part(_register_uploaded_file(client, key, file_ref))
+        for pending_upload in pending:
+            pending_upload.parts[pending_upload.index] = file_part
+
+
+def _convert_message_params(
     message_params: list[BaseMessageParam | ContentDict], client: Client
-) -> list[ContentDict]:
+) -> tuple[list[ContentDict], list[_PendingUpload]]:
+    """Returns the converted messages and the inline parts too large to send inline.
+
+    The pending uploads' parts are still inline data and must be replaced with file
+    parts (see `_upload_files`) before sending the messages.
+    """
     converted_message_params = []
+    pending_uploads: list[_PendingUpload] = []
     total_payload_size = 0
     for message_param in message_params:
         if not isinstance(message_param, BaseMessageParam):
@@ -85,7 +189,9 @@ async def _convert_message_params_async(
                     )
                 elif part.type == "image":
                     _check_image_media_type(part.media_type)
-                    blob_dict = BlobDict(data=part.image, mime_type=part.media_type)
+                    blob_dict = BlobDict(
+                        data=bytes(part.image), mime_type=part.media_type
+                    )
                     converted_content.append(PartDict(inline_data=blob_dict))
                     image_size = len(part.image)
                     total_payload_size += image_size
@@ -121,9 +227,9 @@ async def _convert_message_params_async(
                 elif part.type == "audio":
                     _check_audio_media_type(part.media_type)
                     audio_data = (
-                        part.audio
-                        if isinstance(part.audio, bytes)
-                        else base64.b64decode(part.audio)
+                        base64.b64decode(part.audio)
+                        if isinstance(part.audio, str)
+                        else bytes(part.audio)
                     )
                     blob_dict = BlobDict(data=audio_data, mime_type=part.media_type)
                     converted_content.append(PartDict(inline_data=blob_dict))
@@ -160,7 +266,9 @@ async def _convert_message_params_async(
                             total_payload_size -= audio_size
                 elif part.type == "document":
                     _check_document_media_type(part.media_type)
-                    blob_dict = BlobDict(data=part.document, mime_type=part.media_type)
+                    blob_dict = BlobDict(
+                        data=bytes(part.document), mime_type=part.media_type
+                    )
                     converted_content.append(PartDict(inline_data=blob_dict))
                     document_size = len(part.document)
                     total_payload_size += document_size
@@ -233,22 +341,12 @@ async def _convert_message_params_async(
                         f"Part provided: {part.type}"
                     )
 
-            if must_upload:
-                indices, blob_dicts = zip(*must_upload.items(), strict=True)
-                upload_tasks = [
-                    client.aio.files.upload(
-                        file=io.BytesIO(blob_dict["data"]),
-                        config={"mime_type": blob_dict.get("mime_type", None)},
-                    )
-                    for blob_dict in blob_dicts
-                ]
-                file_refs = await asyncio.gather(*upload_tasks)
-                for index, file_ref in zip(indices, file_refs, strict=True):
-                    converted_content[index] = PartDict(
-                        file_data=FileDataDict(
-                            file_uri=file_ref.uri, mime_type=file_ref.mime_type
-                        )
-                    )
+            pending_uploads += [
+                _PendingUpload(
+                    converted_content, index, blob_dict, _upload_key(blob_dict)
+                )
+                for index, blob_dict in must_upload.items()
+            ]
 
             converted_message_params.append(
                 {
@@ -256,7 +354,7 @@ async def _convert_message_params_async(
                     "parts": converted_content,
                 }
             )
-    return converted_message_params
+    return converted_message_params, pending_uploads
 
 
 def convert_message_params(
@@ -264,16 +362,28 @@ def convert_message_params(
 ) -> list[ContentDict]:
     """Convert message params to Google's ContentDict format.
 
-    If called from sync context, uses asyncio.run().
-    If called from async context, uses the current event loop.
+    Media too large to send inline is uploaded with the Files API, and the uploaded
+    files are reused for identical media until they expire. Only when something must be
+    uploaded are the uploads run concurrently with `asyncio.run()` (in a separate thread
+    if called from within a running event loop).
     """
+    converted_message_params, pending_uploads = _convert_message_params(
+        message_params, client
+    )
+    must_upload = []
+    for pending_upload in pending_uploads:
+        if uploaded_file := _get_uploaded_file(client, pending_upload.key):
+            pending_upload.parts[pending_upload.index] = _to_file_part(uploaded_file)
+        else:
+            must_upload.append(pending_upload)
+    if not must_upload:
+        return converted_message_params
+
     try:
         asyncio.get_running_loop()
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(
-                asyncio.run, _convert_message_params_async(message_params, client)
-            )
-            return future.result()
     except RuntimeError:
-        ...
-    return asyncio.run(_convert_message_params_async(message_params, client))
+        asyncio.run(_upload_files(must_upload, client))
+    else:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(asyncio.run, _upload_files(must_upload, client)).result()
+    return converted_message_params
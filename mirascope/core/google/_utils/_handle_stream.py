@@ -9,7 +9,7 @@ from ..tool import GoogleTool
 
 
 def _handle_chunk(
-    chunk: GenerateContentResponse, tool_types: list[type[GoogleTool]] | None = None
+    chunk: GenerateContentResponse, tool_types_by_name: dict[str, type[GoogleTool]]
 ) -> Generator[tuple[GoogleCallResponseChunk, GoogleTool | None], None, None]:
     """Handles a chunk of the stream and yields any tools that are found.
 
@@ -17,7 +17,7 @@ def _handle_chunk(
     """
     call_response_chunk = GoogleCallResponseChunk(chunk=chunk)
     has_tools = False
-    if tool_types and (
+    if tool_types_by_name and (
         (candidates := chunk.candidates)
         and (content := candidates[0].content)
         and (parts := content.parts)
@@ -25,10 +25,9 @@ def _handle_chunk(
         for part in parts:
             if function_call := part.function_call:
                 has_tools = True
-                for tool_type in tool_types:
-                    if tool_type._name() == function_call.name:
-                        tool = tool_type.from_tool_call(function_call)
-                        yield (call_response_chunk, tool)
+                if tool_type := tool_types_by_name.get(function_call.name or ""):
+                    tool = tool_type.from_tool_call(function_call)
+                    yield (call_response_chunk, tool)
     if not has_tools:
         yield call_response_chunk, None
 
@@ -39,8 +38,11 @@ def handle_stream(
     partial_tools: bool = False,
 ) -> Generator[tuple[GoogleCallResponseChunk, GoogleTool | None], None, None]:
     """Iterator over the stream and constructs tools as they are streamed."""
+    tool_types_by_name = {
+        tool_type._name(): tool_type for tool_type in tool_types or []
+    }
     for chunk in stream:
-        yield from _handle_chunk(chunk, tool_types)
+        yield from _handle_chunk(chunk, tool_types_by_name)
 
 
 async def handle_stream_async(
@@ -53,6 +55,9 @@ async def handle_stream_async(
 
     Note: google does not currently support streaming tools.
     """
+    tool_types_by_name = {
+        tool_type._name(): tool_type for tool_type in tool_types or []
+    }
     async for chunk in stream:
-        for call_response_chunk, tool in _handle_chunk(chunk, tool_types):
+        for call_response_chunk, tool in _handle_chunk(chunk, tool_types_by_name):
             yield call_response_chunk, tool
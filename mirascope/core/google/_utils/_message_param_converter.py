@@ -12,6 +12,9 @@ from mirascope.core.base import DocumentPart, DocumentURLPart, ImagePart, TextPa
 from mirascope.core.base._utils._base_message_param_converter import (
     BaseMessageParamConverter,
 )
+from mirascope.core.base._utils._cache_message_conversion import (
+    cache_message_conversion,
+)
 from mirascope.core.base.message_param import (
     AudioPart,
     AudioURLPart,
@@ -44,6 +47,7 @@ class GoogleMessageParamConverter(BaseMessageParamConverter):
         )
 
     @staticmethod
+    @cache_message_conversion
     def from_provider(message_params: list[ContentOrDict]) -> list[BaseMessageParam]:
         """
         Convert from Google's `ContentDict` to Mirascope `BaseMessageParam`.
@@ -1,6 +1,7 @@
 """This module contains the setup_call function, which is used to set up the"""
 
 import contextlib
+import os
 from collections.abc import Awaitable, Callable, Generator
 from typing import Any, cast, overload
 
@@ -28,6 +29,7 @@ from ...base._utils import (
     get_create_fn,
 )
 from ...base.call_params import CommonCallParams
+from ...base.client_pool import get_default_client
 from ...base.stream_config import StreamConfig
 from .._call_kwargs import GoogleCallKwargs
 from ..call_params import GoogleCallParams
@@ -132,7 +134,11 @@ def setup_call(
     messages = cast(list[BaseMessageParam | ContentDict], messages)
 
     if client is None:
-        client = Client()
+        # The `google-genai` client runs async requests in threads, so the same client
+        # is safe to share between sync and async calls.
+        client = get_default_client(
+            "google", False, Client, api_key=os.environ.get("GOOGLE_API_KEY")
+        )
 
     messages = convert_message_params(messages, client)
 
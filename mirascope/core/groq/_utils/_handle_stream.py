@@ -9,24 +9,48 @@ from ..call_response_chunk import GroqCallResponseChunk
 from ..tool import GroqTool
 
 
+def _construct_tool(
+    tool_type: type[GroqTool],
+    tool_call: ChatCompletionMessageToolCall,
+    arguments: list[str],
+) -> GroqTool:
+    """Constructs the tool from `tool_call` and the accumulated `arguments`."""
+    tool = tool_type.from_tool_call(
+        ChatCompletionMessageToolCall(
+            id=tool_call.id,
+            function=Function(
+                arguments="".join(arguments), name=tool_call.function.name
+            ),
+            type="function",
+        )
+    )
+    arguments.clear()
+    return tool
+
+
 def _handle_chunk(
     chunk: ChatCompletionChunk,
     current_tool_call: ChatCompletionMessageToolCall,
     current_tool_type: type[GroqTool] | None,
-    tool_types: list[type[GroqTool]] | None,
+    tool_types_by_name: dict[str, type[GroqTool]],
+    arguments: list[str],
 ) -> tuple[
     GroqTool | None,
     ChatCompletionMessageToolCall,
     type[GroqTool] | None,
 ]:
-    """Handles a chunk of the stream."""
-    if not tool_types or not (tool_calls := chunk.choices[0].delta.tool_calls):
+    """Handles a chunk of the stream.
+
+    The streamed arguments are accumulated in `arguments` and only joined once the
+    tool is constructed so that accumulating them stays linear.
+    """
+    if not tool_types_by_name or not (tool_calls := chunk.choices[0].delta.tool_calls):
         return None, current_tool_call, current_tool_type
 
     tool_call = tool_calls[0]
     # Reset on new tool
     if tool_call.id and tool_call.function is not None:
-        previous_tool_call = current_tool_call.model_copy()
+        previous_tool_call = current_tool_call
         previous_tool_type = current_tool_type
         current_tool_call = ChatCompletionMessageToolCall(
             id=tool_call.id,
@@ -36,29 +60,22 @@ def _handle_chunk(
             ),
             type="function",
         )
-        current_tool_type = None
-        for tool_type in tool_types:
-            if tool_type._name() == tool_call.function.name:
-                current_tool_type = tool_type
-                break
+        current_tool_type = tool_types_by_name.get(tool_call.function.name or "")
         if current_tool_type is None:
             raise RuntimeError(
                 f"Unknown tool type in stream: {tool_call.function.name}"
             )  # pragma: no cover
-        if (
-            previous_tool_call.id
-            and previous_tool_call.function.arguments
-            and previous_tool_type is not None
-        ):
+        if previous_tool_call.id and arguments and previous_tool_type is not None:
             return (
-                previous_tool_type.from_tool_call(previous_tool_call),
+                _construct_tool(previous_tool_type, previous_tool_call, arguments),
                 current_tool_call,
                 current_tool_type,
             )
+        arguments.clear()
 
     # Update arguments with each chunk
     if tool_call.function and tool_call.function.arguments:
-        current_tool_call.function.arguments += tool_call.function.arguments
+        arguments.append(tool_call.function.arguments)
 
     return None, current_tool_call, current_tool_type
 
@@ -69,16 +86,20 @@ def handle_stream(
     partial_tools: bool = False,
 ) -> Generator[tuple[GroqCallResponseChunk, GroqTool | None], None, None]:
     """Iterator over the stream and constructs tools as they are streamed."""
+    tool_types_by_name = {
+        tool_type._name(): tool_type for tool_type in tool_types or []
+    }
     current_tool_call = ChatCompletionMessageToolCall(
         id="", function=Function(arguments="", name=""), type="function"
     )
     current_tool_type = None
+    arguments: list[str] = []
     for chunk in stream:
         if not tool_types or not chunk.choices[0].delta.tool_calls:
             if current_tool_type:
                 yield (
                     GroqCallResponseChunk(chunk=chunk),
-                    current_tool_type.from_tool_call(current_tool_call),
+                    _construct_tool(current_tool_type, current_tool_call, arguments),
                 )
                 current_tool_type = None
             else:
@@ -87,7 +108,8 @@ def handle_stream(
             chunk,
             current_tool_call,
             current_tool_type,
-            tool_types,
+            tool_types_by_name,
+            arguments,
         )
         if tool is not None:
             yield GroqCallResponseChunk(chunk=chunk), tool
@@ -99,16 +121,20 @@ async def handle_stream_async(
     partial_tools: bool = False,
 ) -> AsyncGenerator[tuple[GroqCallResponseChunk, GroqTool | None], None]:
     """Async iterator over the stream and constructs tools as they are streamed."""
+    tool_types_by_name = {
+        tool_type._name(): tool_type for tool_type in tool_types or []
+    }
     current_tool_call = ChatCompletionMessageToolCall(
         id="", function=Function(arguments="", name=""), type="function"
     )
     current_tool_type = None
+    arguments: list[str] = []
     async for chunk in stream:
         if not tool_types or not chunk.choices[0].delta.tool_calls:
             if current_tool_type:
                 yield (
                     GroqCallResponseChunk(chunk=chunk),
-                    current_tool_type.from_tool_call(current_tool_call),
+                    _construct_tool(current_tool_type, current_tool_call, arguments),
                 )
                 current_tool_type = None
             else:
@@ -117,7 +143,8 @@ async def handle_stream_async(
             chunk,
             current_tool_call,
             current_tool_type,
-            tool_types,
+            tool_types_by_name,
+            arguments,
         )
         if tool is not None:
             yield GroqCallResponseChunk(chunk=chunk), tool
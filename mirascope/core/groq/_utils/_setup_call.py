@@ -1,6 +1,7 @@
 """This module contains the setup_call function for Groq tools."""
 
 import inspect
+import os
 from collections.abc import Awaitable, Callable
 from typing import Any, cast, overload
 
@@ -15,6 +16,11 @@ from pydantic import BaseModel
 from ...base import BaseMessageParam, BaseTool, _utils
 from ...base._utils import AsyncCreateFn, CreateFn, get_async_create_fn, get_create_fn
 from ...base.call_params import CommonCallParams
+from ...base.client_pool import (
+    create_async_http_client,
+    create_http_client,
+    get_default_client,
+)
 from ...base.stream_config import StreamConfig
 from .._call_kwargs import GroqCallKwargs
 from ..call_params import GroqCallParams
@@ -121,7 +127,20 @@ def setup_call(
         }
     call_kwargs |= {"model": model, "messages": messages}
     if client is None:
-        client = AsyncGroq() if inspect.iscoroutinefunction(fn) else Groq()
+        is_async = inspect.iscoroutinefunction(fn)
+
+        def create_client() -> Groq | AsyncGroq:
+            if is_async:
+                return AsyncGroq(http_client=create_async_http_client())
+            return Groq(http_client=create_http_client())
+
+        client = get_default_client(
+            "groq",
+            is_async,
+            create_client,
+            base_url=os.environ.get("GROQ_BASE_URL"),
+            api_key=os.environ.get("GROQ_API_KEY"),
+        )
 
     create = (
         get_async_create_fn(client.chat.completions.create)
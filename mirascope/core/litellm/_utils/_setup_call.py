@@ -11,6 +11,7 @@ from pydantic import BaseModel
 from ...base import BaseTool
 from ...base._utils import AsyncCreateFn, CreateFn, fn_is_async
 from ...base.call_params import CommonCallParams
+from ...base.client_pool import get_default_client
 from ...base.stream_config import StreamConfig
 from ...openai import (
     AsyncOpenAIDynamicConfig,
@@ -92,7 +93,9 @@ def setup_call(
 ]:
     _, prompt_template, messages, tool_types, call_kwargs = setup_call_openai(
         model=model,  # pyright: ignore [reportCallIssue]
-        client=OpenAI(api_key="NOT_USED"),
+        client=get_default_client(
+            "litellm", False, lambda: OpenAI(api_key="NOT_USED"), api_key="NOT_USED"
+        ),
         fn=fn,  # pyright: ignore [reportArgumentType]
         fn_args=fn_args,  # pyright: ignore [reportArgumentType]
         dynamic_config=dynamic_config,
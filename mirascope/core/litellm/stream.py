@@ -81,6 +81,7 @@ class LiteLLMStream(OpenAIStream):
             user_message_param=openai_call_response.user_message_param,
             start_time=openai_call_response.start_time,
             end_time=openai_call_response.end_time,
+            timings=openai_call_response.timings,
         )
         response._model = self.model
         return response
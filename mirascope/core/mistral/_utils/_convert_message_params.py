@@ -1,7 +1,5 @@
 """Utility for converting `BaseMessageParam` to `ChatMessage`."""
 
-import base64
-
 from mistralai.models import (
     AssistantMessage,
     FunctionCall,
@@ -15,6 +13,7 @@ from mistralai.models import (
 )
 
 from ...base import BaseMessageParam
+from ...base._utils import cache_message_conversion, encode_base64
 
 
 def _make_message(
@@ -32,6 +31,7 @@ def _make_message(
     raise ValueError(f"Invalid role: {role}")
 
 
+@cache_message_conversion
 def convert_message_params(
     message_params: list[
         BaseMessageParam | AssistantMessage | SystemMessage | ToolMessage | UserMessage
@@ -60,7 +60,7 @@ def convert_message_params(
                             f"Unsupported image media type: {part.media_type}. Mistral"
                             " currently only supports JPEG, PNG, GIF, and WebP images."
                         )
-                    data = base64.b64encode(part.image).decode("utf-8")
+                    data = encode_base64(part.image)
                     converted_content.append(
                         ImageURLChunk(
                             image_url=ImageURL(
@@ -13,24 +13,50 @@ from ..call_response_chunk import MistralCallResponseChunk
 from ..tool import MistralTool
 
 
+def _construct_tool(
+    tool_type: type[MistralTool],
+    tool_call: ToolCall,
+    arguments: list[str],
+) -> MistralTool:
+    """Constructs the tool from `tool_call` and the accumulated `arguments`."""
+    tool = tool_type.from_tool_call(
+        ToolCall(
+            id=tool_call.id,
+            function=FunctionCall(
+                arguments="".join(arguments), name=tool_call.function.name
+            ),
+            type="function",
+        )
+    )
+    arguments.clear()
+    return tool
+
+
 def _handle_chunk(
     chunk: CompletionEvent,
     current_tool_call: ToolCall,
     current_tool_type: type[MistralTool] | None,
-    tool_types: list[type[MistralTool]] | None,
+    tool_types_by_name: dict[str, type[MistralTool]],
+    arguments: list[str],
 ) -> tuple[
     MistralTool | None,
     ToolCall,
     type[MistralTool] | None,
 ]:
-    """Handles a chunk of the stream."""
-    if not tool_types or not (tool_calls := chunk.data.choices[0].delta.tool_calls):
+    """Handles a chunk of the stream.
+
+    The streamed arguments are accumulated in `arguments` and only joined once the
+    tool is constructed so that accumulating them stays linear.
+    """
+    if not tool_types_by_name or not (
+        tool_calls := chunk.data.choices[0].delta.tool_calls
+    ):
         return None, current_tool_call, current_tool_type
 
     tool_call = tool_calls[0]
     # Reset on new tool
     if tool_call.id != "null" and tool_call.function is not None:
-        previous_tool_call = current_tool_call.model_copy()
+        previous_tool_call = current_tool_call
         previous_tool_type = current_tool_type
         current_tool_call = ToolCall(
             id=tool_call.id,
@@ -40,25 +66,22 @@ def _handle_chunk(
             ),
             type="function",
         )
-        current_tool_type = None
-        for tool_type in tool_types:
-            if tool_type._name() == tool_call.function.name:
-                current_tool_type = tool_type
-                break
+        current_tool_type = tool_types_by_name.get(tool_call.function.name or "")
         if current_tool_type is None:
             raise RuntimeError(
                 f"Unknown tool type in stream: {tool_call.function.name}"
             )  # pragma: no cover
         if previous_tool_call.id and previous_tool_type is not None:
             return (
-                previous_tool_type.from_tool_call(previous_tool_call),
+                _construct_tool(previous_tool_type, previous_tool_call, arguments),
                 current_tool_call,
                 current_tool_type,
             )
+        arguments.clear()
 
     # Update arguments with each chunk
     if tool_call.function and tool_call.function.arguments:
-        current_tool_call.function.arguments += cast(str, tool_call.function.arguments)  # pyright: ignore [reportOperatorIssue]
+        arguments.append(cast(str, tool_call.function.arguments))
 
     return None, current_tool_call, current_tool_type
 
@@ -69,17 +92,21 @@ def handle_stream(
     partial_tools: bool = False,
 ) -> Generator[tuple[MistralCallResponseChunk, MistralTool | None], None, None]:
     """Iterator over the stream and constructs tools as they are streamed."""
+    tool_types_by_name = {
+        tool_type._name(): tool_type for tool_type in tool_types or []
+    }
     current_tool_call = ToolCall(
         id="", function=FunctionCall(arguments="", name=""), type="function"
     )
     current_tool_type = None
     last_chuk_data = None
+    arguments: list[str] = []
     for chunk in stream:
         if not tool_types or not chunk.data.choices[0].delta.tool_calls:
             if current_tool_type:
                 yield (
                     MistralCallResponseChunk(chunk=chunk.data),
-                    current_tool_type.from_tool_call(current_tool_call),
+                    _construct_tool(current_tool_type, current_tool_call, arguments),
                 )
                 current_tool_type = None
             else:
@@ -88,7 +115,8 @@ def handle_stream(
             chunk,
             current_tool_call,
             current_tool_type,
-            tool_types,
+            tool_types_by_name,
+            arguments,
         )
         if tool is not None:
             yield MistralCallResponseChunk(chunk=chunk.data), tool
@@ -97,7 +125,7 @@ def handle_stream(
     if current_tool_type and last_chuk_data:
         yield (
             MistralCallResponseChunk(chunk=last_chuk_data),
-            current_tool_type.from_tool_call(current_tool_call),
+            _construct_tool(current_tool_type, current_tool_call, arguments),
         )
 
 
@@ -107,17 +135,21 @@ async def handle_stream_async(
     partial_tools: bool = False,
 ) -> AsyncGenerator[tuple[MistralCallResponseChunk, MistralTool | None], None]:
     """Async iterator over the stream and constructs tools as they are streamed."""
+    tool_types_by_name = {
+        tool_type._name(): tool_type for tool_type in tool_types or []
+    }
     current_tool_call = ToolCall(
         id="", function=FunctionCall(arguments="", name=""), type="function"
     )
     current_tool_type = None
     last_chuk_data = None
+    arguments: list[str] = []
     async for chunk in stream:
         if not tool_types or not chunk.data.choices[0].delta.tool_calls:
             if current_tool_type:
                 yield (
                     MistralCallResponseChunk(chunk=chunk.data),
-                    current_tool_type.from_tool_call(current_tool_call),
+                    _construct_tool(current_tool_type, current_tool_call, arguments),
                 )
                 current_tool_type = None
             else:
@@ -126,7 +158,8 @@ async def handle_stream_async(
             chunk,
             current_tool_call,
             current_tool_type,
-            tool_types,
+            tool_types_by_name,
+            arguments,
         )
         if tool is not None:
             yield MistralCallResponseChunk(chunk=chunk.data), tool
@@ -135,5 +168,5 @@ async def handle_stream_async(
     if current_tool_type and last_chuk_data:
         yield (
             MistralCallResponseChunk(chunk=last_chuk_data),
-            current_tool_type.from_tool_call(current_tool_call),
+            _construct_tool(current_tool_type, current_tool_call, arguments),
         )
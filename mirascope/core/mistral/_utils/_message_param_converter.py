@@ -16,6 +16,9 @@ from mistralai.models import (
 from mirascope.core.base._utils._base_message_param_converter import (
     BaseMessageParamConverter,
 )
+from mirascope.core.base._utils._cache_message_conversion import (
+    cache_message_conversion,
+)
 from mirascope.core.mistral._utils import convert_message_params
 
 from ...base import BaseMessageParam, ImagePart, TextPart, ToolResultPart
@@ -61,6 +64,7 @@ class MistralMessageParamConverter(BaseMessageParamConverter):
         )
 
     @staticmethod
+    @cache_message_conversion
     def from_provider(
         message_params: list[
             AssistantMessage | ToolMessage | SystemMessage | UserMessage
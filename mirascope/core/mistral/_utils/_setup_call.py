@@ -31,6 +31,11 @@ from ...base._utils import (
     get_create_fn,
 )
 from ...base.call_params import CommonCallParams
+from ...base.client_pool import (
+    create_async_http_client,
+    create_http_client,
+    get_default_client,
+)
 from ...base.stream_config import StreamConfig
 from .._call_kwargs import MistralCallKwargs
 from ..call_params import MistralCallParams
@@ -143,9 +148,17 @@ def setup_call(
         call_kwargs["tool_choice"] = cast(ToolChoiceEnum, "any")
     call_kwargs |= {"model": model, "messages": messages}
 
+    is_async = fn_is_async(fn)
     if client is None:
-        client = Mistral(api_key=os.environ["MISTRAL_API_KEY"])
-    if fn_is_async(fn):
+        api_key = os.environ["MISTRAL_API_KEY"]
+
+        def create_client() -> Mistral:
+            if is_async:
+                return Mistral(api_key=api_key, async_client=create_async_http_client())
+            return Mistral(api_key=api_key, client=create_http_client())
+
+        client = get_default_client("mistral", is_async, create_client, api_key=api_key)
+    if is_async:
         create_or_stream = get_async_create_fn(
             client.chat.complete_async, client.chat.stream_async
         )
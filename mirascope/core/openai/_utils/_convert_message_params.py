@@ -1,15 +1,21 @@
 """Utility for converting `BaseMessageParam` to `ChatCompletionMessageParam`."""
 
-import base64
 import json
 
 from openai.types.chat import ChatCompletionMessageParam
 
 from ...base import BaseMessageParam
-from ...base._utils import get_audio_type
+from ...base._utils import (
+    cache_image_dimensions,
+    cache_message_conversion,
+    encode_base64,
+    get_audio_type,
+    sniff_image_dimensions,
+)
 from ...base._utils._parse_content_template import _load_media
 
 
+@cache_message_conversion
 def convert_message_params(
     message_params: list[BaseMessageParam | ChatCompletionMessageParam],
 ) -> list[ChatCompletionMessageParam]:
@@ -37,12 +43,16 @@ def convert_message_params(
                             f"Unsupported image media type: {part.media_type}. OpenAI"
                             " currently only supports JPEG, PNG, GIF, and WebP images."
                         )
-                    data = base64.b64encode(part.image).decode("utf-8")
+                    url = f"data:{part.media_type};base64,{encode_base64(part.image)}"
+                    # Record the dimensions from the header of the raw bytes so that
+                    # `cost_metadata` doesn't decode the data URL again
+                    if dimensions := sniff_image_dimensions(part.image):
+                        cache_image_dimensions(url, dimensions)
                     converted_content.append(
                         {
                             "type": "image_url",
                             "image_url": {
-                                "url": f"data:{part.media_type};base64,{data}",
+                                "url": url,
                                 "detail": part.detail if part.detail else "auto",
                             },
                         }
@@ -69,7 +79,7 @@ def convert_message_params(
                     data = (
                         part.audio
                         if isinstance(part.audio, str)
-                        else base64.b64encode(part.audio).decode("utf-8")
+                        else encode_base64(part.audio)
                     )
                     converted_content.append(
                         {
@@ -95,7 +105,7 @@ def convert_message_params(
                         {
                             "input_audio": {
                                 "format": audio_type,
-                                "data": base64.b64encode(audio).decode("utf-8"),
+                                "data": encode_base64(audio),
                             },
                             "type": "input_audio",
                         }
@@ -1,79 +1,172 @@
 """Handles the stream of completion chunks."""
 
 from collections.abc import AsyncGenerator, Generator
-from typing import cast
 
 from openai.types.chat import ChatCompletionChunk, ChatCompletionMessageToolCall
 from openai.types.chat.chat_completion_message_tool_call import Function
 
+from ...base._utils._lazy_partial_tool import (
+    defer_tool_call,
+    lazy_partial_tool_type,
+)
+from ...base._utils._partial_json_parser import PartialJsonParser
 from ..call_response_chunk import OpenAICallResponseChunk
 from ..tool import OpenAITool
 
 
+class _ToolCallState:
+    """The accumulated state of a single streamed tool call."""
+
+    def __init__(self, id: str, name: str, tool_type: type[OpenAITool]) -> None:
+        self.id = id
+        self.name = name
+        self.tool_type = tool_type
+        self.arguments: list[str] = []
+        self.length = 0
+        # Parses the arguments incrementally so partial tools don't re-parse them
+        self.parser: PartialJsonParser | None = PartialJsonParser()
+        self.partial_tool: OpenAITool | None = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the arguments are a complete JSON object."""
+        return self.parser is not None and self.parser.done
+
+    def feed(self, arguments: str) -> bool:
+        """Adds the streamed `arguments`, returning whether the parsed arguments changed."""
+        self.arguments.append(arguments)
+        self.length += len(arguments)
+        if self.parser is None:
+            return True
+        try:
+            return self.parser.feed(arguments)
+        except ValueError:
+            # Fall back to `from_tool_call` so that errors surface as before
+            self.parser = None
+            return True
+
+    def tool(self) -> OpenAITool:
+        return self.tool_type.from_tool_call(
+            ChatCompletionMessageToolCall(
+                id=self.id,
+                function=Function(arguments=self._arguments(), name=self.name),
+                type="function",
+            )
+        )
+
+    def partial_tool_for(self, delta: str, changed: bool) -> OpenAITool:
+        """Returns the partial tool after `delta`.
+
+        The `tool_call` of partial tools carries the arguments accumulated so far. It
+        is only constructed once it's read so that streaming doesn't join the arguments
+        for every delta, and only the fields that changed are validated again.
+        """
+        if self.parser is None:
+            partial_tool = self.tool_type.from_tool_call(self._tool_call(), True)
+        elif self.partial_tool is None:
+            partial_tool = lazy_partial_tool_type(self.tool_type).model_validate(
+                {"tool_call": self._tool_call()} | (self.parser.snapshot() or {})
+            )
+        else:
+            partial_tool = self.partial_tool.model_copy()
+            if changed and (snapshot := self.parser.snapshot()) is not None:
+                validator = partial_tool.__pydantic_validator__
+                for key in (
+                    self.parser.changed_keys & self.tool_type.model_fields.keys()
+                ):
+                    validator.validate_assignment(partial_tool, key, snapshot[key])
+            length = self.length
+            defer_tool_call(partial_tool, lambda: self._tool_call(length))
+        partial_tool.delta = delta
+        self.partial_tool = partial_tool
+        return partial_tool
+
+    def _tool_call(self, length: int | None = None) -> ChatCompletionMessageToolCall:
+        """Returns the tool call with the first `length` characters of the arguments."""
+        return ChatCompletionMessageToolCall.model_construct(
+            id=self.id,
+            function=Function.model_construct(
+                arguments=self._arguments()[:length], name=self.name
+            ),
+            type="function",
+        )
+
+    def _arguments(self) -> str:
+        # Collapse the buffer so that joining again only joins the new arguments
+        self.arguments[:] = ["".join(self.arguments)]
+        return self.arguments[0]
+
+
 def _handle_chunk(
     chunk: ChatCompletionChunk,
-    current_tool_call: ChatCompletionMessageToolCall,
-    current_tool_type: type[OpenAITool] | None,
-    tool_types: list[type[OpenAITool]] | None,
+    tool_calls: dict[int, _ToolCallState],
+    tool_types_by_name: dict[str, type[OpenAITool]],
     partial_tools: bool = False,
-) -> tuple[
-    OpenAITool | None,
-    ChatCompletionMessageToolCall,
-    type[OpenAITool] | None,
-]:
-    """Handles a chunk of the stream."""
+) -> list[OpenAITool]:
+    """Handles a chunk of the stream, returning any tools it constructed.
+
+    Tool calls are tracked by their index so that parallel tool calls are constructed
+    correctly even when their deltas are interleaved. A tool call is constructed once
+    the stream moves past tool calls or, if its arguments are complete, once another
+    tool call starts.
+    """
     if (
-        not tool_types
+        not tool_types_by_name
         or not chunk.choices
-        or not (tool_calls := chunk.choices[0].delta.tool_calls)
+        or not (tool_call_deltas := chunk.choices[0].delta.tool_calls)
     ):
-        return None, current_tool_call, current_tool_type
-
-    tool_call = tool_calls[0]
-    # Reset on new tool
-    if tool_call.id and tool_call.function is not None:
-        previous_tool_call = current_tool_call.model_copy()
-        previous_tool_type = current_tool_type
-        current_tool_call = ChatCompletionMessageToolCall(
-            id=tool_call.id,
-            function=Function(
-                arguments="",
-                name=tool_call.function.name if tool_call.function.name else "",
-            ),
-            type="function",
-        )
-        current_tool_type = None
-        for tool_type in tool_types:
-            if tool_type._name() == tool_call.function.name:
-                current_tool_type = tool_type
-                break
-        if current_tool_type is None:
-            raise RuntimeError(
-                f"Unknown tool type in stream: {tool_call.function.name}"
-            )  # pragma: no cover
-        if (
-            previous_tool_call.id
-            and previous_tool_call.function.arguments
-            and previous_tool_type is not None
-        ):
-            return (
-                previous_tool_type.from_tool_call(previous_tool_call),
-                current_tool_call,
-                current_tool_type,
-            )
+        tools = [state.tool() for state in tool_calls.values()]
+        tool_calls.clear()
+        return tools
 
-    # Update arguments with each chunk
-    if tool_call.function and tool_call.function.arguments:
-        current_tool_call.function.arguments += tool_call.function.arguments
+    tools = []
+    for tool_call in tool_call_deltas:
+        state = tool_calls.get(tool_call.index)
+        # Reset on new tool
+        if tool_call.id and tool_call.function is not None:
+            if state is not None:
+                tools.append(state.tool())
+            for index, other_state in list(tool_calls.items()):
+                if index != tool_call.index and other_state.done:
+                    tools.append(other_state.tool())
+                    del tool_calls[index]
+            name = tool_call.function.name or ""
+            if (tool_type := tool_types_by_name.get(name)) is None:
+                raise RuntimeError(
+                    f"Unknown tool type in stream: {tool_call.function.name}"
+                )  # pragma: no cover
+            state = tool_calls[tool_call.index] = _ToolCallState(
+                tool_call.id, name, tool_type
+            )
+        if state is None or not tool_call.function or not tool_call.function.arguments:
+            continue
 
+        # Update arguments with each chunk
+        changed = state.feed(tool_call.function.arguments)
         # Return partial tool state if enabled
-        if partial_tools and current_tool_type:
-            partial_tool = current_tool_type.from_tool_call(current_tool_call, True)
-            # Set delta to current chunk arguments
-            partial_tool.delta = cast(str, tool_call.function.arguments)
-            return partial_tool, current_tool_call, current_tool_type
+        if partial_tools:
+            tools.append(state.partial_tool_for(tool_call.function.arguments, changed))
+    return tools
 
-    return None, current_tool_call, current_tool_type
+
+def _with_chunks(
+    chunk: ChatCompletionChunk, tools: list[OpenAITool]
+) -> list[tuple[OpenAICallResponseChunk, OpenAITool]]:
+    """Pairs each tool with a chunk, yielding the chunk itself only once.
+
+    Additional tools constructed from the same chunk are paired with a copy of the
+    chunk without choices or usage so that the stream doesn't count them twice.
+    """
+    empty_chunk = chunk.model_copy(update={"choices": [], "usage": None})
+    return [
+        (
+            OpenAICallResponseChunk(
+                chunk=chunk if i == len(tools) - 1 else empty_chunk
+            ),
+            tool,
+        )
+        for i, tool in enumerate(tools)
+    ]
 
 
 def handle_stream(
@@ -82,29 +175,17 @@ def handle_stream(
     partial_tools: bool = False,
 ) -> Generator[tuple[OpenAICallResponseChunk, OpenAITool | None], None, None]:
     """Iterator over the stream and constructs tools as they are streamed."""
-    current_tool_call = ChatCompletionMessageToolCall(
-        id="", function=Function(arguments="", name=""), type="function"
-    )
-    current_tool_type = None
+    tool_types_by_name = {
+        tool_type._name(): tool_type for tool_type in tool_types or []
+    }
+    tool_calls: dict[int, _ToolCallState] = {}
     for chunk in stream:
-        if not tool_types or not chunk.choices or not chunk.choices[0].delta.tool_calls:
-            if current_tool_type:
-                yield (
-                    OpenAICallResponseChunk(chunk=chunk),
-                    current_tool_type.from_tool_call(current_tool_call),
-                )
-                current_tool_type = None
-            else:
-                yield OpenAICallResponseChunk(chunk=chunk), None
-        tool, current_tool_call, current_tool_type = _handle_chunk(
-            chunk,
-            current_tool_call,
-            current_tool_type,
-            tool_types,
-            partial_tools,
-        )
-        if tool is not None:
-            yield OpenAICallResponseChunk(chunk=chunk), tool
+        if tools := _handle_chunk(chunk, tool_calls, tool_types_by_name, partial_tools):
+            yield from _with_chunks(chunk, tools)
+        elif (
+            not tool_types or not chunk.choices or not chunk.choices[0].delta.tool_calls
+        ):
+            yield OpenAICallResponseChunk(chunk=chunk), None
 
 
 async def handle_stream_async(
@@ -113,26 +194,15 @@ async def handle_stream_async(
     partial_tools: bool = False,
 ) -> AsyncGenerator[tuple[OpenAICallResponseChunk, OpenAITool | None], None]:
     """Async iterator over the stream and constructs tools as they are streamed."""
-    current_tool_call = ChatCompletionMessageToolCall(
-        id="", function=Function(arguments="", name=""), type="function"
-    )
-    current_tool_type = None
+    tool_types_by_name = {
+        tool_type._name(): tool_type for tool_type in tool_types or []
+    }
+    tool_calls: dict[int, _ToolCallState] = {}
     async for chunk in stream:
-        if not tool_types or not chunk.choices or not chunk.choices[0].delta.tool_calls:
-            if current_tool_type:
-                yield (
-                    OpenAICallResponseChunk(chunk=chunk),
-                    current_tool_type.from_tool_call(current_tool_call),
-                )
-                current_tool_type = None
-            else:
-                yield OpenAICallResponseChunk(chunk=chunk), None
-        tool, current_tool_call, current_tool_type = _handle_chunk(
-            chunk,
-            current_tool_call,
-            current_tool_type,
-            tool_types,
-            partial_tools,
-        )
-        if tool is not None:
-            yield OpenAICallResponseChunk(chunk=chunk), tool
+        if tools := _handle_chunk(chunk, tool_calls, tool_types_by_name, partial_tools):
+            for chunk_and_tool in _with_chunks(chunk, tools):
+                yield chunk_and_tool
+        elif (
+            not tool_types or not chunk.choices or not chunk.choices[0].delta.tool_calls
+        ):
+            yield OpenAICallResponseChunk(chunk=chunk), None
@@ -17,6 +17,9 @@ from mirascope.core.base import (
 from mirascope.core.base._utils._base_message_param_converter import (
     BaseMessageParamConverter,
 )
+from mirascope.core.base._utils._cache_message_conversion import (
+    cache_message_conversion,
+)
 from mirascope.core.openai._utils import convert_message_params
 
 
@@ -31,6 +34,7 @@ class OpenAIMessageParamConverter(BaseMessageParamConverter):
         )
 
     @staticmethod
+    @cache_message_conversion
     def from_provider(
         message_params: list[ChatCompletionMessageParam],
     ) -> list[BaseMessageParam]:
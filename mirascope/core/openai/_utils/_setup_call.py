@@ -1,6 +1,7 @@
 """This module contains the setup_call function for OpenAI tools."""
 
 import inspect
+import os
 import warnings
 from collections.abc import Awaitable, Callable
 from typing import Any, cast, overload
@@ -23,6 +24,11 @@ from ...base._utils import (
     get_create_fn,
 )
 from ...base.call_params import CommonCallParams
+from ...base.client_pool import (
+    create_async_http_client,
+    create_http_client,
+    get_default_client,
+)
 from ...base.stream_config import StreamConfig
 from .._call_kwargs import OpenAICallKwargs
 from ..call_params import OpenAICallParams
@@ -146,7 +152,20 @@ def setup_call(
     call_kwargs |= {"model": model, "messages": messages}
 
     if client is None:
-        client = AsyncOpenAI() if inspect.iscoroutinefunction(fn) else OpenAI()
+        is_async = inspect.iscoroutinefunction(fn)
+
+        def create_client() -> OpenAI | AsyncOpenAI:
+            if is_async:
+                return AsyncOpenAI(http_client=create_async_http_client())
+            return OpenAI(http_client=create_http_client())
+
+        client = get_default_client(
+            "openai",
+            is_async,
+            create_client,
+            base_url=os.environ.get("OPENAI_BASE_URL"),
+            api_key=os.environ.get("OPENAI_API_KEY"),
+        )
     create = (
         get_async_create_fn(client.chat.completions.create)
         if isinstance(client, AsyncOpenAI)
@@ -9,10 +9,11 @@ from google.cloud.aiplatform_v1beta1.types import tool as gapic_tool_types
 from vertexai.generative_models import Content, Image, Part
 
 from ...base import BaseMessageParam
-from ...base._utils import get_audio_type
+from ...base._utils import cache_message_conversion, get_audio_type
 from ...base._utils._parse_content_template import _load_media
 
 
+@cache_message_conversion
 def convert_message_params(
     message_params: list[BaseMessageParam | Content],
 ) -> list[Content]:
@@ -56,7 +57,7 @@ def convert_message_params(
                             "Vertex currently only supports JPEG, PNG, WebP, HEIC, "
                             "and HEIF images."
                         )
-                    image = Image.from_bytes(part.image)
+                    image = Image.from_bytes(bytes(part.image))
                     converted_content.append(Part.from_image(image))
                 elif part.type == "image_url":
                     # Should download the image to determine the media type
@@ -98,9 +99,9 @@ def convert_message_params(
                     converted_content.append(
                         Part.from_data(
                             mime_type=part.media_type,
-                            data=part.audio
-                            if isinstance(part.audio, bytes)
-                            else base64.b64decode(part.audio),
+                            data=base64.b64decode(part.audio)
+                            if isinstance(part.audio, str)
+                            else bytes(part.audio),
                         )
                     )
                 elif part.type == "audio_url":
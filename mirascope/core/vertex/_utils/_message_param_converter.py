@@ -7,6 +7,9 @@ from mirascope.core.base import DocumentPart, ImagePart, TextPart
 from mirascope.core.base._utils._base_message_param_converter import (
     BaseMessageParamConverter,
 )
+from mirascope.core.base._utils._cache_message_conversion import (
+    cache_message_conversion,
+)
 from mirascope.core.base.message_param import ImageURLPart, ToolCallPart, ToolResultPart
 from mirascope.core.vertex._utils import convert_message_params
 
@@ -46,6 +49,7 @@ class VertexMessageParamConverter(BaseMessageParamConverter):
         )
 
     @staticmethod
+    @cache_message_conversion
     def from_provider(message_params: list[Content]) -> list[BaseMessageParam]:
         """
         Convert from Vertex's `Content` to Mirascope `BaseMessageParam`.
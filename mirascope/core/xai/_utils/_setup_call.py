@@ -15,6 +15,11 @@ from pydantic import BaseModel
 from ...base import BaseTool
 from ...base._utils import AsyncCreateFn, CreateFn, fn_is_async
 from ...base.call_params import CommonCallParams
+from ...base.client_pool import (
+    create_async_http_client,
+    create_http_client,
+    get_default_client,
+)
 from ...base.stream_config import StreamConfig
 from ...openai import (
     AsyncOpenAIDynamicConfig,
@@ -93,10 +98,22 @@ def setup_call(
 ]:
     if not client:
         api_key = os.environ.get("XAI_API_KEY")
-        client = (
-            AsyncOpenAI(api_key=api_key, base_url="https://api.x.ai/v1")
-            if fn_is_async(fn)
-            else OpenAI(api_key=api_key, base_url="https://api.x.ai/v1")
+        base_url = "https://api.x.ai/v1"
+        is_async = fn_is_async(fn)
+
+        def create_client() -> OpenAI | AsyncOpenAI:
+            if is_async:
+                return AsyncOpenAI(
+                    api_key=api_key,
+                    base_url=base_url,
+                    http_client=create_async_http_client(),
+                )
+            return OpenAI(
+                api_key=api_key, base_url=base_url, http_client=create_http_client()
+            )
+
+        client = get_default_client(
+            "xai", is_async, create_client, base_url=base_url, api_key=api_key
         )
     create, prompt_template, messages, tool_types, call_kwargs = setup_call_openai(
         model=model,  # pyright: ignore [reportCallIssue]
@@ -39,6 +39,10 @@ def _get_call_response_span_data(result: BaseCallResponse) -> dict[str, Any]:
         output["output_tokens"] = output_tokens
     if content := result.content:
         output["content"] = content
+    if (timings := result.timings) is not None:
+        output["timings"] = timings.metrics
+        if (tokens_per_second := result.output_tokens_per_second) is not None:
+            output["timings"]["output_tokens_per_second"] = tokens_per_second
     return {
         "async": False,
         "call_params": result.call_params,
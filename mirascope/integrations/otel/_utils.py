@@ -82,9 +82,22 @@ def _get_call_response_attributes(
         "gen_ai.usage.prompt_tokens": result.input_tokens
         if result.input_tokens
         else "",
+        **_get_timing_attributes(result),
     }
 
 
+def _get_timing_attributes(result: BaseCallResponse) -> dict[str, AttributeValue]:
+    if result.timings is None:
+        return {}
+    attributes: dict[str, AttributeValue] = {
+        f"gen_ai.timings.{name}": value
+        for name, value in result.timings.metrics.items()
+    }
+    if (tokens_per_second := result.output_tokens_per_second) is not None:
+        attributes["gen_ai.timings.output_tokens_per_second"] = tokens_per_second
+    return attributes
+
+
 def _set_call_response_event_attributes(result: BaseCallResponse, span: Span) -> None:
     prompt_attributes = {
         "gen_ai.prompt": json.dumps(result.user_message_param),
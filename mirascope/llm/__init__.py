@@ -1,12 +1,27 @@
+from typing import TYPE_CHECKING
+
 from ..core import CostMetadata, LocalProvider, Provider, calculate_cost
 from ._call import call
 from ._context import context
-from ._override import override
 from .call_response import CallResponse
 from .call_response_chunk import CallResponseChunk
 from .stream import Stream
 from .tool import Tool
 
+if TYPE_CHECKING:
+    from ._override import override
+
+
+def __getattr__(name: str) -> object:
+    # `_override` is a large module of typed overloads, so load it on first use
+    if name == "override":
+        from ._override import override
+
+        globals()["override"] = override
+        return override
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "CallResponse",
     "CallResponseChunk",
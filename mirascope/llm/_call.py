@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import AsyncIterable, Awaitable, Callable, Iterable
+import threading
+from collections import OrderedDict
+from collections.abc import AsyncIterable, Awaitable, Callable, Hashable, Iterable
 from enum import Enum
-from functools import wraps
+from functools import partial, wraps
 from typing import Any, ParamSpec, TypeVar, cast, get_args
 
 from pydantic import BaseModel
@@ -18,6 +20,7 @@ from ..core.base import (
     CommonCallParams,
 )
 from ..core.base._utils import fn_is_async
+from ..core.base.client_pool import get_default_client
 from ..core.base.stream_config import StreamConfig
 from ..core.base.types import LocalProvider, Provider
 from ._context import (
@@ -50,6 +53,26 @@ _BaseCallResponseChunkT = TypeVar(
 _BaseStreamT = TypeVar("_BaseStreamT", covariant=True)
 _ResultT = TypeVar("_ResultT")
 
+_DECORATED_CACHE_SIZE = 128
+_decorated_cache_lock = threading.Lock()
+
+
+def _get_local_provider_client(
+    provider: LocalProvider, base_url: str, is_async: bool
+) -> Any:  # noqa: ANN401
+    """Returns the pooled OpenAI-compatible client for the local provider."""
+    if is_async:
+        from openai import AsyncOpenAI
+
+        create_client = partial(AsyncOpenAI, api_key="ollama", base_url=base_url)
+    else:
+        from openai import OpenAI
+
+        create_client = partial(OpenAI, api_key="ollama", base_url=base_url)
+    return get_default_client(
+        provider, is_async, create_client, base_url=base_url, api_key="ollama"
+    )
+
 
 def _get_local_provider_call(
     provider: LocalProvider,
@@ -61,14 +84,9 @@ def _get_local_provider_call(
 
         if client:
             return openai_call, client
-        if is_async:
-            from openai import AsyncOpenAI
-
-            client = AsyncOpenAI(api_key="ollama", base_url="http://localhost:11434/v1")
-        else:
-            from openai import OpenAI
-
-            client = OpenAI(api_key="ollama", base_url="http://localhost:11434/v1")
+        client = _get_local_provider_client(
+            provider, "http://localhost:11434/v1", is_async
+        )
         return openai_call, client
     else:  # provider == "vllm"
         from ..core.openai import openai_call
@@ -76,14 +94,9 @@ def _get_local_provider_call(
         if client:
             return openai_call, client
 
-        if is_async:
-            from openai import AsyncOpenAI
-
-            client = AsyncOpenAI(api_key="ollama", base_url="http://localhost:8000/v1")
-        else:
-            from openai import OpenAI
-
-            client = OpenAI(api_key="ollama", base_url="http://localhost:8000/v1")
+        client = _get_local_provider_client(
+            provider, "http://localhost:8000/v1", is_async
+        )
         return openai_call, client
 
 
@@ -140,6 +153,75 @@ def _get_provider_call(provider: Provider) -> Callable:
     raise ValueError(f"Unsupported provider: {provider}")
 
 
+def _freeze(value: Any) -> Hashable:  # noqa: ANN401
+    """Returns a hashable fingerprint of `value` for use as a cache key.
+
+    Containers are frozen recursively while any other unhashable value is keyed by
+    identity, which is safe since the cached decorated function keeps it alive. Values
+    are keyed with their type so that equal values of different types (e.g. `1` and
+    `True`, or a list and a tuple) don't share a decorated function.
+    """
+    if isinstance(value, dict):
+        return (
+            type(value),
+            frozenset((_freeze(key), _freeze(item)) for key, item in value.items()),
+        )
+    elif isinstance(value, list | tuple):
+        return (type(value), tuple(_freeze(item) for item in value))
+    try:
+        hash(value)
+    except TypeError:
+        return ("__id__", id(value))
+    return (type(value), value)
+
+
+def _get_decorated_fn(
+    fn: Callable,
+    call_args: CallArgs,
+    is_async: bool,
+    cache: OrderedDict[Hashable, Callable],
+) -> Callable:
+    """Returns `fn` decorated with the provider call for the effective `call_args`.
+
+    Building the provider-specific decorated function is pure per-call overhead, so we
+    cache it per fingerprint of the effective call args (including context overrides)
+    in an LRU cache that is shared across threads.
+    """
+    effective_call_args = CallArgs(call_args)
+    effective_provider = effective_call_args["provider"]
+    if effective_provider in get_args(LocalProvider):
+        provider_call, effective_client = _get_local_provider_call(
+            cast(LocalProvider, effective_provider),
+            effective_call_args["client"],
+            is_async,
+        )
+        effective_call_args["client"] = effective_client
+    else:
+        provider_call = None
+
+    key = _freeze(effective_call_args)
+    with _decorated_cache_lock:
+        if (decorated := cache.get(key)) is not None:
+            cache.move_to_end(key)
+            return decorated
+
+    if provider_call is None:
+        provider_call = _get_provider_call(cast(Provider, effective_provider))
+
+    # Use the provider-specific call function with overridden args
+    call_kwargs = dict(effective_call_args)
+    del call_kwargs["provider"]  # Not a parameter to provider_call
+    decorated = provider_call(**call_kwargs)(fn)
+
+    with _decorated_cache_lock:
+        # Another thread may have built the same decorated function in the meantime
+        decorated = cache.setdefault(key, decorated)
+        cache.move_to_end(key)
+        if len(cache) > _DECORATED_CACHE_SIZE:
+            cache.popitem(last=False)
+    return decorated
+
+
 def _wrap_result(
     result: BaseCallResponse | BaseStream | _ResultT,
 ) -> CallResponse | Stream | _ResultT:
@@ -239,6 +321,7 @@ def _call(
         | Awaitable[(_ResponseModelT | CallResponse)],
     ]:
         fn.__mirascope_call__ = True  # pyright: ignore [reportFunctionMemberAccess]
+        decorated_cache: OrderedDict[Hashable, Callable] = OrderedDict()
         if fn_is_async(fn):
             # Create a wrapper function that captures the current context when called
             @wraps(fn)
@@ -267,28 +350,10 @@ def _call(
                         original_call_args, context_override=current_context
                     )
 
-                    # Get the appropriate provider call function with the possibly overridden provider
-                    effective_provider = effective_call_args["provider"]
-                    effective_client = effective_call_args["client"]
-
-                    if effective_provider in get_args(LocalProvider):
-                        provider_call, effective_client = _get_local_provider_call(
-                            cast(LocalProvider, effective_provider),
-                            effective_client,
-                            True,
-                        )
-                        effective_call_args["client"] = effective_client
-                    else:
-                        provider_call = _get_provider_call(
-                            cast(Provider, effective_provider)
-                        )
-
-                    # Use the provider-specific call function with overridden args
-                    call_kwargs = dict(effective_call_args)
-                    del call_kwargs["provider"]  # Not a parameter to provider_call
-
-                    # Get decorated function using provider_call
-                    decorated = provider_call(**call_kwargs)(fn)
+                    # Get the (cached) decorated function for the effective call args
+                    decorated = _get_decorated_fn(
+                        fn, effective_call_args, True, decorated_cache
+                    )
 
                     # Call the decorated function and wrap the result
                     result = await decorated(*args, **kwargs)
@@ -317,30 +382,10 @@ def _call(
                     original_call_args
                 )
 
-                # Get the appropriate provider call function with the possibly overridden provider
-                effective_provider = effective_call_args["provider"]
-                effective_client = effective_call_args["client"]
-
-                if effective_provider in get_args(LocalProvider):
-                    provider_call, effective_client = _get_local_provider_call(
-                        cast(LocalProvider, effective_provider),
-                        effective_client,
-                        False,
-                    )
-                    effective_call_args["client"] = effective_client
-                else:
-                    provider_call = _get_provider_call(
-                        cast(Provider, effective_provider)
-                    )
-
-                # Use the provider-specific call function with overridden args
-                call_kwargs = dict(effective_call_args)
-                del call_kwargs[
-                    "provider"
-                ]  # Remove provider as it's not a parameter to provider_call
-
-                # Get decorated function using provider_call
-                decorated = provider_call(**call_kwargs)(fn)
+                # Get the (cached) decorated function for the effective call args
+                decorated = _get_decorated_fn(
+                    fn, effective_call_args, False, decorated_cache
+                )
 
                 # Call the decorated function and wrap the result
                 result = decorated(*args, **kwargs)
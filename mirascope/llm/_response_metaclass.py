@@ -28,4 +28,9 @@ class _ResponseMetaclass(ModelMetaclass):
             if not getattr(f, "__isabstractmethod__", False):
                 cls._properties.append(n)
 
+        # Names resolved on the wrapper rather than proxied to the wrapped response,
+        # precomputed once per class so that attribute access is a single lookup
+        cls._local_names = frozenset(getattr(cls, "_local_names", ())).union(
+            cls._properties
+        )
         return cls
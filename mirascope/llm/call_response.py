@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Sequence
 from functools import cached_property
-from typing import Any
+from typing import Any, ClassVar
 
 from pydantic import computed_field
 
@@ -23,6 +23,14 @@ from ..core.base.types import FinishReason
 from ._response_metaclass import _ResponseMetaclass
 from .tool import Tool
 
+# Fields converted from the wrapped response's provider-specific values on first access
+_LAZY_FIELDS = {
+    "messages": "common_messages",
+    "user_message_param": "common_user_message_param",
+}
+# Accessing `__dict__` (e.g. when serializing or copying) converts all lazy fields
+_LAZY_NAMES = frozenset({*_LAZY_FIELDS, "__dict__"})
+
 
 class CallResponse(
     BaseCallResponse[
@@ -44,37 +52,10 @@ class CallResponse(
     """
 
     _response: BaseCallResponse[Any, BaseTool, Any, Any, Any, Any, Any, Any]
-
-    def __init__(
-        self,
-        response: BaseCallResponse[Any, BaseTool, Any, Any, Any, Any, Any, Any],
-    ) -> None:
-        super().__init__(
-            **{
-                field: getattr(response, field)
-                for field in response.model_fields
-                if field != "user_message_param"
-            }
-        )
-        object.__setattr__(self, "_response", response)
-        object.__setattr__(
-            self, "user_message_param", response.common_user_message_param
-        )
-        object.__setattr__(self, "messages", response.common_messages)
-
-    def __getattribute__(self, name: str) -> Any:  # noqa: ANN401
-        special_names = {
+    _local_names: ClassVar[frozenset[str]] = frozenset(
+        {
             "_response",
-            "common_messages",
-            "finish_reasons",
-            "usage",
-            "message_param",
-            "user_message_param",
-            "messages",
-            "tools",
-            "tool",
             "tool_message_params",
-            "__dict__",
             "__class__",
             "model_fields",
             "__annotations__",
@@ -86,9 +67,40 @@ class CallResponse(
             "__repr__",
             "__str__",
             "_properties",
-        } | set(object.__getattribute__(self, "_properties"))
+            "_local_names",
+        }
+    )
+
+    def __init__(
+        self,
+        response: BaseCallResponse[Any, BaseTool, Any, Any, Any, Any, Any, Any],
+    ) -> None:
+        super().__init__(
+            **{
+                field: getattr(response, field)
+                for field in response.model_fields
+                if field not in _LAZY_FIELDS
+            },
+            messages=[],
+        )
+        # The provider-agnostic messages are only converted when first accessed
+        fields = object.__getattribute__(self, "__dict__")
+        for field in _LAZY_FIELDS:
+            del fields[field]
+        fields["_response"] = response
+
+    def __getattribute__(self, name: str) -> Any:  # noqa: ANN401
+        if name in type(self)._local_names:
+            return object.__getattribute__(self, name)
 
-        if name in special_names:
+        if name in _LAZY_NAMES:
+            fields = object.__getattribute__(self, "__dict__")
+            if "_response" in fields:
+                for field in _LAZY_FIELDS if name == "__dict__" else (name,):
+                    if field not in fields:
+                        fields[field] = getattr(
+                            fields["_response"], _LAZY_FIELDS[field]
+                        )
             return object.__getattribute__(self, name)
 
         try:
@@ -118,7 +130,7 @@ class CallResponse(
     @computed_field
     @cached_property
     def common_messages(self) -> list[BaseMessageParam]:  # pyright: ignore [reportIncompatibleMethodOverride]
-        return self._response.common_messages
+        return self.messages
 
     @cached_property
     def tools(self) -> list[Tool] | None:  # pyright: ignore [reportIncompatibleVariableOverride]
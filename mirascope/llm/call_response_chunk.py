@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, ClassVar
 
 from ..core.base.call_response_chunk import BaseCallResponseChunk
 from ..core.base.types import CostMetadata, FinishReason, Usage
@@ -14,18 +14,8 @@ class CallResponseChunk(
     metaclass=_ResponseMetaclass,
 ):
     _response: BaseCallResponseChunk[Any, Any]
-
-    def __init__(
-        self,
-        response: BaseCallResponseChunk[Any, Any],
-    ) -> None:
-        super().__init__(
-            **{field: getattr(response, field) for field in response.model_fields}
-        )
-        object.__setattr__(self, "_response", response)
-
-    def __getattribute__(self, name: str) -> Any:  # noqa: ANN401
-        special_names = {
+    _local_names: ClassVar[frozenset[str]] = frozenset(
+        {
             "_response",
             "__dict__",
             "__class__",
@@ -37,12 +27,21 @@ class CallResponseChunk(
             "__pydantic_private__",
             "__class_getitem__",
             "_properties",
-            "cost_metadata",
-            "finish_reasons",
-            "usage",
-        } | set(object.__getattribute__(self, "_properties"))
+            "_local_names",
+        }
+    )
 
-        if name in special_names:
+    def __init__(
+        self,
+        response: BaseCallResponseChunk[Any, Any],
+    ) -> None:
+        super().__init__(
+            **{field: getattr(response, field) for field in response.model_fields}
+        )
+        object.__setattr__(self, "_response", response)
+
+    def __getattribute__(self, name: str) -> Any:  # noqa: ANN401
+        if name in type(self)._local_names:
             return object.__getattribute__(self, name)
 
         try:
@@ -68,7 +68,7 @@ def _convert_base_message_param_to_prompt_messages(
                 contents.append(
                     ImageContent(
                         type="image",
-                        data=part.image.decode("utf-8"),
+                        data=bytes(part.image).decode("utf-8"),
                         mimeType=part.media_type,
                     )
                 )
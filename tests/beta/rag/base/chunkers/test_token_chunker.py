@@ -0,0 +1,89 @@
+"""Tests the `TokenChunker` class."""
+
+import io
+from pathlib import Path
+
+from mirascope.beta.rag.base.chunkers.token_chunker import TokenChunker, count_tokens
+from mirascope.beta.rag.base.index_manifest import chunk_id
+
+
+def test_count_tokens() -> None:
+    """Tests that words and symbols count as tokens, long words as several."""
+    assert count_tokens("hello, world") == 3
+    assert count_tokens("a" * 20) == 3
+
+
+def test_token_chunker_sentences_and_headings() -> None:
+    """Tests that chunks end at sentences and each heading starts a new chunk."""
+    chunker = TokenChunker(max_tokens=6)
+    text = "# Title\nSome text. More text.\n\n## Next\nEnd."
+    assert [document.text for document in chunker.chunk(text)] == [
+        "# Title\nSome text.",
+        "More text.",
+        "## Next\nEnd.",
+    ]
+
+
+def test_token_chunker_overlap() -> None:
+    """Tests that trailing units are repeated at the start of the next chunk."""
+    chunker = TokenChunker(max_tokens=6, overlap_tokens=3)
+    assert [document.text for document in chunker.chunk("a b. c d. e f. g h.")] == [
+        "a b. c d.",
+        "c d. e f.",
+        "e f. g h.",
+    ]
+    # Words of sentences that don't fit into a chunk overlap the same way
+    chunker = TokenChunker(max_tokens=4, overlap_tokens=2)
+    chunks = chunker.chunk("one two three four five six seven")
+    assert [document.text for document in chunks] == [
+        "one two three four",
+        "three four five six",
+        "five six seven",
+    ]
+    # The overlap leaves room for the unit that starts the next chunk
+    chunker = TokenChunker(max_tokens=6, overlap_tokens=3)
+    assert [document.text for document in chunker.chunk("a b. c d e f g.")] == [
+        "a b.",
+        "c d e f g.",
+    ]
+
+
+def test_token_chunker_splits_long_words() -> None:
+    """Tests that words longer than `max_tokens` are split between characters."""
+    chunker = TokenChunker(max_tokens=3)
+    word = "x" * 50
+    chunks = chunker.chunk(f"see {word}")
+    assert "".join(document.text for document in chunks).replace("see", "") == word
+    assert all(count_tokens(document.text) <= 3 for document in chunks)
+
+
+def test_token_chunker_ids() -> None:
+    """Tests that chunk ids are namespaced by source and stable across runs."""
+    chunker = TokenChunker(max_tokens=3)
+    assert chunk_id("README.md", "Hello world.") == (
+        "4ab75bc5-aeda-5325-bb76-e4830bede842"
+    )
+    assert [document.id for document in chunker.chunk("Hello world.", "README.md")] == [
+        "4ab75bc5-aeda-5325-bb76-e4830bede842"
+    ]
+    first = chunker.chunk("Same. First.")
+    second = chunker.chunk("Same. Second.")
+    assert first[0].text == second[0].text and first[0].id != second[0].id
+    assert [document.id for document in chunker.chunk("Same. First.")] == [
+        document.id for document in first
+    ]
+    assert chunker.chunk("Same.", "a.md")[0].id != chunker.chunk("Same.", "b.md")[0].id
+
+
+def test_token_chunker_stream_and_file(tmp_path: Path) -> None:
+    """Tests that streamed texts and files chunk like whole texts of their source."""
+    chunker = TokenChunker(max_tokens=5, overlap_tokens=2)
+    text = "First sentence here. Second one.\n\n# Heading\nThird sentence is long."
+    expected = chunker.chunk(text, "doc.md")
+    pieces = [text[i : i + 7] for i in range(0, len(text), 7)]
+    assert list(chunker.chunk_stream(pieces, "doc.md")) == expected
+
+    path = tmp_path / "doc.md"
+    path.write_text(text)
+    assert list(chunker.chunk_file(path)) == chunker.chunk(text, str(path))
+    assert list(chunker.chunk_file(io.BytesIO(text.encode()), "doc.md")) == expected
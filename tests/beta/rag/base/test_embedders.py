@@ -0,0 +1,65 @@
+"""Tests the `CachedEmbedder` class."""
+
+import numpy as np
+import pytest
+
+from mirascope.beta.rag.base.embedders import BaseEmbedder, CachedEmbedder
+from mirascope.beta.rag.base.embedding_response import BaseEmbeddingResponse
+
+# The cache stores embeddings as float32
+POINT_ONE = np.float32(0.1).item()
+
+
+class FakeEmbeddingResponse(BaseEmbeddingResponse[list[list[float]]]):
+    @property
+    def embeddings(self) -> list[list[float]]:
+        return self.response
+
+
+class FakeEmbedder(BaseEmbedder[FakeEmbeddingResponse]):
+    """Embeds each text as `[len(text), 0.1]` and records the embedded texts."""
+
+    embedded: list[str] = []
+
+    def embed(self, input: list[str]) -> FakeEmbeddingResponse:
+        self.embedded += input
+        return FakeEmbeddingResponse(
+            response=[[len(text), 0.1] for text in input], start_time=0, end_time=0
+        )
+
+    async def embed_async(self, input: list[str]) -> FakeEmbeddingResponse:
+        return self.embed(input)
+
+
+def test_cached_embedder() -> None:
+    """Tests that only uncached inputs are embedded, once each."""
+    embedder = CachedEmbedder(embedder=FakeEmbedder())
+    response = embedder.embed(["a", "bb", "a"])
+    assert response.hits == 0
+    assert response.embeddings == [[1, POINT_ONE], [2, POINT_ONE], [1, POINT_ONE]]
+    response = embedder.embed(["bb", "ccc"])
+    assert response.hits == 1
+    assert embedder(["ccc"]) == [[3, POINT_ONE]]
+    assert embedder.embedder.embedded == ["a", "bb", "ccc"]  # pyright: ignore [reportAttributeAccessIssue]
+
+
+@pytest.mark.asyncio
+async def test_cached_embedder_numpy() -> None:
+    """Tests that NumPy embedders get views of the cached embeddings."""
+    embedder = CachedEmbedder(embedder=FakeEmbedder(use_numpy=True))
+    misses = embedder.embed(["a", "bb"])
+    hits = await embedder.embed_async(["bb", "a"])
+    assert hits.hits == 2
+    assert all(
+        isinstance(embedding, np.ndarray) and embedding.dtype == np.float32
+        for embedding in [*misses.cached_embeddings, *hits.cached_embeddings]
+    )
+    # Hits share the bytes cached for the misses instead of copying them
+    assert np.shares_memory(misses.cached_embeddings[0], hits.cached_embeddings[1])
+    np.testing.assert_array_equal(
+        hits.embeddings_array,  # pyright: ignore [reportArgumentType]
+        np.array([[2, 0.1], [1, 0.1]], dtype=np.float32),
+    )
+    assert hits.embeddings == [[2, POINT_ONE], [1, POINT_ONE]]
+    assert isinstance(embedder(["a"])[0], np.ndarray)
+    assert embedder.embedder.embedded == ["a", "bb"]  # pyright: ignore [reportAttributeAccessIssue]
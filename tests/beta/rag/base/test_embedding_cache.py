@@ -0,0 +1,53 @@
+"""Tests the `EmbeddingCache` class."""
+
+from pathlib import Path
+
+import numpy as np
+
+from mirascope.beta.rag.base.embedding_cache import EmbeddingCache
+
+
+def test_embedding_cache_lists(tmp_path: Path) -> None:
+    """Tests that both tiers return float32-rounded lists and integer embeddings."""
+    cache = EmbeddingCache(tmp_path / "embeddings.sqlite")
+    cached = cache.set_many("ns", [(b"a", [0.1, 0]), (b"b", [1, 2])])
+    assert cached == [[np.float32(0.1).item(), 0.0], [1, 2]]
+    assert cache.get_many("ns", [b"a", b"b", b"c"]) == [*cached, None]
+    assert cache.get_many("other", [b"a"]) == [None]
+
+    cache._memory.clear()
+    assert cache.get_many("ns", [b"b", b"a", b"b"]) == [cached[1], *cached]
+    assert len(cache._memory) == 2
+    cache.close()
+
+
+def test_embedding_cache_arrays(tmp_path: Path) -> None:
+    """Tests that arrays are returned as read-only float32 views of the cache."""
+    cache = EmbeddingCache(tmp_path / "embeddings.sqlite")
+    embeddings = np.array([[0.1, 0.2], [0.3, 0.4]], dtype=np.float32)
+    cached = cache.set_many("ns", [(b"a", embeddings[0]), (b"b", [1, 2])], True)
+    assert all(embedding.dtype == np.float32 for embedding in cached)
+    np.testing.assert_array_equal(cached[0], embeddings[0])
+    np.testing.assert_array_equal(cached[1], [1, 2])
+
+    hits = cache.get_many("ns", [b"a", b"b"], True)
+    assert hits[0] is not None and not hits[0].flags.writeable
+    np.testing.assert_array_equal(hits[0], embeddings[0])
+    assert cache.get_many("ns", [b"a"]) == [embeddings[0].tolist()]
+
+    cache._memory.clear()
+    hits = cache.get_many("ns", [b"a", b"b"], True)
+    np.testing.assert_array_equal(np.stack(hits), [embeddings[0], [1, 2]])  # pyright: ignore [reportArgumentType, reportCallIssue]
+
+
+def test_embedding_cache_max_size_and_clear() -> None:
+    """Tests that the in-memory tier is bounded and that namespaces are cleared."""
+    cache = EmbeddingCache(max_size=1)
+    cache.set_many("ns", [(b"a", [1.0]), (b"b", [2.0])])
+    assert cache.get_many("ns", [b"a", b"b"]) == [None, [2.0]]
+    cache.set_many("other", [(b"a", [1.0])])
+    cache.clear("other")
+    assert cache.get_many("other", [b"a"]) == [None]
+    cache.set_many("ns", [(b"a", [1.0])])
+    cache.clear()
+    assert cache.get_many("ns", [b"a"]) == [None]
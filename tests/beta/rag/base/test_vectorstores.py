@@ -0,0 +1,98 @@
+"""Tests the `BaseVectorStore` class."""
+
+from typing import Any, ClassVar
+
+import pytest
+
+from mirascope.beta.rag.base.chunkers import TextChunker
+from mirascope.beta.rag.base.document import Document
+from mirascope.beta.rag.base.index_manifest import IndexManifest, chunk_id
+from mirascope.beta.rag.base.query_results import BaseQueryResults
+from mirascope.beta.rag.base.vectorstores import BaseVectorStore
+
+
+class DictVectorStore(BaseVectorStore):
+    """Stores documents in a dict and records the calls to `add` and `delete`."""
+
+    chunker = TextChunker(chunk_size=4, chunk_overlap=0)
+    index_name = "dict"
+    documents: ClassVar[dict[str, Document]]
+    calls: ClassVar[list[tuple[str, list[str]]]]
+
+    def retrieve(self, text: str, **kwargs: Any) -> BaseQueryResults:  # noqa: ANN401
+        raise NotImplementedError  # pragma: no cover
+
+    def add(self, text: str | list[Document], **kwargs: Any) -> None:  # noqa: ANN401
+        assert isinstance(text, list)
+        self.calls.append(("add", [document.text for document in text]))
+        self.documents.update((document.id, document) for document in text)
+
+    def delete(self, ids: list[str], **kwargs: Any) -> None:  # noqa: ANN401
+        self.calls.append(("delete", [self.documents.pop(id).text for id in ids]))
+
+
+@pytest.fixture
+def store() -> DictVectorStore:
+    DictVectorStore.manifest = IndexManifest()
+    DictVectorStore.documents, DictVectorStore.calls = {}, []
+    return DictVectorStore()
+
+
+def test_delete_is_abstract() -> None:
+    """Tests that vectorstores must implement `delete`."""
+
+    class NoDeleteStore(BaseVectorStore):
+        def retrieve(self, text: str, **kwargs: Any) -> BaseQueryResults:  # noqa: ANN401
+            raise NotImplementedError  # pragma: no cover
+
+        def add(self, text: str | list[Document], **kwargs: Any) -> None:  # noqa: ANN401
+            raise NotImplementedError  # pragma: no cover
+
+    with pytest.raises(TypeError, match="delete"):
+        NoDeleteStore()  # pyright: ignore [reportAbstractUsage]
+
+
+def test_update_document(store: DictVectorStore) -> None:
+    """Tests that only new chunks are added and vanished chunks are deleted."""
+    store.update_document("doc", "aaaabbbbcccc", {"source": "test"})
+    assert store.calls == [("add", ["aaaa", "bbbb", "cccc"])]
+    assert sorted(store.documents) == sorted(
+        chunk_id("doc", text) for text in ["aaaa", "bbbb", "cccc"]
+    )
+    assert store.documents[chunk_id("doc", "aaaa")].metadata == {
+        "source": "test",
+        "document_id": "doc",
+    }
+
+    store.calls.clear()
+    store.update_document("doc", "aaaaddddcccc")
+    assert store.calls == [("add", ["dddd"]), ("delete", ["bbbb"])]
+
+    store.calls.clear()
+    store.update_document("doc", "aaaaddddcccc")
+    assert store.calls == []
+
+    # Chunks with the same text in other documents get their own ids
+    store.update_document("other", "aaaa")
+    assert store.calls == [("add", ["aaaa"])]
+    assert len(store.documents) == 4
+
+
+def test_remove_document(store: DictVectorStore) -> None:
+    """Tests that all chunks of a removed document are deleted."""
+    store.update_document("doc", "aaaabbbb")
+    store.calls.clear()
+    store.remove_document("doc")
+    assert [(name, sorted(texts)) for name, texts in store.calls] == [
+        ("delete", ["aaaa", "bbbb"])
+    ]
+    assert store.documents == {}
+    store.remove_document("doc")
+    assert len(store.calls) == 1
+
+
+def test_update_document_without_manifest(store: DictVectorStore) -> None:
+    """Tests that indexing incrementally requires a manifest."""
+    DictVectorStore.manifest = None
+    with pytest.raises(ValueError, match="needs a `manifest`"):
+        store.update_document("doc", "text")
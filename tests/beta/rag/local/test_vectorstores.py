@@ -0,0 +1,195 @@
+"""Tests the `LocalVectorStore` class."""
+
+import zlib
+from pathlib import Path
+from typing import Literal
+
+import numpy as np
+import pytest
+
+from mirascope.beta.rag.base.document import Document
+from mirascope.beta.rag.base.embedders import BaseEmbedder
+from mirascope.beta.rag.base.embedding_response import BaseEmbeddingResponse
+from mirascope.beta.rag.local import LocalParams, LocalSettings, LocalVectorStore
+from mirascope.beta.rag.local.vectorstores import _LocalIndex
+
+
+class FakeEmbeddingResponse(BaseEmbeddingResponse[list[list[float]]]):
+    @property
+    def embeddings(self) -> list[list[float]]:
+        return self.response
+
+
+class FakeEmbedder(BaseEmbedder[FakeEmbeddingResponse]):
+    """Embeds each text as a random vector seeded by the text."""
+
+    def embed(self, input: list[str]) -> FakeEmbeddingResponse:
+        embeddings = [
+            np.random.default_rng(zlib.crc32(text.encode())).standard_normal(8)
+            for text in input
+        ]
+        return FakeEmbeddingResponse(
+            response=[embedding.tolist() for embedding in embeddings],
+            start_time=0,
+            end_time=0,
+        )
+
+    async def embed_async(self, input: list[str]) -> FakeEmbeddingResponse:
+        return self.embed(input)  # pragma: no cover
+
+
+def _store(
+    path: Path | None = None,
+    max_segments: int = 16,
+    quantization: Literal["int8", "binary"] | None = None,
+) -> LocalVectorStore:
+    class Store(LocalVectorStore):
+        embedder = FakeEmbedder()
+        vectorstore_params = LocalParams(
+            max_segments=max_segments, quantization=quantization
+        )
+        client_settings = LocalSettings(path=None if path is None else str(path))
+
+    return Store()
+
+
+def _documents(*ids: str, prefix: str = "text") -> list[Document]:
+    return [Document(id=id, text=f"{prefix} {id}") for id in ids]
+
+
+@pytest.mark.parametrize("quantization", [None, "int8", "binary"])
+def test_local_vectorstore_add_retrieve(
+    quantization: Literal["int8", "binary"] | None,
+) -> None:
+    """Tests that the closest documents are retrieved from best to worst."""
+    store = _store(quantization=quantization)
+    store.add(_documents(*map(str, range(50))))
+    result = store.retrieve("text 7", top_k=3)
+    assert result.ids[0] == "7" and result.documents[0] == "text 7"
+    assert result.scores[0] == pytest.approx(1, abs=1e-5)
+    assert result.scores == sorted(result.scores, reverse=True)
+    assert len(result.ids) == 3
+    assert [result.ids[0] for result in store.retrieve_many(["text 3", "text 9"])] == [
+        "3",
+        "9",
+    ]
+
+
+def test_local_vectorstore_replace() -> None:
+    """Tests that documents added again with the same id replace the previous ones."""
+    store = _store()
+    store.add(_documents("a", "b"))
+    store.add(_documents("a", prefix="new"))
+    result = store.retrieve("text a", top_k=8)
+    assert sorted(result.ids) == ["a", "b"]
+    assert "text a" not in result.documents and "new a" in result.documents
+    assert store.retrieve("new a", top_k=1).ids == ["a"]
+
+
+def test_local_vectorstore_delete() -> None:
+    """Tests that deleted documents are no longer retrieved."""
+    store = _store()
+    store.add(_documents("a", "b", "c"))
+    store.delete(["b", "missing"])
+    assert sorted(store.retrieve("text b").ids) == ["a", "c"]
+
+
+def test_local_vectorstore_quantized_in_memory() -> None:
+    """Tests that in-memory quantized stores don't keep the embeddings in memory."""
+    store = _store(quantization="int8")
+    store.add(_documents("a", "b"))
+    store.add(_documents("c"))
+    store.compact()
+    assert isinstance(store._index.segments[0].embeddings, np.memmap)
+    assert store._index.segments[0].codes is not None
+    assert store.retrieve("text c", top_k=1).ids == ["c"]
+
+
+def test_local_vectorstore_compact() -> None:
+    """Tests that `compact` merges all segments and drops replaced and deleted rows."""
+    store = _store()
+    store.add(_documents("a", "b"))
+    store.add(_documents("b", "c"))
+    store.delete(["a"])
+    index = store._index
+    assert len(index.segments) == 2
+    store.compact()
+    assert len(index.segments) == 1
+    assert index.segments[0].ids == ["b", "c"]
+    assert not index.deleted
+    assert sorted(store.retrieve("text b").ids) == ["b", "c"]
+    segment = index.segments[0]
+    store.compact()
+    assert index.segments == [segment]
+
+
+def test_local_vectorstore_merges_similar_segments() -> None:
+    """Tests that adds only merge the smallest segments of similar size."""
+    store = _store(max_segments=4)
+    store.add(_documents(*(f"big {i}" for i in range(100))))
+    big = store._index.segments[0]
+    for i in range(40):
+        store.add(_documents(f"small {i}"))
+        assert len(store._index.segments) <= 4
+    # The big segment is never rewritten for the small adds
+    assert store._index.segments[0] is big
+    assert len(store.retrieve("text small 3", top_k=200).ids) == 140
+
+
+@pytest.mark.parametrize("quantization", [None, "int8"])
+def test_local_vectorstore_reload(
+    tmp_path: Path, quantization: Literal["int8", "binary"] | None
+) -> None:
+    """Tests that persisted stores reload their live documents."""
+    store = _store(tmp_path, max_segments=2, quantization=quantization)
+    store.add(_documents("a", "b"))
+    store.add(_documents("a", prefix="new"))
+    store.add(_documents("c", "d"))
+    store.delete(["d"])
+
+    index = _LocalIndex(tmp_path, "cosine", 2, quantization)
+    assert sorted(
+        (id, segment.texts[row]) for id, (segment, row) in index.locations.items()
+    ) == [("a", "new a"), ("b", "text b"), ("c", "text c")]
+    matches = index.search(store._embed(["new a"]), 1, None)
+    assert [segment.ids[row] for _, segment, row in matches[0]] == ["a"]
+
+    store.compact()
+    index = _LocalIndex(tmp_path, "cosine", 2, quantization)
+    assert [segment.ids for segment in index.segments] == [["b", "a", "c"]]
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(
+        ["manifest.json"]
+        + [
+            f"{index.segments[0].name}{suffix}"
+            for suffix in [".jsonl", ".npy"]
+            + ([".codes.npy", ".scales.npy"] if quantization else [])
+        ]
+    )
+
+
+def test_local_vectorstore_reload_mismatched_settings(tmp_path: Path) -> None:
+    """Tests that a persisted store can't be reloaded with other settings."""
+    _store(tmp_path).add(_documents("a"))
+    with pytest.raises(ValueError, match="dot metric|cosine metric"):
+        _LocalIndex(tmp_path, "dot", 16)
+    with pytest.raises(ValueError, match="quantization"):
+        _LocalIndex(tmp_path, "cosine", 16, "int8")
+
+
+def test_local_vectorstore_shared_index(tmp_path: Path) -> None:
+    """Tests that stores persisted in the same directory share one index."""
+    first, second = _store(tmp_path), _store(tmp_path)
+    first.add(_documents("a"))
+    second.add(_documents("b"))
+    assert first._index is second._index
+    assert sorted(first.retrieve("text a").ids) == ["a", "b"]
+    with pytest.raises(ValueError, match="already open"):
+        _ = _store(tmp_path, max_segments=2)._index
+
+
+def test_local_vectorstore_mismatched_dimensions() -> None:
+    """Tests that embeddings must keep the dimensions of the first add."""
+    store = _store()
+    store.add(_documents("a"))
+    with pytest.raises(ValueError, match="Expected embeddings with 8 dimensions"):
+        store._index.add(_documents("b"), np.ones((1, 4), dtype=np.float32))
@@ -1 +1,24 @@
 """Test configuration fixtures used across various modules."""
+
+from collections.abc import Generator
+
+import pytest
+
+from mirascope.core.base._utils._parse_content_template import _clear_media_cache
+from mirascope.core.base.client_pool import clear_client_pool
+
+
+@pytest.fixture(autouse=True)
+def clear_default_clients() -> Generator[None, None, None]:
+    """Ensures pooled default clients (often mocks) don't leak between tests."""
+    clear_client_pool()
+    yield
+    clear_client_pool()
+
+
+@pytest.fixture(autouse=True)
+def clear_media_cache() -> Generator[None, None, None]:
+    """Ensures media downloaded (often from mocks) in one test isn't reused in another."""
+    _clear_media_cache()
+    yield
+    _clear_media_cache()
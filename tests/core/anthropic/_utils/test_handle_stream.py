@@ -186,6 +186,7 @@ def test_handle_stream_with_partial_tools(
         and tool.delta == ' of the Wind", "author": '
         and tool.model_dump(exclude={"tool_call", "delta"})
         == {"author": None, "title": "The Name of the Wind"}
+        and tool.tool_call.input == '{"title": "The Name of the Wind", "author": '
     )
 
     # Third partial response
@@ -266,15 +267,29 @@ async def test_handle_stream_async_with_partial_tools(
 def test_handle_chunk_no_tool_types() -> None:
     """Tests the `_handle_chunk` function with no tool types."""
     mock_chunk = MagicMock(spec=MessageStreamEvent)
-    mock_current_tool_call = MagicMock(spec=ToolUseBlock)
-    buffer, chunk, current_tool_call, current_tool_type = _handle_chunk(
-        "",
-        mock_chunk,
-        mock_current_tool_call,
-        None,
-        None,
-    )
-    assert buffer == ""
-    assert chunk is None
-    assert current_tool_call == mock_current_tool_call
-    assert current_tool_type is None
+    state, tool = _handle_chunk(None, mock_chunk, None)
+    assert state is None
+    assert tool is None
+
+
+def test_handle_stream_tool_without_input() -> None:
+    """Tests that tools without any input are still constructed."""
+
+    class GetTime(AnthropicTool):
+        """Returns the current time."""
+
+        def call(self) -> None:
+            """Dummy call."""
+
+    chunks = [
+        RawContentBlockStartEvent(
+            content_block=ToolUseBlock(
+                id="id", input={}, name="GetTime", type="tool_use"
+            ),
+            index=0,
+            type="content_block_start",
+        ),
+        RawContentBlockStopEvent(index=0, type="content_block_stop"),
+    ]
+    result = list(handle_stream(iter(chunks), tool_types=[FormatBook, GetTime]))
+    assert isinstance(result[1][1], GetTime)
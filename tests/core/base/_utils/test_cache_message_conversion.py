@@ -0,0 +1,146 @@
+"""Tests the `_utils.cache_message_conversion` module."""
+
+import gc
+from unittest.mock import MagicMock, patch
+
+from mirascope.core.base import (
+    BaseMessageParam,
+    ImagePart,
+    TextPart,
+    ToolCallPart,
+)
+from mirascope.core.base._utils._cache_message_conversion import (
+    cache_message_conversion,
+)
+
+
+def _make_convert() -> tuple[MagicMock, MagicMock]:
+    convert = MagicMock(side_effect=lambda messages: [repr(m) for m in messages])
+    convert.__name__ = "convert"
+    return convert, cache_message_conversion(convert)
+
+
+def test_cache_message_conversion() -> None:
+    """Tests that only new messages and the final message are converted."""
+    convert, cached_convert = _make_convert()
+    history = [
+        BaseMessageParam(role="system", content="system"),
+        BaseMessageParam(role="user", content=[TextPart(type="text", text="hi")]),
+    ]
+    assert cached_convert([]) == []
+    assert cached_convert(history) == convert(history)
+    convert.reset_mock()
+
+    history.append(BaseMessageParam(role="assistant", content="hello"))
+    assert cached_convert(history) == [repr(message) for message in history]
+    assert [call.args[0] for call in convert.call_args_list] == [
+        [history[1]],
+        [history[2]],
+    ]
+    convert.reset_mock()
+
+    history.append(BaseMessageParam(role="user", content="bye"))
+    cached_convert(history)
+    assert [call.args[0] for call in convert.call_args_list] == [
+        [history[2]],
+        [history[3]],
+    ]
+
+
+def test_cache_message_conversion_modified_message() -> None:
+    """Tests that messages whose role or content are reassigned are converted again."""
+    convert, cached_convert = _make_convert()
+    message = BaseMessageParam(role="user", content=[TextPart(type="text", text="a")])
+    last = BaseMessageParam(role="user", content="last")
+    cached_convert([message, last])
+
+    message.content = [*message.content, TextPart(type="text", text="b")]
+    convert.reset_mock()
+    assert cached_convert([message, last])[0] == repr(message)
+    assert convert.call_count == 2
+
+
+def test_cache_message_conversion_edited_parts() -> None:
+    """Tests that messages whose parts are edited in place are converted again."""
+    convert, cached_convert = _make_convert()
+    text = TextPart(type="text", text="a")
+    image = ImagePart(type="image", media_type="image/png", image=b"a", detail=None)
+    tool_call = ToolCallPart(type="tool_call", name="tool", args={"a": [1]})
+    message = BaseMessageParam(role="user", content=[text, image, tool_call])
+    last = BaseMessageParam(role="user", content="last")
+    cached_convert([message, last])
+
+    for edit in [
+        lambda: setattr(text, "text", "b"),
+        lambda: setattr(image, "image", b"b"),
+        lambda: tool_call.args["a"].append(2),  # pyright: ignore [reportOptionalSubscript]
+    ]:
+        convert.reset_mock()
+        cached_convert([message, last])
+        assert convert.call_count == 1
+        edit()
+        convert.reset_mock()
+        assert cached_convert([message, last])[0] == repr(message)
+        assert convert.call_count == 2
+
+
+def test_cache_message_conversion_uncacheable_messages() -> None:
+    """Tests that dicts and messages with mutable media are always converted."""
+    convert, cached_convert = _make_convert()
+    provider_message, last = {"role": "user"}, {"role": "user"}
+    image = ImagePart(
+        type="image",
+        media_type="image/png",
+        image=memoryview(bytearray(b"a")),
+        detail=None,
+    )
+    message = BaseMessageParam(role="user", content=[image])
+    for _ in range(2):
+        convert.reset_mock()
+        cached_convert([provider_message, message, last])
+        assert [call.args[0] for call in convert.call_args_list] == [
+            [provider_message],
+            [message],
+            [last],
+        ]
+
+
+def test_cache_message_conversion_lru() -> None:
+    """Tests that the least recently converted messages are evicted first."""
+    convert, cached_convert = _make_convert()
+    first, second, last = (
+        BaseMessageParam(role="user", content=content)
+        for content in ["first", "second", "last"]
+    )
+    with patch("mirascope.core.base._utils._cache_message_conversion._CACHE_SIZE", 1):
+        cached_convert([first, last])
+        convert.reset_mock()
+        cached_convert([first, last])
+        assert [call.args[0] for call in convert.call_args_list] == [[last]]
+        cached_convert([second, last])
+        convert.reset_mock()
+        cached_convert([first, last])
+        assert [call.args[0] for call in convert.call_args_list] == [[first], [last]]
+
+
+def test_cache_message_conversion_evicts_dead_messages() -> None:
+    """Tests that entries are dropped once their message is garbage collected."""
+    converted_texts = []
+
+    @cache_message_conversion
+    def convert(messages: list[BaseMessageParam]) -> list[str]:
+        converted_texts.extend(message.content for message in messages)
+        return [str(message.content) for message in messages]
+
+    assert convert(
+        [
+            BaseMessageParam(role="user", content="a"),
+            BaseMessageParam(role="user", content="b"),
+        ]
+    ) == ["a", "b"]
+    gc.collect()
+    last = BaseMessageParam(role="user", content="c")
+    assert convert([last, last]) == ["c", "c"]
+    convert.cache_clear()  # pyright: ignore [reportFunctionMemberAccess]
+    assert convert([last, last]) == ["c", "c"]
+    assert converted_texts == ["a", "b", "c", "c", "c", "c"]
@@ -2,6 +2,8 @@
 
 from typing import Annotated
 
+from pydantic import BaseModel
+
 from mirascope.core.base._utils._convert_base_type_to_base_tool import (
     convert_base_type_to_base_tool,
 )
@@ -19,3 +21,16 @@ def test_convert_base_type_to_base_tool() -> None:
     assert tool._name() == "str"
     assert tool._description() == DEFAULT_TOOL_DOCSTRING
     assert "value" in tool.model_fields
+
+
+def test_convert_base_type_to_base_tool_cached() -> None:
+    """Tests that conversions are cached per base type and base tool type."""
+    tool = convert_base_type_to_base_tool(list[int], BaseTool)
+    assert convert_base_type_to_base_tool(list[int], BaseTool) is tool
+    assert convert_base_type_to_base_tool(list[str], BaseTool) is not tool
+    assert convert_base_type_to_base_tool(list[int], BaseModel) is not tool
+
+    unhashable = Annotated[int, {"unhashable": []}]
+    tool = convert_base_type_to_base_tool(unhashable, BaseTool)  # type: ignore
+    assert tool._name() == "int"
+    assert convert_base_type_to_base_tool(unhashable, BaseTool) is not tool  # type: ignore
@@ -0,0 +1,41 @@
+"""Tests the `_utils.encode_base64` module."""
+
+import base64
+from unittest.mock import patch
+
+from mirascope.core.base._utils import _encode_base64
+from mirascope.core.base._utils._encode_base64 import encode_base64
+
+
+def test_encode_base64() -> None:
+    """Tests that large payloads are encoded once per content."""
+    _encode_base64._encoded_cache.clear()
+    _encode_base64._encoded_cache_bytes = 0
+
+    small = b"small"
+    assert encode_base64(small) == base64.b64encode(small).decode("utf-8")
+    assert not _encode_base64._encoded_cache
+
+    data = bytes(range(256)) * 32
+    encoded = encode_base64(data)
+    assert encoded == base64.b64encode(data).decode("utf-8")
+    assert encode_base64(bytearray(data)) is encoded
+    assert encode_base64(memoryview(data)) is encoded
+    assert _encode_base64._encoded_cache_bytes == len(encoded)
+
+
+def test_encode_base64_bounded() -> None:
+    """Tests that the cache evicts the least recently used encodings."""
+    _encode_base64._encoded_cache.clear()
+    _encode_base64._encoded_cache_bytes = 0
+
+    first, second = b"a" * 6000, b"b" * 6000
+    with patch.object(_encode_base64, "_CACHE_MAX_BYTES", 10000):
+        encode_base64(first)
+        encode_base64(second)
+        assert list(_encode_base64._encoded_cache.values()) == [encode_base64(second)]
+        assert _encode_base64._encoded_cache_bytes == 8000
+
+        # Payloads whose encoding exceeds the whole budget are never cached
+        encode_base64(b"c" * 9000)
+        assert len(_encode_base64._encoded_cache) == 1
@@ -2,7 +2,10 @@
 
 from unittest.mock import MagicMock, patch
 
-from mirascope.core.base._utils._format_template import format_template
+from mirascope.core.base._utils._format_template import (
+    _compile_template,
+    format_template,
+)
 
 
 @patch(
@@ -17,6 +20,7 @@ def test_format_template(
     mock_get_template_variables: MagicMock, mock_get_template_values: MagicMock
 ) -> None:
     """Tests the `format_template` function."""
+    _compile_template.cache_clear()
     mock_get_template_variables.return_value = [("genre", None)]
     attrs = {"genre": "fantasy"}
     mock_get_template_values.return_value = attrs
@@ -68,3 +72,22 @@ def test_format_template_with_internal_tab() -> None:
     template = "output \text"
     formatted_template = format_template(template, {})
     assert formatted_template == "output \text"
+
+
+def test_format_template_caches_compiled_template() -> None:
+    """Tests that `format_template` only compiles a given template once."""
+    _compile_template.cache_clear()
+    template = """
+    Recommend a {genre} book about {topics:list}.
+    """
+    assert (
+        format_template(template, {"genre": "fantasy", "topics": ["dragons"]})
+        == "Recommend a fantasy book about dragons."
+    )
+    assert (
+        format_template(template, {"genre": "horror", "topics": ["ghosts", "crypts"]})
+        == "Recommend a horror book about ghosts\ncrypts."
+    )
+    cache_info = _compile_template.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 1
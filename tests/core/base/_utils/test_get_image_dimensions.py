@@ -1,14 +1,33 @@
 """Tests for the get_image_dimensions function."""
 
 import base64
+import io
+from collections.abc import Generator
 from unittest.mock import MagicMock, patch
 
 import pytest
+from PIL import Image
 
-from mirascope.core.base._utils import get_image_dimensions
+from mirascope.core.base._utils import (
+    cache_image_dimensions,
+    get_image_dimensions,
+    sniff_image_dimensions,
+)
+from mirascope.core.base._utils._get_image_dimensions import (
+    _image_dimensions_cache,
+    _sniff_image_dimensions,
+)
 from mirascope.core.base.types import ImageMetadata
 
 
+@pytest.fixture(autouse=True)
+def clear_image_dimensions_cache() -> Generator[None, None, None]:
+    """Clears the image dimensions cache around each test."""
+    _image_dimensions_cache.clear()
+    yield
+    _image_dimensions_cache.clear()
+
+
 @pytest.fixture
 def mock_pil_image():
     """Fixture to create a mock PIL Image."""
@@ -26,13 +45,14 @@ def sample_base64_image():
     return f"data:image/jpeg;base64,{base64_data}"
 
 
-@patch("mirascope.core.base._utils._get_image_dimensions._load_media")
+@patch("mirascope.core.base._utils._get_image_dimensions.urllib.request.urlopen")
 @patch("mirascope.core.base.types.Image.open")
 @patch("mirascope.core.base.types.has_pil_module", True)
-def test_http_url(mock_image_open, mock_load_media, mock_pil_image):
+def test_http_url(mock_image_open, mock_urlopen, mock_pil_image):
     """Test getting dimensions from an HTTP URL."""
     # Setup
-    mock_load_media.return_value = b"binary_image_data"
+    mock_response = mock_urlopen.return_value.__enter__.return_value
+    mock_response.read.side_effect = [b"binary_", b"image", b"_data"]
     mock_image_instance = MagicMock()
     mock_image_instance.size = (800, 600)
     mock_image_open.return_value.__enter__.return_value = mock_image_instance
@@ -41,7 +61,8 @@ def test_http_url(mock_image_open, mock_load_media, mock_pil_image):
     result = get_image_dimensions("https://example.com/image.jpg")
 
     # Assert
-    mock_load_media.assert_called_once_with("https://example.com/image.jpg")
+    mock_urlopen.assert_called_once_with("https://example.com/image.jpg")
+    assert mock_image_open.call_args.args[0].getvalue() == b"binary_image_data"
     assert result == ImageMetadata(width=800, height=600)
 
 
@@ -63,11 +84,12 @@ def test_data_url(mock_image_open, sample_base64_image):
 
 
 @patch("mirascope.core.base.types.has_pil_module", False)
-@patch("mirascope.core.base._utils._get_image_dimensions._load_media")
-def test_pil_not_available(mock_load_media):
+@patch("mirascope.core.base._utils._get_image_dimensions.urllib.request.urlopen")
+def test_pil_not_available(mock_urlopen):
     """Test behavior when PIL is not available."""
     # Setup
-    mock_load_media.return_value = b"binary_image_data"
+    mock_response = mock_urlopen.return_value.__enter__.return_value
+    mock_response.read.return_value = b"binary_image_data"
 
     # Execute
     result = get_image_dimensions("https://example.com/image.jpg")
@@ -78,11 +100,11 @@ def test_pil_not_available(mock_load_media):
 
 @patch("mirascope.core.base.types.Image.open")
 @patch("mirascope.core.base.types.has_pil_module", True)
-@patch("mirascope.core.base._utils._get_image_dimensions._load_media")
-def test_exception_handling(mock_image_open, mock_load_media):
+@patch("mirascope.core.base._utils._get_image_dimensions.urllib.request.urlopen")
+def test_exception_handling(mock_urlopen, mock_image_open):
     """Test that exceptions are properly handled."""
     # Setup
-    mock_load_media.side_effect = Exception("Network error")
+    mock_urlopen.side_effect = Exception("Network error")
 
     # Execute
     result = get_image_dimensions("https://example.com/image.jpg")
@@ -120,3 +142,133 @@ def test_with_pytest_fixtures(setup_pil_mock, sample_base64_image):
     # Assert
     setup_pil_mock.assert_called_once()
     assert result == ImageMetadata(width=100, height=200)
+
+
+@pytest.mark.parametrize(
+    "format,kwargs",
+    [
+        ("PNG", {}),
+        ("GIF", {}),
+        ("JPEG", {}),
+        ("JPEG", {"exif": b"Exif\x00\x00" + b"\x00" * 5000}),
+        ("WEBP", {}),
+        ("WEBP", {"lossless": True}),
+        ("WEBP", {"exif": b"Exif\x00\x00"}),
+    ],
+)
+def test_sniff_image_dimensions(format: str, kwargs: dict) -> None:
+    """Tests reading image dimensions from image headers."""
+    buffer = io.BytesIO()
+    Image.new("RGBA" if format == "WEBP" and kwargs else "RGB", (123, 45)).save(
+        buffer, format, **kwargs
+    )
+    data = buffer.getvalue()
+    assert _sniff_image_dimensions(data) == (123, 45)
+    assert _sniff_image_dimensions(data[:8]) is None
+    assert _sniff_image_dimensions(b"BM" + data) is None
+
+
+def test_sniff_image_dimensions_edge_cases() -> None:
+    """Tests sniffing JPEG padding and standalone markers and unknown WebP chunks."""
+    sof = b"\xff\xc0\x00\x11\x08\x00\x2d\x00\x7b"
+    assert _sniff_image_dimensions(b"\xff\xd8\x00\xff\xff\xd0" + sof) == (123, 45)
+    assert _sniff_image_dimensions(b"RIFF\x00\x00\x00\x00WEBPVP8?" + sof) is None
+
+
+def test_data_url_edge_cases() -> None:
+    """Tests small, unprefixed, and malformed base64 image data."""
+    buffer = io.BytesIO()
+    Image.new("RGB", (7, 3)).save(buffer, "PNG")
+    data = base64.b64encode(buffer.getvalue()).decode()
+    assert get_image_dimensions(data) == ImageMetadata(width=7, height=3)
+
+    data = base64.b64encode(buffer.getvalue() + b"\x00" * 5000).decode()
+    data_url = f"data:image/png;base64,{data[:5]}\n{data[5:]}"
+    assert get_image_dimensions(data_url) == ImageMetadata(width=7, height=3)
+
+
+@patch("mirascope.core.base._utils._get_image_dimensions._CACHE_SIZE", 1)
+def test_cache_eviction() -> None:
+    """Tests that the least recently used dimensions are evicted."""
+    for size in (1, 2):
+        buffer = io.BytesIO()
+        Image.new("RGB", (size, size)).save(buffer, "GIF")
+        get_image_dimensions(base64.b64encode(buffer.getvalue()).decode())
+    assert [dimensions for dimensions, _ in _image_dimensions_cache.values()] == [
+        ImageMetadata(width=2, height=2)
+    ]
+
+
+@patch("mirascope.core.base.types.Image.open")
+def test_data_url_header_only_and_cached(mock_image_open):
+    """Tests that large data URLs are sniffed from their header and cached."""
+    buffer = io.BytesIO()
+    Image.new("RGB", (640, 480)).save(buffer, "PNG")
+    data = buffer.getvalue() + b"\x00" * 100_000
+    data_url = f"data:image/png;base64,{base64.b64encode(data).decode()}"
+
+    with patch("base64.b64decode", wraps=base64.b64decode) as mock_b64decode:
+        result = get_image_dimensions(data_url)
+        assert result == ImageMetadata(width=640, height=480)
+        assert len(mock_b64decode.call_args.args[0]) == 4096
+        result.detail = "high"
+
+        mock_b64decode.reset_mock()
+        assert get_image_dimensions(data_url) == ImageMetadata(width=640, height=480)
+        mock_b64decode.assert_not_called()
+    mock_image_open.assert_not_called()
+
+
+@patch("mirascope.core.base._utils._get_image_dimensions.urllib.request.urlopen")
+def test_http_url_reads_header_only(mock_urlopen):
+    """Tests that only the header of a remote image is downloaded."""
+    buffer = io.BytesIO()
+    Image.new("RGB", (32, 16)).save(buffer, "GIF")
+    mock_response = mock_urlopen.return_value.__enter__.return_value
+    mock_response.read.return_value = buffer.getvalue()[:4096]
+
+    url = "https://example.com/image.gif"
+    assert get_image_dimensions(url) == ImageMetadata(width=32, height=16)
+    assert get_image_dimensions(url) == ImageMetadata(width=32, height=16)
+    mock_urlopen.assert_called_once()
+    mock_response.read.assert_called_once_with(4096)
+
+
+@patch("mirascope.core.base._utils._get_image_dimensions.urllib.request.urlopen")
+def test_http_url_cache_expires(mock_urlopen):
+    """Tests that the dimensions of remote images are only cached for a while."""
+    buffer = io.BytesIO()
+    Image.new("RGB", (32, 16)).save(buffer, "GIF")
+    mock_response = mock_urlopen.return_value.__enter__.return_value
+    mock_response.read.return_value = buffer.getvalue()
+
+    url = "https://example.com/image.gif"
+    with patch("time.monotonic", return_value=0.0):
+        assert get_image_dimensions(url) == ImageMetadata(width=32, height=16)
+    with patch("time.monotonic", return_value=299.0):
+        assert get_image_dimensions(url) == ImageMetadata(width=32, height=16)
+    assert mock_urlopen.call_count == 1
+    with patch("time.monotonic", return_value=301.0):
+        assert get_image_dimensions(url) == ImageMetadata(width=32, height=16)
+    assert mock_urlopen.call_count == 2
+
+
+@patch("mirascope.core.base.types.Image.open")
+def test_cache_image_dimensions(mock_image_open):
+    """Tests that recorded dimensions are returned without decoding the image."""
+    data_url = "data:image/png;base64,bm90IGFuIGltYWdl"
+    cache_image_dimensions(data_url, ImageMetadata(width=3, height=4))
+    with patch("base64.b64decode") as mock_b64decode:
+        assert get_image_dimensions(data_url) == ImageMetadata(width=3, height=4)
+        mock_b64decode.assert_not_called()
+    mock_image_open.assert_not_called()
+
+
+def test_sniff_image_dimensions_metadata() -> None:
+    """Tests sniffing the dimensions of image bytes into `ImageMetadata`."""
+    buffer = io.BytesIO()
+    Image.new("RGB", (5, 7)).save(buffer, "PNG")
+    assert sniff_image_dimensions(memoryview(buffer.getvalue())) == ImageMetadata(
+        width=5, height=7
+    )
+    assert sniff_image_dimensions(b"not an image") is None
@@ -0,0 +1,48 @@
+"""Tests the `_utils._lazy_partial_tool` module."""
+
+from unittest.mock import MagicMock
+
+from mirascope.core.base import BaseTool
+from mirascope.core.base._utils._lazy_partial_tool import (
+    defer_tool_call,
+    lazy_partial_tool_type,
+)
+
+
+class FormatBook(BaseTool):
+    tool_call: str | None = None
+    title: str
+    author: str
+
+    def call(self) -> str:
+        return f"{self.title} by {self.author}"
+
+
+def test_lazy_partial_tool_type() -> None:
+    """Tests that the lazy partial model is a cached partial of the tool type."""
+    lazy_type = lazy_partial_tool_type(FormatBook)
+    assert lazy_type is lazy_partial_tool_type(FormatBook)
+    assert issubclass(lazy_type, FormatBook)
+    assert lazy_type.__name__ == "PartialFormatBook"
+    assert lazy_type().model_dump() == {
+        "delta": None,
+        "tool_call": None,
+        "title": None,
+        "author": None,
+    }
+
+
+def test_defer_tool_call() -> None:
+    """Tests that a deferred `tool_call` is only constructed once it's read."""
+    tool = lazy_partial_tool_type(FormatBook).model_validate({"title": "The Name"})
+    factory = MagicMock(return_value="tool call")
+    defer_tool_call(tool, factory)
+    assert "tool_call" not in tool.__dict__
+    assert tool.title == "The Name"
+    factory.assert_not_called()
+    assert tool.tool_call == "tool call"
+    assert tool.tool_call == "tool call"
+    factory.assert_called_once()
+
+    defer_tool_call(tool, lambda: "serialized tool call")
+    assert tool.model_dump()["tool_call"] == "serialized tool call"
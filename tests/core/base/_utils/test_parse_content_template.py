@@ -1,12 +1,23 @@
 """Tests the `_utils.parse_content_template` function."""
 
+import asyncio
+import urllib.error
+from email.message import Message
 from io import BytesIO
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 from PIL import Image
 
-from mirascope.core.base._utils._parse_content_template import parse_content_template
+from mirascope.core.base._utils._parse_content_template import (
+    _load_media,
+    _parse_parts,
+    load_media_async,
+    parse_content_template,
+    preloaded_media,
+)
 from mirascope.core.base.message_param import (
     AudioPart,
     AudioURLPart,
@@ -307,6 +318,7 @@ def test_parse_content_template_document(
     document_data = b"%PDFdocument data"  # Magic bytes for PDF files
     mock_response = MagicMock()
     mock_response.read = lambda: document_data
+    mock_response.headers = {}
     mock_urlopen.return_value.__enter__.return_value = mock_response
     mock_open.return_value.__enter__.return_value = mock_response
 
@@ -448,3 +460,175 @@ def test_parse_content_template_part(
         match="When using 'part' template, 'content' must be a valid content part.",
     ):
         parse_content_template("user", template, {"content": "not a part"})
+
+
+def test_parse_content_template_caches_parts() -> None:
+    """Tests that the parts of a content template are parsed once and reused."""
+    _parse_parts.cache_clear()
+    template = "Recommend a {genre} book. {:cache_control(type=ephemeral)}"
+    for genre in ["fantasy", "horror"]:
+        assert parse_content_template("user", template, {"genre": genre}) == (
+            BaseMessageParam(
+                role="user",
+                content=[
+                    TextPart(type="text", text=f"Recommend a {genre} book."),
+                    CacheControlPart(type="cache_control", cache_type="ephemeral"),
+                ],
+            )
+        )
+    cache_info = _parse_parts.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 1
+
+
+def test_parse_content_template_path(tmp_path: Path) -> None:
+    """Tests that `Path` sources are memory-mapped rather than read into memory."""
+    document_data = b"%PDFdocument data"
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(document_data)
+    message_param = parse_content_template("user", "{doc:document}", {"doc": path})
+    assert message_param is not None
+    part = message_param.content[0]
+    assert isinstance(part, DocumentPart)
+    assert isinstance(part.document, memoryview)
+    assert part.media_type == "application/pdf"
+    assert part == DocumentPart(
+        type="document", media_type="application/pdf", document=document_data
+    )
+    assert part.model_dump()["document"] == document_data
+
+    empty_path = tmp_path / "empty"
+    empty_path.write_bytes(b"")
+    assert _load_media(empty_path) == b""
+
+
+def _headers(**headers: str) -> Message:
+    message = Message()
+    for name, value in headers.items():
+        message[name.replace("_", "-")] = value
+    return message
+
+
+@patch("urllib.request.urlopen", new_callable=MagicMock)
+def test_load_media_http_cache(mock_urlopen: MagicMock) -> None:
+    """Tests that downloaded media is reused while fresh and revalidated once stale."""
+    url = "https://example.com/doc.pdf"
+    mock_response = MagicMock()
+    mock_response.read = lambda: b"%PDF"
+    mock_response.headers = _headers(ETag='"v1"', Cache_Control="max-age=60")
+    mock_urlopen.return_value.__enter__.return_value = mock_response
+    assert _load_media(url) == b"%PDF"
+    assert _load_media(url) == b"%PDF"
+    assert mock_urlopen.call_count == 1
+
+    mock_response.headers = _headers(ETag='"v1"', Cache_Control="no-cache")
+    mock_urlopen.reset_mock()
+    assert _load_media("https://example.com/stale.pdf") == b"%PDF"
+    mock_urlopen.side_effect = urllib.error.HTTPError(
+        "https://example.com/stale.pdf", 304, "Not Modified", _headers(), None
+    )
+    assert _load_media("https://example.com/stale.pdf") == b"%PDF"
+    request = mock_urlopen.call_args_list[-1].args[0]
+    assert request.get_header("If-none-match") == '"v1"'
+
+    mock_urlopen.side_effect = urllib.error.HTTPError(
+        "https://example.com/new.pdf", 404, "Not Found", _headers(), None
+    )
+    with pytest.raises(ValueError):
+        _load_media("https://example.com/new.pdf")
+
+
+@patch("urllib.request.urlopen", new_callable=MagicMock)
+def test_load_media_http_not_cached(mock_urlopen: MagicMock) -> None:
+    """Tests that media without validators or marked `no-store` isn't cached."""
+    mock_response = MagicMock()
+    mock_response.read = lambda: b"%PDF"
+    mock_urlopen.return_value.__enter__.return_value = mock_response
+    for headers in (_headers(), _headers(ETag='"v1"', Cache_Control="no-store")):
+        mock_response.headers = headers
+        _load_media("https://example.com/doc.pdf")
+        _load_media("https://example.com/doc.pdf")
+    assert mock_urlopen.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_load_media_async(tmp_path: Path) -> None:
+    """Tests that media is loaded concurrently and then used when parsing."""
+    requests: list[httpx.Request] = []
+    in_flight, max_in_flight = 0, 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        requests.append(request)
+        if request.headers.get("If-Modified-Since") == "yesterday":
+            return httpx.Response(304)
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(
+            200,
+            content=b"%PDF" + request.url.path.encode(),
+            headers={"Last-Modified": "yesterday"},
+        )
+
+    def create_client() -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    path = tmp_path / "image.jpg"
+    path.write_bytes(b"\xff\xd8\xff")
+    attrs = {
+        "docs": ["https://example.com/a", "https://example.com/b"],
+        "image": str(path),
+        "url": "https://example.com/image.jpg",
+        "audio": None,
+    }
+    template = "{docs:documents} {image:image} {url:image} {audio:audio}"
+    with patch(
+        "mirascope.core.base._utils._parse_content_template._create_async_media_client",
+        create_client,
+    ):
+        media = await load_media_async(template, attrs)
+        assert media == {
+            "https://example.com/a": b"%PDF/a",
+            "https://example.com/b": b"%PDF/b",
+            str(path): b"\xff\xd8\xff",
+        }
+        assert max_in_flight == 2
+        assert await load_media_async(template, attrs) == media
+        assert [request.url.path for request in requests] == ["/a", "/b"] * 2
+
+    with (
+        preloaded_media(media),
+        patch("urllib.request.urlopen") as mock_urlopen,
+        patch("mirascope.core.base._utils._parse_content_template.open") as mock_open,
+    ):
+        message_param = parse_content_template("user", template, attrs)
+    mock_urlopen.assert_not_called()
+    mock_open.assert_not_called()
+    assert message_param is not None
+    assert [part.type for part in message_param.content] == [
+        "document",
+        "document",
+        "image",
+        "image_url",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_load_media_async_error() -> None:
+    """Tests that failing to download media raises a `ValueError`."""
+
+    def create_client() -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(404))
+        )
+
+    with (
+        patch(
+            "mirascope.core.base._utils._parse_content_template._create_async_media_client",
+            create_client,
+        ),
+        pytest.raises(ValueError),
+    ):
+        await load_media_async("{doc:document}", {"doc": "https://example.com/a"})
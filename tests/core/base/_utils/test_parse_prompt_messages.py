@@ -4,8 +4,11 @@ from unittest.mock import MagicMock, call, patch
 
 import pytest
 
-from mirascope.core.base import TextPart
-from mirascope.core.base._utils._parse_prompt_messages import parse_prompt_messages
+from mirascope.core.base import BaseMessageParam, TextPart
+from mirascope.core.base._utils._parse_prompt_messages import (
+    _split_role_templates,
+    parse_prompt_messages,
+)
 
 
 @patch(
@@ -113,3 +116,22 @@ def test_parse_prompt_messages_preserves_internal_newlines() -> None:
     assert user_message.content == expected_text, (
         f"Expected:\n{repr(expected_text)}\nGot:\n{repr(user_message.content)}"
     )
+
+
+def test_parse_prompt_messages_caches_role_split() -> None:
+    """Tests that the role split of a template is computed once and reused."""
+    _split_role_templates.cache_clear()
+    template = "SYSTEM: You are a {persona}.\nUSER: Recommend a {genre} book."
+    for persona, genre in [("librarian", "fantasy"), ("critic", "horror")]:
+        messages = parse_prompt_messages(
+            roles=["system", "user"],
+            template=template,
+            attrs={"persona": persona, "genre": genre},
+        )
+        assert messages == [
+            BaseMessageParam(role="system", content=f"You are a {persona}."),
+            BaseMessageParam(role="user", content=f"Recommend a {genre} book."),
+        ]
+    cache_info = _split_role_templates.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 1
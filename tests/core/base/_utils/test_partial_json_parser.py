@@ -0,0 +1,97 @@
+"""Tests the `_utils.partial_json_parser` module."""
+
+import json
+
+import jiter
+import pytest
+
+from mirascope.core.base._utils._partial_json_parser import PartialJsonParser
+
+OBJ = {
+    "title": 'The "Name" of\nthe Wind 😀',
+    "pages": [662, 12.5e3, -3],
+    "meta": {"read": True, "lent": False, "notes": None, "tags": [], "extra": {}},
+    "quotes": ["a\\b", "é"],
+}
+
+
+@pytest.mark.parametrize("ensure_ascii", [True, False])
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 1000])
+def test_partial_json_parser(ensure_ascii: bool, chunk_size: int) -> None:
+    """Tests that the partial object tracks `jiter`'s partial parsing."""
+    text = "Here you go: " + json.dumps(OBJ, indent=2, ensure_ascii=ensure_ascii)
+    text += "\nEnjoy!"
+    parser = PartialJsonParser()
+    buffer = ""
+    for i in range(0, len(text), chunk_size):
+        chunk = text[i : i + chunk_size]
+        buffer += chunk
+        parser.feed(chunk)
+        json_start = buffer.find("{")
+        if json_start < 0 or parser.done:
+            continue
+        expected = jiter.from_json(
+            buffer[json_start:].encode(), partial_mode="trailing-strings"
+        )
+        assert parser.value == expected
+    assert parser.done
+    assert parser.value == OBJ
+
+
+def test_partial_json_parser_changed() -> None:
+    """Tests that `feed` only reports changes to the partial object."""
+    parser = PartialJsonParser()
+    assert not parser.feed("Sure! ")
+    assert parser.feed('{"ti')
+    assert not parser.feed('tle": ')
+    assert parser.feed('"a')
+    assert not parser.feed("\\")
+    assert parser.feed('n"')
+    assert parser.value == {"title": "a\n"}
+    assert parser.feed(', "pages": 1')
+    assert parser.value == {"title": "a\n", "pages": 1}
+    assert parser.feed(".")
+    assert parser.value == {"title": "a\n"}
+    assert parser.feed("5}")
+    assert parser.value == {"title": "a\n", "pages": 1.5}
+    assert parser.changed_keys == {"pages"}
+    assert not parser.feed(" trailing {")
+
+
+def test_partial_json_parser_changed_keys() -> None:
+    """Tests that `feed` records the top-level keys whose values changed."""
+    parser = PartialJsonParser()
+    parser.feed('{"a": {"b": [1')
+    assert parser.changed_keys == {"a"}
+    parser.feed('], "c": 2}, "d": "x", "e')
+    assert parser.changed_keys == {"a", "d"}
+    parser.feed('": ')
+    assert parser.changed_keys == set()
+    parser.feed("tr")
+    assert parser.changed_keys == set()
+    parser.feed("ue}")
+    assert parser.changed_keys == {"e"}
+
+
+def test_partial_json_parser_snapshot() -> None:
+    """Tests that snapshots don't change as later chunks are parsed."""
+    parser = PartialJsonParser()
+    assert parser.snapshot() is None
+    parser.feed('{"done": {"a": [1]}, "open": {"b": [1, ')
+    snapshot = parser.snapshot()
+    assert snapshot == {"done": {"a": [1]}, "open": {"b": [1]}}
+    parser.feed('2], "c": "x')
+    assert snapshot == {"done": {"a": [1]}, "open": {"b": [1]}}
+    assert parser.snapshot() == {"done": {"a": [1]}, "open": {"b": [1, 2], "c": "x"}}
+    # Closed containers are shared rather than copied
+    assert snapshot["done"] is parser.value["done"]  # pyright: ignore [reportOptionalSubscript]
+    parser.feed('"}}')
+    assert parser.done
+    assert (final := parser.snapshot()) == parser.value and final is not parser.value
+
+
+@pytest.mark.parametrize("text", ['{"a" 1}', '{"a": [1}', '{"a": tru}', "{1: 2}"])
+def test_partial_json_parser_invalid(text: str) -> None:
+    """Tests that invalid JSON raises a `ValueError`."""
+    with pytest.raises(ValueError):
+        PartialJsonParser().feed(text)
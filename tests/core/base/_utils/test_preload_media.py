@@ -0,0 +1,52 @@
+"""Tests the `_utils.preload_media` module."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mirascope.core.base import prompt_template
+from mirascope.core.base._utils import parse_prompt_messages, preload_media
+from mirascope.core.base._utils._parse_content_template import _preloaded_media
+
+
+@pytest.mark.asyncio
+async def test_preload_media(tmp_path: Path) -> None:
+    """Tests that the media of the prompt template is preloaded within the context."""
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(b"%PDF")
+
+    @prompt_template("SYSTEM: {doc:document} USER: {other:document}")
+    def fn(doc: str) -> None: ...
+
+    fn_args = {"doc": str(path)}
+    dynamic_config = {"computed_fields": {"other": path}}
+    async with preload_media(fn, fn_args, dynamic_config):  # pyright: ignore [reportArgumentType]
+        assert _preloaded_media.get() == {str(path): b"%PDF", path: b"%PDF"}
+        with patch(
+            "mirascope.core.base._utils._parse_content_template.open"
+        ) as mock_open:
+            messages = parse_prompt_messages(
+                ["system", "user"], fn._prompt_template, dict(fn_args), dynamic_config
+            )
+        mock_open.assert_not_called()
+        assert [message.role for message in messages] == ["system", "user"]
+    assert fn_args == {"doc": str(path)}
+    assert _preloaded_media.get() == {}
+
+
+@pytest.mark.asyncio
+async def test_preload_media_skipped() -> None:
+    """Tests that nothing is preloaded without a prompt template to parse."""
+
+    @prompt_template("{doc:document}")
+    def fn(doc: str) -> None: ...
+
+    def no_template() -> None: ...
+
+    async with preload_media(fn, {"doc": "missing.pdf"}, {"messages": ["hi"]}):  # pyright: ignore [reportArgumentType]
+        assert _preloaded_media.get() == {}
+    async with preload_media(no_template, {}, None):
+        assert _preloaded_media.get() == {}
+    async with preload_media(fn, {"doc": None}, None):
+        assert _preloaded_media.get() == {}
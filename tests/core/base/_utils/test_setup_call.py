@@ -1,8 +1,9 @@
 """Tests the `_utils.setup_call` function."""
 
-from typing import cast
+from typing import ClassVar, cast
 
 import pytest
+from pydantic import BaseModel
 
 from mirascope.core.base import BaseCallParams, CommonCallParams
 from mirascope.core.base._utils._setup_call import setup_call
@@ -307,3 +308,56 @@ def test_setup_call_with_empty_common_params() -> None:
     ]
     assert tool_types is None
     assert call_kwargs == {}
+
+
+def test_setup_call_caches_tool_types_and_schemas() -> None:
+    """Tests that converted tool types and their schemas are reused across calls."""
+
+    class Tool(BaseTool):
+        schema_calls: ClassVar[int] = 0
+
+        @classmethod
+        def tool_schema(cls):
+            Tool.schema_calls += 1
+            return {"type": "function", "name": cls._name()}
+
+    class FormatBook(BaseModel):
+        """Format book tool."""
+
+        title: str
+
+    def format_book(title: str) -> None:
+        """Format book tool."""
+
+    class Method:
+        def format_book(self, title: str) -> None:
+            """Format book tool."""
+
+    @prompt_template("Recommend a book.")
+    def fn() -> None: ...  # pragma: no cover
+
+    def _setup_call(tools: list) -> list[type[BaseTool]]:
+        _, _, tool_types, call_kwargs = setup_call(
+            fn,
+            {},
+            None,
+            tools,
+            Tool,
+            {},
+            lambda common_params: BaseCallParams(),  # pyright: ignore [reportArgumentType]
+        )
+        assert tool_types is not None
+        assert call_kwargs["tools"] == [  # pyright: ignore [reportGeneralTypeIssues]
+            {"type": "function", "name": "FormatBook"},
+            {"type": "function", "name": "format_book"},
+        ]
+        return tool_types
+
+    first = _setup_call([FormatBook, format_book])
+    second = _setup_call([FormatBook, format_book])
+    assert first == second
+    assert Tool.schema_calls == 2
+
+    # Bound methods are not cached since they are tied to their instance.
+    _setup_call([FormatBook, Method().format_book])
+    assert Tool.schema_calls == 3
@@ -0,0 +1,192 @@
+"""Tests for the `client_pool` module."""
+
+import asyncio
+from collections.abc import Generator
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from mirascope.core.base.client_pool import (
+    _reset_after_fork,
+    aclose_client_pool,
+    configure_client_pool,
+    create_async_http_client,
+    create_http_client,
+    get_default_client,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_pool_config() -> Generator[None, None, None]:
+    """Restores the default pool configuration after each test."""
+    yield
+    configure_client_pool(None)
+
+
+def test_get_default_client_reuses_client() -> None:
+    """Tests that the same key returns the same pooled client."""
+    create_client = MagicMock(side_effect=lambda: object())
+    client = get_default_client("openai", False, create_client, api_key="key")
+    assert get_default_client("openai", False, create_client, api_key="key") is client
+    create_client.assert_called_once_with()
+
+
+def test_get_default_client_creates_outside_lock() -> None:
+    """Tests that clients are created outside the lock and racing clients are closed."""
+    pooled_client, racing_client = MagicMock(), MagicMock()
+
+    def create_racing_client() -> MagicMock:
+        # Pool a client for the same key while this one is being created, which
+        # would deadlock if clients were created while holding the lock
+        get_default_client("openai", False, lambda: pooled_client)
+        return racing_client
+
+    assert get_default_client("openai", False, create_racing_client) is pooled_client
+    racing_client.close.assert_called_once_with()
+    pooled_client.close.assert_not_called()
+
+
+def test_get_default_client_keys() -> None:
+    """Tests that each key component gets its own client."""
+    create_client = MagicMock(side_effect=lambda: object())
+    clients = {
+        id(get_default_client("openai", False, create_client)),
+        id(get_default_client("anthropic", False, create_client)),
+        id(get_default_client("openai", False, create_client, api_key="other")),
+        id(get_default_client("openai", False, create_client, base_url="url")),
+    }
+    assert len(clients) == 4
+
+
+def test_get_default_client_keys_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that provider settings read from the environment are part of the key."""
+    create_client = MagicMock(side_effect=lambda: object())
+    client = get_default_client("openai", False, create_client)
+    monkeypatch.setenv("OPENAI_ORG_ID", "org")
+    org_client = get_default_client("openai", False, create_client)
+    assert org_client is not client
+    assert get_default_client("openai", False, create_client) is org_client
+
+    google_client = get_default_client("google", False, create_client)
+    monkeypatch.setenv("GOOGLE_GENAI_USE_VERTEXAI", "true")
+    assert get_default_client("google", False, create_client) is not google_client
+
+
+def test_get_default_client_async_scoped_to_loop() -> None:
+    """Tests that async clients are pooled per running event loop."""
+    create_client = MagicMock(side_effect=lambda: object())
+
+    async def get_clients() -> tuple[object, object]:
+        return (
+            get_default_client("openai", True, create_client),
+            get_default_client("openai", True, create_client),
+        )
+
+    first, second = asyncio.run(get_clients())
+    assert first is second
+    third, _ = asyncio.run(get_clients())
+    assert third is not first
+    assert create_client.call_count == 2
+
+    # Without a running loop async clients are not pooled
+    assert get_default_client("openai", True, create_client) is not first
+    assert create_client.call_count == 3
+
+
+def test_reset_after_fork() -> None:
+    """Tests that pooled clients are dropped in a forked child process."""
+    create_client = MagicMock(side_effect=lambda: object())
+    client = get_default_client("openai", False, create_client)
+    _reset_after_fork()
+    assert get_default_client("openai", False, create_client) is not client
+
+
+def test_create_http_client() -> None:
+    """Tests that `httpx` clients are only created with a pool configuration."""
+    assert create_http_client() is None
+    assert create_async_http_client() is None
+
+    create_client = MagicMock(side_effect=lambda: object())
+    client = get_default_client("openai", False, create_client)
+    configure_client_pool({"max_connections": 10, "keepalive_expiry": 30.0})
+    assert get_default_client("openai", False, create_client) is not client
+
+    http_client = create_http_client()
+    assert isinstance(http_client, httpx.Client)
+    pool = http_client._transport._pool  # pyright: ignore [reportAttributeAccessIssue]
+    assert pool._max_connections == 10
+    assert pool._keepalive_expiry == 30.0
+    assert isinstance(create_async_http_client(), httpx.AsyncClient)
+
+
+def test_aclose_client_pool() -> None:
+    """Tests that pooled clients are closed and dropped."""
+    sync_client, async_client, other_client = MagicMock(), MagicMock(), MagicMock()
+    del sync_client.aclose
+    async_client.aclose = AsyncMock()
+
+    async def pool_other_client() -> None:
+        get_default_client("openai", True, lambda: other_client)
+
+    async def close_clients() -> None:
+        get_default_client("openai", False, lambda: sync_client)
+        get_default_client("openai", True, lambda: async_client)
+        get_default_client("anthropic", True, lambda: object())
+        await aclose_client_pool()
+
+    other_loop = asyncio.new_event_loop()
+    other_loop.run_until_complete(pool_other_client())
+    asyncio.run(close_clients())
+    sync_client.close.assert_called_once_with()
+    async_client.aclose.assert_awaited_once_with()
+    other_client.aclose.assert_not_called()
+    other_loop.close()
+    assert get_default_client("openai", False, MagicMock) is not sync_client
+
+
+def test_async_clients_closed_on_loop_shutdown() -> None:
+    """Tests that pooled async clients are closed when their event loop shuts down."""
+    client = MagicMock()
+    client.aclose = AsyncMock()
+
+    async def pool_client() -> None:
+        get_default_client("bedrock", True, lambda: client)
+        get_default_client("bedrock", True, lambda: client)
+
+    asyncio.run(pool_client())
+    client.aclose.assert_awaited_once_with()
+
+    # Clients dropped from the pool aren't closed when the loop shuts down
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(pool_client())
+    configure_client_pool(None)
+    loop.run_until_complete(loop.shutdown_asyncgens())
+    loop.close()
+    client.aclose.assert_awaited_once_with()
+
+
+def test_async_clients_pooled_without_overridable_close() -> None:
+    """Tests that async clients are pooled on loops whose `close` can't be replaced."""
+
+    class FrozenLoop(asyncio.SelectorEventLoop):
+        def __setattr__(self, name: str, value: object) -> None:
+            if name == "close":
+                raise AttributeError(name)
+            super().__setattr__(name, value)
+
+    create_client = MagicMock(side_effect=lambda: MagicMock(aclose=AsyncMock()))
+
+    async def get_clients() -> tuple[object, object]:
+        return (
+            get_default_client("openai", True, create_client),
+            get_default_client("openai", True, create_client),
+        )
+
+    loop = FrozenLoop()
+    first, second = loop.run_until_complete(get_clients())
+    loop.run_until_complete(loop.shutdown_asyncgens())
+    loop.close()
+    assert first is second
+    create_client.assert_called_once_with()
+    first.aclose.assert_awaited_once_with()  # pyright: ignore [reportAttributeAccessIssue]
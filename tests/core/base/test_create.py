@@ -85,6 +85,7 @@ def test_create_factory_sync(
     )
     assert output.start_time is not None
     assert output.end_time is not None
+    assert output.timings is not None and output.timings.duration is not None
     assert output._model == "model"
 
     mock_setup_call.assert_called_once_with(
@@ -230,6 +231,7 @@ async def test_create_factory_async(
     )
     assert output.start_time is not None
     assert output.end_time is not None
+    assert output.timings is not None and output.timings.duration is not None
     assert output._model == "model"
 
     mock_setup_call_async.assert_called_once_with(
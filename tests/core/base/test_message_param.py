@@ -0,0 +1,27 @@
+"""Tests for the `message_param` module."""
+
+import mmap
+from pathlib import Path
+
+from mirascope.core.base.message_param import AudioPart, ImagePart
+
+
+def test_media_data_memoryview(tmp_path: Path) -> None:
+    """Tests that media parts can be backed by memory-mapped files without copying."""
+    path = tmp_path / "image.png"
+    path.write_bytes(b"\x89PNG\r\n\x1a\nimage")
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    part = ImagePart(type="image", media_type="image/png", image=mapped, detail=None)  # pyright: ignore [reportArgumentType]
+    assert isinstance(part.image, memoryview)
+    assert part.image.obj is mapped
+    assert part.model_dump()["image"] == b"\x89PNG\r\n\x1a\nimage"
+
+    view = memoryview(b"audio")
+    audio_part = AudioPart(type="audio", media_type="audio/wav", audio=view)
+    assert audio_part.audio is view
+    assert audio_part.model_dump_json() == (
+        '{"type":"audio","media_type":"audio/wav","audio":"audio"}'
+    )
+    assert AudioPart(type="audio", media_type="audio/wav", audio="data").audio == "data"
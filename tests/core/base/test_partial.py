@@ -92,3 +92,34 @@ def test_list_partial() -> None:
         partial(ModelWithList).model_json_schema()
         == PartialModelWithList.model_json_schema()
     )
+
+
+def test_partial_is_cached() -> None:
+    """Tests that partial models are cached per model and preserved fields."""
+    partial_model = partial(ShallowModel)
+    assert partial(ShallowModel) is partial_model
+    assert partial(ShallowModel, set()) is partial_model
+    preserved = partial(ShallowModel, {"param"})
+    assert preserved is not partial_model
+    assert partial(ShallowModel, {"param"}) is preserved
+
+    class SubModel(ShallowModel): ...
+
+    assert partial(SubModel) is not partial_model
+    assert partial(SubModel).__name__ == "PartialSubModel"
+
+
+def test_partial_forward_reference_not_cached() -> None:
+    """Tests that incomplete models are not cached until they are rebuilt."""
+
+    class ForwardModel(BaseModel):
+        later: "LaterModel"
+
+    assert partial(ForwardModel) is not partial(ForwardModel)
+
+    class LaterModel(BaseModel):
+        param: str
+
+    ForwardModel.model_rebuild()
+    assert partial(ForwardModel) is partial(ForwardModel)
+    assert partial(ForwardModel).model_validate({"later": {}}).later.param is None  # pyright: ignore [reportOptionalMemberAccess]
@@ -80,6 +80,7 @@ def test_stream_factory_sync(
     assert stream.messages == mock_messages
     assert stream.call_params == mock_stream_decorator_kwargs["call_params"]
     assert stream.call_kwargs == mock_call_kwargs
+    assert stream.lightweight is False
 
     mock_setup_call.assert_called_once_with(
         model=mock_stream_decorator_kwargs["model"],
@@ -159,6 +160,7 @@ async def test_stream_factory_async(
     assert stream.messages == mock_messages
     assert stream.call_params == mock_stream_decorator_kwargs["call_params"]
     assert stream.call_kwargs == mock_call_kwargs
+    assert stream.lightweight is False
 
     mock_setup_call_async.assert_called_once_with(
         model=mock_stream_decorator_kwargs["model"],
@@ -231,8 +233,81 @@ async def test_base_stream(mock_get_possible_user_message_param: MagicMock) -> N
         tools_and_outputs.append((tool, tool.call()))  # type: ignore
     assert stream_response == [(mock_chunk, mock_tool)]
     mock_construct_message_param.assert_called_with(["tool_call"], "content")
+    assert stream.timings is not None and stream.timings.end is not None
+    assert stream.end_time >= stream.start_time > 0
     assert stream.message_param == "mock_message_param"
     assert stream.model == "updated_model"
 
     assert stream.tool_message_params(tools_and_outputs)
     mock_tool_message_params.assert_called_once_with(tools_and_outputs)
+
+
+def _mock_chunk(content: str, **kwargs) -> MagicMock:
+    chunk = MagicMock()
+    chunk.content = content
+    chunk.usage = None
+    chunk.input_tokens = chunk.cached_tokens = chunk.output_tokens = None
+    chunk.finish_reasons = None
+    for key, value in kwargs.items():
+        setattr(chunk, key, value)
+    return chunk
+
+
+@patch.multiple(BaseStream, __abstractmethods__=set())
+@pytest.mark.parametrize("lightweight", [False, True])
+def test_base_stream_update_properties(lightweight: bool) -> None:
+    """Tests that the stream accumulates the properties of its chunks."""
+    chunks = [
+        _mock_chunk("Hello", model="model-1", id="id"),
+        _mock_chunk(", ", model="model-2", id="id"),
+        _mock_chunk(
+            "world",
+            model="model-2",
+            id="id",
+            usage=MagicMock(),
+            input_tokens=1,
+            cached_tokens=0,
+            output_tokens=2,
+            finish_reasons=["stop"],
+        ),
+    ]
+    tool = MagicMock(tool_call="tool_call", delta=None)
+    stream = BaseStream(
+        stream=((chunk, tool if chunk is chunks[-1] else None) for chunk in chunks),
+        metadata={},
+        tool_types=None,
+        call_response_type=MagicMock,
+        model="model",
+        prompt_template=None,
+        fn_args={},
+        dynamic_config=None,
+        messages=[],
+        call_params={},
+        call_kwargs={},
+    )  # type: ignore
+    stream.lightweight = lightweight
+    stream._construct_message_param = MagicMock()
+    iterator = iter(stream)
+    next(iterator)
+    assert stream.content == "Hello"
+    assert stream.timings is not None
+    assert stream.timings.time_to_first_token is not None
+    assert list(iterator) == [(chunks[1], None), (chunks[2], tool)]
+    assert stream.content == "Hello, world"
+    assert stream._content_chunks == ["Hello, world"]
+    # Lightweight streams stop reading the model once they have an id
+    assert stream.model == ("model-1" if lightweight else "model-2")
+    assert stream.id == "id"
+    assert (stream.input_tokens, stream.cached_tokens, stream.output_tokens) == (
+        1,
+        0,
+        2,
+    )
+    assert stream.finish_reasons == ["stop"]
+    stream._construct_message_param.assert_called_once_with(
+        ["tool_call"], "Hello, world"
+    )
+    assert stream.timings.chunk_count == 3
+    assert len(stream.timings.tool_calls_completed) == 1
+    assert stream.timings.duration is not None
+    assert stream.output_tokens_per_second is not None
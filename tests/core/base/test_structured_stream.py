@@ -1,9 +1,11 @@
 """Tests for the internal `_structured_stream` module."""
 
 from functools import partial
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
+from pydantic import BaseModel
 
 from mirascope.core.base.structured_stream import (
     BaseStructuredStream,
@@ -194,17 +196,96 @@ async def test_base_structured_stream(mock_extract_tool_return: MagicMock) -> No
     structured_stream = BaseStructuredStream(
         stream=base_stream, response_model=MagicMock, fields_from_call_args={}
     )
-    for i, output in enumerate(structured_stream):
-        assert output == "tool"
-        mock_extract_tool_return.assert_called_once_with(
-            MagicMock, '{"title": "title"}', i == 0, {}
-        )
-        mock_extract_tool_return.reset_mock()
-    i = 0
-    async for output in structured_stream:
-        assert output == "tool"
-        mock_extract_tool_return.assert_called_with(
-            MagicMock, '{"title": "title"}', i == 0, {}
-        )
-        mock_extract_tool_return.reset_mock()
-        i += 1
+    outputs = list(structured_stream)
+    assert outputs == ["tool", "tool"]
+    assert mock_extract_tool_return.call_args_list == [
+        call(MagicMock, {"title": "title"}, True, {}),
+        call(MagicMock, '{"title": "title"}', False, {}),
+    ]
+    mock_extract_tool_return.reset_mock()
+    outputs = [output async for output in structured_stream]
+    assert outputs == ["tool", "tool"]
+    assert mock_extract_tool_return.call_args_list == [
+        call(MagicMock, {"title": "title"}, True, {}),
+        call(MagicMock, '{"title": "title"}', False, {}),
+    ]
+
+
+class Book(BaseModel):
+    title: str
+    author: str
+
+
+def _mock_stream(contents: list[str]) -> MagicMock:
+    chunks = []
+    for content in contents:
+        chunk = MagicMock()
+        chunk.content = content
+        chunk.model = None
+        chunks.append((chunk, None))
+    stream = MagicMock()
+    stream.__iter__.side_effect = lambda: iter(chunks)
+    return stream
+
+
+def test_base_structured_stream_yields_on_change() -> None:
+    """Tests that partial outputs are only yielded when the parsed output changes."""
+    stream = _mock_stream(
+        ['{"tit', 'le": ', '"The', ' Name"', ", ", '"author": "P', '"}']
+    )
+    structured_stream = BaseStructuredStream(
+        stream=stream, response_model=Book, fields_from_call_args={}
+    )
+    outputs = [output.model_dump() for output in structured_stream][:-1]
+    assert outputs == [
+        {"title": None, "author": None},
+        {"title": "The", "author": None},
+        {"title": "The Name", "author": None},
+        {"title": "The Name", "author": "P"},
+    ]
+    assert structured_stream.constructed_response_model == Book(
+        title="The Name", author="P"
+    )
+
+
+def test_base_structured_stream_throttle() -> None:
+    """Tests throttling how often partial outputs are yielded."""
+    contents = ['{"title": "', "a", "b", "c", "d", '", "author": "e"}']
+    structured_stream = BaseStructuredStream(
+        stream=_mock_stream(contents), response_model=Book, fields_from_call_args={}
+    )
+    outputs = [output.title for output in structured_stream.throttle(every_n_chunks=3)]
+    assert outputs == ["ab", "abcd", "abcd"]
+
+    structured_stream.throttle(every_seconds=3600)
+    assert [output.title for output in structured_stream] == ["abcd"]
+
+
+def test_base_structured_stream_invalid_json_fallback() -> None:
+    """Tests that invalid JSON falls back to parsing the full output."""
+    stream = _mock_stream(['{"title": "a", ', "oops"])
+    structured_stream = BaseStructuredStream(
+        stream=stream, response_model=Book, fields_from_call_args={}
+    )
+    iterator = iter(structured_stream)
+    assert next(iterator).title == "a"
+    with pytest.raises(ValueError):
+        next(iterator)
+
+
+def test_base_structured_stream_partials_are_snapshots() -> None:
+    """Tests that yielded partial outputs don't change as later chunks arrive."""
+
+    class Library(BaseModel):
+        books: list[Any]
+
+    stream = _mock_stream(['{"books": [{"title": "a"', ', "author": "b"}]}'])
+    structured_stream = BaseStructuredStream(
+        stream=stream, response_model=Library, fields_from_call_args={}
+    )
+    outputs = list(structured_stream)
+    assert [output.model_dump() for output in outputs] == [
+        {"books": [{"title": "a"}]},
+        {"books": [{"title": "a", "author": "b"}]},
+        {"books": [{"title": "a", "author": "b"}]},
+    ]
@@ -0,0 +1,55 @@
+"""Tests the `types` module."""
+
+from unittest.mock import patch
+
+from mirascope.core.base.types import INTER_CHUNK_LATENCY_BUCKETS, Timings
+
+
+def test_timings() -> None:
+    """Tests that `Timings` derives its metrics from the recorded timestamps."""
+    now = iter([0, 100, 103, 150, 350, 360, 400])
+    with patch("mirascope.core.base.types._now", side_effect=lambda: next(now)):
+        timings = Timings()
+        timings.record_chunk(has_content=False)
+        timings.record_chunk(has_content=True)
+        timings.record_chunk(has_content=True)
+        timings.record_chunk(has_content=True)
+        timings.record_tool_call()
+        timings.record_end()
+
+    assert timings.request_sent == 0
+    assert (timings.first_byte, timings.first_token, timings.last_token) == (
+        100,
+        103,
+        350,
+    )
+    assert timings.tool_calls_completed == [360]
+    assert timings.chunk_count == 4
+    assert timings.time_to_first_byte == 100
+    assert timings.time_to_first_token == 103
+    assert timings.duration == 400
+    assert timings.mean_inter_chunk_latency == 250 / 3
+    assert timings.max_inter_chunk_latency == 200
+    assert sum(timings.inter_chunk_latency_counts) == 3
+    assert timings.inter_chunk_latency_counts[0] == 1
+    assert timings.inter_chunk_latency_counts[INTER_CHUNK_LATENCY_BUCKETS.index(50)]
+    assert timings.inter_chunk_latency_counts[INTER_CHUNK_LATENCY_BUCKETS.index(250)]
+    assert timings.tokens_per_second(494) == 2000
+    assert timings.metrics == {
+        "time_to_first_byte": 100,
+        "time_to_first_token": 103,
+        "duration": 400,
+        "mean_inter_chunk_latency": 250 / 3,
+        "max_inter_chunk_latency": 200,
+    }
+
+
+def test_timings_not_streamed() -> None:
+    """Tests the metrics of a call whose response wasn't streamed."""
+    timings = Timings(request_sent=0)
+    assert timings.metrics == {}
+    assert timings.tokens_per_second(10) is None
+    timings.end = 500
+    assert timings.metrics == {"duration": 500}
+    assert timings.tokens_per_second(10) == 20
+    assert timings.tokens_per_second(None) is None
@@ -5,6 +5,7 @@ import pytest
 from aiobotocore.session import AioSession
 from pydantic import BaseModel
 
+from mirascope.core.base.client_pool import configure_client_pool
 from mirascope.core.bedrock._utils._convert_common_call_params import (
     convert_common_call_params,
 )
@@ -12,6 +13,7 @@ from mirascope.core.bedrock._utils._setup_call import (
     _AsyncBedrockRuntimeWrappedClient,
     _extract_async_stream_fn,
     _extract_sync_stream_fn,
+    _get_config,
     setup_call,
 )
 from mirascope.core.bedrock.tool import BedrockTool
@@ -398,9 +400,7 @@ def test_setup_call_async_bedrock_runtime_wrapped_client(
         {},
     ]
 
-    wrapped_client = _AsyncBedrockRuntimeWrappedClient(
-        MagicMock(), "anthropic.claude-v2"
-    )
+    wrapped_client = _AsyncBedrockRuntimeWrappedClient(MagicMock())
 
     create, prompt_template, messages, tool_types, call_kwargs = setup_call(  # pyright: ignore [reportCallIssue]
         model="anthropic.claude-v2",
@@ -441,14 +441,23 @@ async def test_async_bedrock_runtime_wrapped_client_converse():
 
     mock_session.create_client.return_value = mock_context_manager
 
-    wrapped_client = _AsyncBedrockRuntimeWrappedClient(mock_session, "test-model")
+    wrapped_client = _AsyncBedrockRuntimeWrappedClient(mock_session)
     result = await wrapped_client.converse(param1="value1")  # pyright: ignore [reportCallIssue]
 
     assert result == {"some": "result"}
 
     mock_client.converse.assert_called_once_with(param1="value1")
 
-    mock_session.create_client.assert_called_once_with("bedrock-runtime")
+    mock_session.create_client.assert_called_once_with("bedrock-runtime", config=None)
+
+    # The client is reused until closed
+    await wrapped_client.converse(param1="value1")  # pyright: ignore [reportCallIssue]
+    mock_session.create_client.assert_called_once()
+    mock_context_manager.__aexit__.assert_not_called()
+    await wrapped_client.close()
+    mock_context_manager.__aexit__.assert_called_once()
+    await wrapped_client.converse(param1="value1")  # pyright: ignore [reportCallIssue]
+    assert mock_session.create_client.call_count == 2
 
 
 @pytest.mark.asyncio
@@ -476,10 +485,10 @@ async def test_async_bedrock_runtime_wrapped_client_converse_stream():
     mock_context_manager.__aexit__.return_value = None
     mock_session.create_client.return_value = mock_context_manager
 
-    wrapped_client = _AsyncBedrockRuntimeWrappedClient(mock_session, "test-model")
+    wrapped_client = _AsyncBedrockRuntimeWrappedClient(mock_session)
 
     chunks = []
-    async for chunk in wrapped_client.converse_stream(param2="value2"):  # pyright: ignore [reportCallIssue]
+    async for chunk in wrapped_client.converse_stream(modelId="test-model"):  # pyright: ignore [reportCallIssue]
         chunks.append(chunk)
 
     assert len(chunks) == 2
@@ -490,9 +499,9 @@ async def test_async_bedrock_runtime_wrapped_client_converse_stream():
         assert chunks[i]["content"] == expected_content
         assert chunks[i]["responseMetadata"] == {"request": "id"}
 
-    mock_client.converse_stream.assert_called_once_with(param2="value2")
+    mock_client.converse_stream.assert_called_once_with(modelId="test-model")
 
-    mock_session.create_client.assert_called_once_with("bedrock-runtime")
+    mock_session.create_client.assert_called_once_with("bedrock-runtime", config=None)
 
 
 @patch("mirascope.core.bedrock._utils._setup_call.Session")
@@ -570,3 +579,76 @@ def test_setup_call_env_vars(
             "profile_name": "test_profile",
         }
     )
+
+
+@patch("mirascope.core.bedrock._utils._setup_call.Session")
+@patch("mirascope.core.bedrock._utils._setup_call.get_session")
+@patch("mirascope.core.bedrock._utils._setup_call._utils", new_callable=MagicMock)
+@pytest.mark.asyncio
+async def test_setup_call_reuses_default_client(
+    mock_utils: MagicMock,
+    mock_get_session: MagicMock,
+    mock_session_class: MagicMock,
+    mock_base_setup_call: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Tests that default clients are pooled per credentials and region."""
+    mock_utils.setup_call = mock_base_setup_call
+    mock_base_setup_call.return_value[1] = [
+        {"role": "user", "content": [{"text": "user test"}]},
+    ]
+    for name in (
+        "AWS_ACCESS_KEY_ID",
+        "AWS_SECRET_ACCESS_KEY",
+        "AWS_SESSION_TOKEN",
+        "AWS_REGION_NAME",
+        "AWS_PROFILE",
+    ):
+        monkeypatch.delenv(name, raising=False)
+
+    def fn() -> None: ...
+
+    async def async_fn() -> None: ...
+
+    kwargs = {
+        "model": "anthropic.claude-v2",
+        "client": None,
+        "fn_args": {},
+        "dynamic_config": None,
+        "tools": None,
+        "json_mode": False,
+        "call_params": {},
+        "response_model": None,
+        "stream": False,
+    }
+    for _ in range(2):
+        setup_call(fn=fn, **kwargs)  # pyright: ignore [reportCallIssue,reportArgumentType]
+        setup_call(fn=async_fn, **kwargs)  # pyright: ignore [reportCallIssue,reportArgumentType]
+    mock_session_class.assert_called_once_with()
+    mock_session_class.return_value.client.assert_called_once_with(
+        "bedrock-runtime", config=None
+    )
+    mock_get_session.assert_called_once_with(env_vars={})
+
+    monkeypatch.setenv("AWS_REGION_NAME", "us-west-2")
+    setup_call(fn=fn, **kwargs)  # pyright: ignore [reportCallIssue,reportArgumentType]
+    setup_call(fn=async_fn, **kwargs)  # pyright: ignore [reportCallIssue,reportArgumentType]
+    assert mock_session_class.call_count == 2
+    assert mock_get_session.call_count == 2
+
+
+def test_get_config() -> None:
+    """Tests that the client pool configuration is applied to botocore clients."""
+    assert _get_config() is None
+    try:
+        configure_client_pool({"max_connections": 50, "timeout": 30.0})
+        config = _get_config()
+        assert config is not None
+        assert config.max_pool_connections == 50
+        assert config.read_timeout == 30.0
+        configure_client_pool({})
+        config = _get_config()
+        assert config is not None
+        assert config.max_pool_connections == 10
+    finally:
+        configure_client_pool(None)
@@ -1,10 +1,11 @@
 """Tests the `google._utils.convert_message_params` function."""
 
 import io
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from google.genai.types import ContentDict
+from google.genai.types import ContentDict, File
 
 from mirascope.core.base import (
     AudioPart,
@@ -19,7 +20,10 @@ from mirascope.core.base import (
     ToolCallPart,
     ToolResultPart,
 )
-from mirascope.core.google._utils._convert_message_params import convert_message_params
+from mirascope.core.google._utils._convert_message_params import (
+    _uploaded_files,
+    convert_message_params,
+)
 
 
 @patch("PIL.Image.open", new_callable=MagicMock)
@@ -832,6 +836,23 @@ async def test_convert_message_in_running_loop():
     result = convert_message_params([], MagicMock())
     assert result == []
 
+    mock_client = MagicMock()
+    mock_client.vertexai = False
+    mock_client.aio.files.upload = AsyncMock(
+        return_value=File(uri="file://uploaded/image", mime_type="image/jpeg")
+    )
+    large_image = bytes([0] * (11 * 1024 * 1024))
+    message = BaseMessageParam(
+        role="user",
+        content=[
+            ImagePart(
+                type="image", media_type="image/jpeg", image=large_image, detail=None
+            )
+        ],
+    )
+    result = convert_message_params([message], mock_client)
+    assert result[0]["parts"][0]["file_data"]["file_uri"] == "file://uploaded/image"  # pyright: ignore [reportOptionalSubscript, reportTypedDictNotRequiredAccess]
+
 
 def test_tool_call_parts() -> None:
     """Test handling of tool_call parts."""
@@ -919,7 +940,7 @@ def test_multiple_async_document_uploads() -> None:
             DocumentPart(
                 type="document",
                 media_type="application/pdf",
-                document=large_document_data,
+                document=bytes([1] * (25 * 1024 * 1024)),
             ),
         ],
     )
@@ -1139,3 +1160,60 @@ def test_document_url_unsupported_type_after_decode_fails(
 
     mock_load_media.assert_called_once_with("https://example.com/unknown_document")
     mock_get_document_type.assert_called_once_with(b"\xff\xfe\xfd")
+
+
+def test_uploaded_files_reused() -> None:
+    """Tests that identical large media is uploaded once and reused until it expires."""
+    large_document_data = bytes([0] * (11 * 1024 * 1024))
+    document = DocumentPart(
+        type="document", media_type="application/pdf", document=large_document_data
+    )
+    message = BaseMessageParam(role="user", content=[document, document])
+
+    mock_client = MagicMock()
+    mock_client.vertexai = False
+    mock_client.aio.files.upload = AsyncMock(
+        return_value=File(
+            uri="file://uploaded/document",
+            mime_type="application/pdf",
+            expiration_time=datetime.now(timezone.utc) + timedelta(hours=1),
+        )
+    )
+    file_part = {
+        "file_data": {
+            "file_uri": "file://uploaded/document",
+            "mime_type": "application/pdf",
+        }
+    }
+
+    expected = [{"role": "user", "parts": [file_part, file_part]}]
+    assert convert_message_params([message], mock_client) == expected
+    assert convert_message_params([message], mock_client) == expected
+    mock_client.aio.files.upload.assert_called_once()
+
+    # Other clients (e.g. for other accounts) can't access the uploaded file
+    other_client = MagicMock()
+    other_client.vertexai = False
+    other_client.aio.files.upload = mock_client.aio.files.upload
+    convert_message_params([message], other_client)
+    assert mock_client.aio.files.upload.call_count == 2
+
+    # Files are uploaded again once they (are about to) expire
+    mock_client.aio.files.upload.return_value = File(
+        uri="file://uploaded/document",
+        mime_type="application/pdf",
+        expiration_time=datetime.now(timezone.utc).replace(tzinfo=None)
+        + timedelta(minutes=5),
+    )
+    message = BaseMessageParam(role="user", content=[document])
+    _uploaded_files.clear()
+    convert_message_params([message], mock_client)
+    convert_message_params([message], mock_client)
+    assert mock_client.aio.files.upload.call_count == 4
+
+    # Files without an expiration time are assumed to expire after 48 hours
+    mock_client.aio.files.upload.return_value = File(uri="file://uploaded/document")
+    _uploaded_files.clear()
+    convert_message_params([message], mock_client)
+    convert_message_params([message], mock_client)
+    assert mock_client.aio.files.upload.call_count == 5
@@ -1,10 +1,12 @@
 """Tests the `openai._utils.convert_message_params` function."""
 
 import base64
+import io
 from unittest.mock import patch
 
 import pytest
 from openai.types.chat import ChatCompletionMessageParam
+from PIL import Image
 
 from mirascope.core.base import (
     AudioPart,
@@ -17,6 +19,8 @@ from mirascope.core.base import (
     ToolCallPart,
     ToolResultPart,
 )
+from mirascope.core.base._utils import get_image_dimensions
+from mirascope.core.base.types import ImageMetadata
 from mirascope.core.openai._utils._convert_message_params import convert_message_params
 
 
@@ -211,3 +215,25 @@ def test_audio_url_invalid(mock_get_audio_type, mock_load_media) -> None:
         convert_message_params([message])
     mock_load_media.assert_called_once_with("http://example.com/audio")
     mock_get_audio_type.assert_called_once_with(b"audio_data")
+
+
+def test_convert_message_params_records_image_dimensions() -> None:
+    """Tests that image dimensions are recorded for the converted data URL."""
+    buffer = io.BytesIO()
+    Image.new("RGB", (640, 480)).save(buffer, "PNG")
+    message_param = BaseMessageParam(
+        role="user",
+        content=[
+            ImagePart(
+                type="image",
+                media_type="image/png",
+                image=buffer.getvalue(),
+                detail=None,
+            )
+        ],
+    )
+    converted_message_params = convert_message_params([message_param])
+    url = converted_message_params[0]["content"][0]["image_url"]["url"]  # pyright: ignore [reportIndexIssue, reportTypedDictNotRequiredAccess, reportArgumentType, reportCallIssue]
+    with patch("base64.b64decode") as mock_b64decode:
+        assert get_image_dimensions(url) == ImageMetadata(width=640, height=480)
+        mock_b64decode.assert_not_called()
@@ -357,3 +357,121 @@ async def test_handle_stream_async_with_partial_tools(
         == {"title": "The Name of the Wind", "author": "Patrick Rothfuss"}
         and tool.delta is None
     )
+
+
+def _tool_call_chunk(*tool_calls: ChoiceDeltaToolCall) -> ChatCompletionChunk:
+    return ChatCompletionChunk(
+        id="id",
+        choices=[
+            Choice(
+                delta=ChoiceDelta(content=None, tool_calls=list(tool_calls)), index=0
+            )
+        ],
+        created=0,
+        model="gpt-4o",
+        object="chat.completion.chunk",
+    )
+
+
+def _tool_call_delta(
+    index: int, arguments: str | None, id: str | None = None
+) -> ChoiceDeltaToolCall:
+    return ChoiceDeltaToolCall(
+        index=index,
+        id=id,
+        function=ChoiceDeltaToolCallFunction(
+            arguments=arguments, name="FormatBook" if id else None
+        ),
+        type="function",
+    )
+
+
+def test_handle_stream_parallel_tool_calls() -> None:
+    """Tests that interleaved parallel tool calls are tracked by their index."""
+    chunks = [
+        _tool_call_chunk(
+            _tool_call_delta(0, None, "a"), _tool_call_delta(1, None, "b")
+        ),
+        _tool_call_chunk(
+            _tool_call_delta(0, '{"title": "A", '), _tool_call_delta(1, '{"title": ')
+        ),
+        _tool_call_chunk(
+            _tool_call_delta(1, '"B", "author": "Y"}'),
+            _tool_call_delta(0, '"author": "X"}'),
+        ),
+        ChatCompletionChunk(
+            id="id",
+            choices=[
+                Choice(
+                    delta=ChoiceDelta(content=None, tool_calls=None),
+                    finish_reason="tool_calls",
+                    index=0,
+                )
+            ],
+            created=0,
+            model="gpt-4o",
+            object="chat.completion.chunk",
+        ),
+    ]
+    result = list(handle_stream(iter(chunks), tool_types=[FormatBook]))
+    assert [
+        (tool.tool_call.id, tool.title, tool.author)
+        for _, tool in result
+        if isinstance(tool, FormatBook)
+    ] == [("a", "A", "X"), ("b", "B", "Y")]
+    # Only the last tool constructed from a chunk is paired with the chunk itself
+    assert [chunk.finish_reasons for chunk, _ in result] == [[], ["tool_calls"]]
+
+    partial_result = list(
+        handle_stream(iter(chunks), tool_types=[FormatBook], partial_tools=True)
+    )
+    # The `tool_call` of later partial tools is only constructed once it's read
+    assert "tool_call" not in partial_result[2][1].__dict__
+    assert [
+        (tool.tool_call.id, tool.model_dump(exclude={"tool_call", "delta"}))
+        for _, tool in partial_result[:4]
+        if tool is not None
+    ] == [
+        ("a", {"title": "A", "author": None}),
+        ("b", {"title": None, "author": None}),
+        ("b", {"title": "B", "author": "Y"}),
+        ("a", {"title": "A", "author": "X"}),
+    ]
+    # Partial tools carry the arguments accumulated so far
+    assert [
+        tool.tool_call.function.arguments
+        for _, tool in partial_result
+        if tool is not None and tool.delta is not None
+    ] == [
+        '{"title": "A", ',
+        '{"title": ',
+        '{"title": "B", "author": "Y"}',
+        '{"title": "A", "author": "X"}',
+    ]
+    assert len(partial_result) == 6
+
+
+def test_handle_stream_completed_tool_call() -> None:
+    """Tests that completed tool calls are constructed once the next one starts."""
+    chunks = [
+        _tool_call_chunk(_tool_call_delta(0, '{"title": "A", "author": "X"}', "a")),
+        _tool_call_chunk(_tool_call_delta(1, '{"title": "B", ', "b")),
+    ]
+    result = list(handle_stream(iter(chunks), tool_types=[FormatBook]))
+    assert len(result) == 1
+    assert isinstance(tool := result[0][1], FormatBook) and tool.title == "A"
+
+
+def test_handle_stream_partial_tools_invalid_json() -> None:
+    """Tests that partial tools fall back to `from_tool_call` for invalid JSON."""
+    chunks = [
+        _tool_call_chunk(_tool_call_delta(0, '{"title": "A"', "a")),
+        _tool_call_chunk(_tool_call_delta(0, ' "author"')),
+    ]
+    result = list(
+        handle_stream(iter(chunks), tool_types=[FormatBook], partial_tools=True)
+    )
+    assert [
+        tool.model_dump(exclude={"tool_call", "delta"}) for _, tool in result if tool
+    ] == [{"title": "A", "author": None}] * 2
+    assert result[1][1] is not None and result[1][1].delta == ' "author"'
@@ -10,6 +10,7 @@ from mirascope.core.base.metadata import Metadata
 from mirascope.core.base.stream import BaseStream
 from mirascope.core.base.structured_stream import BaseStructuredStream
 from mirascope.core.base.tool import BaseTool
+from mirascope.core.base.types import Timings
 from mirascope.integrations.logfire import _utils
 
 
@@ -54,6 +55,7 @@ def test_logfire_custom_context_manager(mock_logfire: MagicMock) -> None:
 
 def test_get_call_response_span_data() -> None:
     call_response = MagicMock()
+    call_response.timings = None
     result = _utils._get_call_response_span_data(call_response)
     assert result["async"] is False
     assert result["call_params"] == call_response.call_params
@@ -72,6 +74,18 @@ def test_get_call_response_span_data() -> None:
     }
 
 
+def test_get_call_response_span_data_timings() -> None:
+    call_response = MagicMock()
+    call_response.timings = Timings(request_sent=0, first_token=100, end=300)
+    call_response.output_tokens_per_second = 50.0
+    result = _utils._get_call_response_span_data(call_response)
+    assert result["output"]["timings"] == {
+        "time_to_first_token": 100,
+        "duration": 300,
+        "output_tokens_per_second": 50.0,
+    }
+
+
 def test_get_tool_calls() -> None:
     call_response = MyCallResponse(
         metadata={"tags": {"version:0001"}},
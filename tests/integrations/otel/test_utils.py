@@ -11,6 +11,7 @@ from mirascope.core.base.call_response import BaseCallResponse
 from mirascope.core.base.stream import BaseStream
 from mirascope.core.base.structured_stream import BaseStructuredStream
 from mirascope.core.base.tool import BaseTool
+from mirascope.core.base.types import Timings
 from mirascope.integrations.otel import _utils
 
 
@@ -155,6 +156,26 @@ def test_get_call_response_attributes() -> None:
     )
 
 
+def test_get_call_response_attributes_timings() -> None:
+    """Tests that the call's timings are added to the attributes."""
+    call_response = MagicMock()
+    call_response.timings = Timings(request_sent=0, first_byte=50, end=200)
+    call_response.output_tokens_per_second = None
+    assert _utils._get_timing_attributes(call_response) == {
+        "gen_ai.timings.time_to_first_byte": 50,
+        "gen_ai.timings.duration": 200,
+    }
+    call_response.output_tokens_per_second = 10.0
+    assert (
+        _utils._get_timing_attributes(call_response)[
+            "gen_ai.timings.output_tokens_per_second"
+        ]
+        == 10.0
+    )
+    call_response.timings = None
+    assert _utils._get_timing_attributes(call_response) == {}
+
+
 def test_set_call_response_event_attributes() -> None:
     """Tests the `_set_call_response_event_attributes` function."""
     result = MagicMock()
@@ -18,6 +18,8 @@ from mirascope.core.base import (
 from mirascope.core.base._utils import BaseMessageParamConverter
 from mirascope.core.base.types import CostMetadata, FinishReason
 from mirascope.llm._call import (
+    _DECORATED_CACHE_SIZE,
+    _freeze,
     _get_local_provider_call,
     _get_provider_call,
     _wrap_result,
@@ -583,3 +585,56 @@ async def test_context_in_async_function_with_gather():
         assert captured_args_list[1]["model"] == "claude-3-5-sonnet", (
             "Context model override was not applied when using asyncio.gather"
         )
+
+
+def test_freeze():
+    """Tests that `_freeze` returns hashable fingerprints."""
+    assert _freeze({"a": [1, {"b": 2}]}) == _freeze({"a": [1, {"b": 2}]})
+    assert _freeze({"a": [1]}) != _freeze({"a": [2]})
+    assert _freeze({"a": 1}) != _freeze({"a": True})
+    assert _freeze({"a": [1.0]}) != _freeze({"a": (1.0,)})
+    unhashable = bytearray(b"data")
+    assert _freeze(unhashable) == ("__id__", id(unhashable))
+    hash(_freeze({"call_params": {"stop": ["\n"]}, "client": unhashable}))
+
+
+def test_call_caches_decorated_fn():
+    """Tests that the provider decorated function is built once per call args."""
+    provider_calls = []
+
+    def dummy_provider_call(**call_kwargs):
+        provider_calls.append(call_kwargs)
+
+        def wrapper(fn):
+            def inner(*args, **kwargs):
+                return call_kwargs["model"]
+
+            return inner
+
+        return wrapper
+
+    with patch(
+        "mirascope.llm._call._get_provider_call", return_value=dummy_provider_call
+    ) as mock_get_provider_call:
+
+        @call(provider="openai", model="gpt-4o-mini", call_params={"stop": ["\n"]})
+        def dummy_function(): ...
+
+        assert dummy_function() == "gpt-4o-mini"
+        assert dummy_function() == "gpt-4o-mini"
+        assert len(provider_calls) == 1
+        assert mock_get_provider_call.call_count == 1
+
+        with context(provider="openai", model="gpt-4o"):
+            assert dummy_function() == "gpt-4o"
+            assert dummy_function() == "gpt-4o"
+        assert len(provider_calls) == 2
+
+        assert dummy_function() == "gpt-4o-mini"
+        assert len(provider_calls) == 2
+
+        for i in range(_DECORATED_CACHE_SIZE):
+            with context(provider="openai", model=f"model-{i}"):
+                dummy_function()
+        assert dummy_function() == "gpt-4o-mini"
+        assert len(provider_calls) == _DECORATED_CACHE_SIZE + 3
@@ -256,3 +256,33 @@ async def test_tool_returns_none_when_no_tools(dummy_call_response_instance):
         assert dummy_call_response_instance.tool is None, (
             "Expected None when _response.common_tools is None"
         )
+
+
+def test_call_response_lazy_messages(dummy_call_response_instance):
+    """Tests that the provider-agnostic messages are converted once on access."""
+    response = dummy_call_response_instance._response
+    with patch.object(
+        DummyMessageParamConverter,
+        "from_provider",
+        wraps=DummyMessageParamConverter.from_provider,
+    ) as mock_from_provider:
+        call_response = CallResponse(response=response)  # pyright: ignore [reportAbstractUsage]
+        mock_from_provider.assert_not_called()
+        assert call_response.messages == [
+            BaseMessageParam(role="assistant", content="message")
+        ]
+        assert call_response.common_messages is call_response.messages
+        mock_from_provider.assert_called_once()
+
+    call_response = CallResponse(response=response)  # pyright: ignore [reportAbstractUsage]
+    fields = call_response.__dict__
+    assert fields["messages"] == [BaseMessageParam(role="assistant", content="message")]
+    assert fields["user_message_param"] == BaseMessageParam(
+        role="user", content="common_user_message"
+    )
+
+
+def test_call_response_local_names():
+    """Tests that the names resolved on the wrapper itself are precomputed."""
+    assert {"_response", "tools", "tool", "usage"} <= CallResponse._local_names
+    assert "content" not in CallResponse._local_names
@@ -12,3 +12,4 @@ def test_response_metaclass():
 
     test_instance = TestClass()
     assert test_instance.value_y == 2
+    assert TestClass._local_names == frozenset({"value_y"})  # pyright: ignore [reportAttributeAccessIssue]
@@ -0,0 +1,96 @@
+"""Benchmarks the cold-start import time of `mirascope`."""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+# The lazy import takes ~0.4s (mostly `pydantic`) while eagerly importing even two
+# provider SDKs takes over 1s, so the budget catches eager imports creeping back in.
+# Loosen it on slow CI machines with e.g. `MIRASCOPE_IMPORT_BUDGET_SECONDS=3`
+IMPORT_BUDGET_SECONDS = float(os.environ.get("MIRASCOPE_IMPORT_BUDGET_SECONDS", "1"))
+
+LAZY_MODULES = [
+    "anthropic",
+    "azure.ai.inference",
+    "cohere",
+    "google.genai",
+    "google.generativeai",
+    "groq",
+    "litellm",
+    "mistralai",
+    "openai",
+    "vertexai",
+    "mirascope.core.openai",
+    "mirascope.integrations",
+    "mirascope.llm._override",
+    "mirascope.retries",
+]
+
+_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import mirascope, mirascope.core, mirascope.llm
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "elapsed": elapsed,
+    "loaded": [name for name in json.loads(sys.argv[1]) if name in sys.modules],
+}))
+"""
+
+
+def _import_mirascope() -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", _SCRIPT, json.dumps(LAZY_MODULES)],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.filterwarnings("ignore")
+def test_import_time() -> None:
+    """Tests that importing `mirascope` stays within budget and loads no provider SDKs."""
+    result = _import_mirascope()
+    assert result["loaded"] == []
+    assert result["elapsed"] < IMPORT_BUDGET_SECONDS, (
+        f"Importing mirascope took {result['elapsed']:.2f}s "
+        f"(budget {IMPORT_BUDGET_SECONDS:.2f}s)"
+    )
+
+
+def test_lazy_provider_access() -> None:
+    """Tests that lazily loaded modules are still accessible as attributes."""
+    import mirascope
+    import mirascope.core
+    import mirascope.llm
+
+    assert mirascope.core.openai.openai_call is not None
+    assert mirascope.llm.override is not None
+    assert mirascope.retries is not None
+    assert "openai" in dir(mirascope.core)
+    assert "retries" in dir(mirascope)
+    with pytest.raises(AttributeError):
+        mirascope.core.not_a_provider  # noqa: B018
+    with pytest.raises(AttributeError):
+        mirascope.not_a_module  # noqa: B018
+    with pytest.raises(AttributeError):
+        mirascope.llm.not_an_attribute  # noqa: B018
+
+
+def test_lazy_uninstalled_module(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that lazily loaded modules that fail to import are missing attributes."""
+    import mirascope
+    import mirascope.core
+
+    def import_module(name: str, package: str | None = None) -> None:
+        raise ImportError(name)
+
+    monkeypatch.delitem(mirascope.core.__dict__, "groq", raising=False)
+    monkeypatch.delitem(mirascope.__dict__, "integrations", raising=False)
+    monkeypatch.setattr("importlib.import_module", import_module)
+    assert not hasattr(mirascope.core, "groq")
+    assert not hasattr(mirascope, "integrations")